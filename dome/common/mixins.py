@@ -1,10 +1,12 @@
 from typing import Any, ClassVar, Iterable, Self
 
 from django.core.paginator import Page
-from django.db.models import F
+from django.db.models import F, QuerySet
 from django.utils.datastructures import MultiValueDict
 from django_filters.filterset import FilterSet
 
+from dome.common.pagination import CursorPage, CursorPaginator
+
 
 class DynamicOrderingMixin:
     """
@@ -82,3 +84,23 @@ class ElidedPaginationMixin:
         )
         context["page_obj"] = page_object
         return context
+
+
+class CursorPaginationMixin:
+    """
+    Replaces the offset pagination of a list view with keyset pagination (see `CursorPaginator`),
+    following the ordering returned by `get_ordering` (e.g. from `DynamicOrderingMixin`).
+
+    Use with `{% include "partials/cursor_pagination.html" %}`.
+    """
+
+    cursor_query_param = "cursor"
+    # Used when the view has no ordering
+    cursor_default_ordering = "pk"
+
+    def paginate_queryset(
+        self: Self, queryset: QuerySet, page_size: int
+    ) -> tuple[CursorPaginator, CursorPage, Any, bool]:
+        paginator = CursorPaginator(queryset, page_size, ordering=self.get_ordering() or self.cursor_default_ordering)
+        page = paginator.get_page(self.request.GET.get(self.cursor_query_param))
+        return (paginator, page, page.object_list, page.has_other_pages())
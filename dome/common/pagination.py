@@ -0,0 +1,191 @@
+import base64
+import binascii
+import hashlib
+import json
+import math
+from functools import cached_property
+from typing import Any, Iterator, NamedTuple, Self
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import F, Model, Q, QuerySet
+from django.db.models.expressions import OrderBy
+
+
+class CursorPosition(NamedTuple):
+    value: Any
+    pk: Any
+    # Whether the page is before the position instead of after it
+    backwards: bool
+    # Number of the page the cursor leads to, only used for display
+    page_number: int
+
+
+class CursorPage:
+    """
+    Page of a `CursorPaginator`, mimics the interface of Django's `Page` used by the templates.
+    """
+
+    def __init__(
+        self: Self,
+        object_list: list[Model],
+        number: int,
+        paginator: "CursorPaginator",
+        next_cursor: str | None,
+        previous_cursor: str | None,
+    ) -> None:
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self: Self) -> str:
+        return f"<Cursor page {self.number}>"
+
+    def __len__(self: Self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self: Self) -> Iterator[Model]:
+        return iter(self.object_list)
+
+    def __getitem__(self: Self, index: int | slice) -> Any:
+        return self.object_list[index]
+
+    def has_next(self: Self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self: Self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self: Self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    def start_index(self: Self) -> int:
+        if not self.object_list:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+
+class CursorPaginator:
+    """
+    Keyset paginator that fetches a page by filtering on the sort key of the last row seen
+    instead of using `OFFSET`, so every page costs the same no matter how deep it is.
+
+    The rows are ordered by `ordering` (a field name, optionally prefixed with `-`)
+    and the primary key as a tie-breaker. Null values are placed the same way as in `DynamicOrderingMixin`:
+    first when ascending, last when descending.
+
+    The total count is cached for a short time, so it is only approximate.
+    """
+
+    COUNT_CACHE_TIMEOUT = 60
+
+    def __init__(self: Self, queryset: QuerySet, per_page: int, ordering: str = "pk") -> None:
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.descending = ordering.startswith("-")
+        self.field_name = ordering.lstrip("-")
+
+        opts = queryset.model._meta
+        self.pk_field = opts.pk
+        self.field = self.pk_field if self.field_name == "pk" else opts.get_field(self.field_name)
+
+    @property
+    def orders_by_pk(self: Self) -> bool:
+        return self.field == self.pk_field
+
+    @cached_property
+    def count(self: Self) -> int:
+        queryset = self.queryset.order_by()
+        query_hash = hashlib.sha256(str(queryset.query).encode()).hexdigest()
+        return cache.get_or_set(f"cursor-paginator-count:{query_hash}", queryset.count, self.COUNT_CACHE_TIMEOUT)
+
+    @property
+    def num_pages(self: Self) -> int:
+        return max(math.ceil(self.count / self.per_page), 1)
+
+    def encode_cursor(self: Self, obj: Model, backwards: bool, page_number: int) -> str:
+        value = None
+        if not self.orders_by_pk and getattr(obj, self.field.attname) is not None:
+            # Keeps the full precision of the value (e.g. microseconds of datetimes)
+            value = self.field.value_to_string(obj)
+
+        payload = json.dumps([value, obj.pk, backwards, page_number])
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self: Self, cursor: str) -> CursorPosition | None:
+        """
+        Return `None` if the cursor is malformed, which leads to the first page.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            value, pk, backwards, page_number = json.loads(payload)
+            if value is not None:
+                value = self.field.to_python(value)
+            return CursorPosition(value, self.pk_field.to_python(pk), bool(backwards), max(int(page_number), 1))
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            return None
+
+    def _get_order_by(self: Self, descending: bool) -> list[OrderBy]:
+        pk_order = F("pk").desc() if descending else F("pk").asc()
+        if self.orders_by_pk:
+            return [pk_order]
+
+        field_order = (
+            F(self.field_name).desc(nulls_last=True) if descending else F(self.field_name).asc(nulls_first=True)
+        )
+        return [field_order, pk_order]
+
+    def _get_after_filter(self: Self, position: CursorPosition, descending: bool) -> Q:
+        """
+        Match the rows placed after `position` in the given direction.
+        """
+        lookup = "lt" if descending else "gt"
+        pk_after = Q(**{f"pk__{lookup}": position.pk})
+        if self.orders_by_pk:
+            return pk_after
+
+        field_name = self.field_name
+        if position.value is None:
+            # Nulls are first when ascending and last when descending
+            after = Q(**{f"{field_name}__isnull": True}) & pk_after
+            if not descending:
+                after |= Q(**{f"{field_name}__isnull": False})
+            return after
+
+        after = Q(**{f"{field_name}__{lookup}": position.value}) | (Q(**{field_name: position.value}) & pk_after)
+        if descending:
+            after |= Q(**{f"{field_name}__isnull": True})
+        return after
+
+    def get_page(self: Self, cursor: str | None) -> CursorPage:
+        position = self.decode_cursor(cursor) if cursor else None
+        # Pages before the position are fetched in the reverse order
+        descending = self.descending != (position is not None and position.backwards)
+
+        queryset = self.queryset.order_by(*self._get_order_by(descending))
+        if position is not None:
+            queryset = queryset.filter(self._get_after_filter(position, descending))
+
+        # One extra row tells whether there is another page in the direction of the query
+        object_list = list(queryset[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if position is None:
+            number, has_next, has_previous = 1, has_more, False
+        elif position.backwards:
+            object_list.reverse()
+            number, has_next, has_previous = position.page_number if has_more else 1, True, has_more
+        else:
+            number, has_next, has_previous = position.page_number, has_more, True
+
+        next_cursor = previous_cursor = None
+        if object_list:
+            if has_next:
+                next_cursor = self.encode_cursor(object_list[-1], backwards=False, page_number=number + 1)
+            if has_previous:
+                previous_cursor = self.encode_cursor(object_list[0], backwards=True, page_number=number - 1)
+
+        return CursorPage(object_list, number, self, next_cursor, previous_cursor)
@@ -0,0 +1,141 @@
+import functools
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, NamedTuple, Self
+
+from django.conf import settings
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+from django.template.base import Template
+from django.utils.module_loading import import_string
+
+
+class QueryRecord(NamedTuple):
+    sql: str
+    duration: float
+
+
+class RequestMetrics:
+    """
+    Database, template and cache usage collected while handling a request, durations are in seconds.
+    """
+
+    def __init__(self: Self) -> None:
+        self.queries: list[QueryRecord] = []
+        self.template_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Templates rendered inside another template (e.g. `{% include %}`) are not timed again
+        self._template_depth = 0
+
+    @property
+    def query_count(self: Self) -> int:
+        return len(self.queries)
+
+    @property
+    def query_time(self: Self) -> float:
+        return sum(query.duration for query in self.queries)
+
+    def __call__(self: Self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+        """
+        Database execute wrapper, see `connection.execute_wrapper`.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(QueryRecord(sql, time.perf_counter() - start))
+
+
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+@contextmanager
+def collect_metrics() -> Iterator[RequestMetrics]:
+    """
+    Collect the metrics of everything run inside the block.
+
+    Nested blocks share the metrics of the outermost block.
+    """
+    if (metrics := _current_metrics.get()) is not None:
+        yield metrics
+        return
+
+    install_instrumentation()
+
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def _instrument_template_render(render: Callable) -> Callable:
+    @functools.wraps(render)
+    def instrumented_render(template: Template, *args: Any, **kwargs: Any) -> Any:
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return render(template, *args, **kwargs)
+
+        metrics._template_depth += 1
+        start = time.perf_counter()
+        try:
+            return render(template, *args, **kwargs)
+        finally:
+            metrics._template_depth -= 1
+            if not metrics._template_depth:
+                metrics.template_time += time.perf_counter() - start
+
+    return instrumented_render
+
+
+_MISSING = object()
+
+
+def _instrument_cache_get(get: Callable) -> Callable:
+    @functools.wraps(get)
+    def instrumented_get(cache: BaseCache, key: str, default: Any = None, version: int | None = None) -> Any:
+        value = get(cache, key, _MISSING, version=version)
+        if (metrics := _current_metrics.get()) is not None:
+            if value is _MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+        return default if value is _MISSING else value
+
+    return instrumented_get
+
+
+def _instrument_cache_get_many(get_many: Callable) -> Callable:
+    @functools.wraps(get_many)
+    def instrumented_get_many(cache: BaseCache, keys: list[str], version: int | None = None) -> dict[str, Any]:
+        keys = list(keys)
+        values = get_many(cache, keys, version=version)
+        if (metrics := _current_metrics.get()) is not None:
+            metrics.cache_hits += len(values)
+            metrics.cache_misses += len(keys) - len(values)
+        return values
+
+    return instrumented_get_many
+
+
+@functools.cache
+def install_instrumentation() -> None:
+    """
+    Wrap template rendering and the reads of the configured cache backends, once per process.
+
+    Django has no hooks for these, the wrappers only record anything inside `collect_metrics`.
+    """
+    Template.render = _instrument_template_render(Template.render)
+
+    backend_classes = {import_string(cache_settings["BACKEND"]) for cache_settings in settings.CACHES.values()}
+    for backend_class in backend_classes:
+        backend_class.get = _instrument_cache_get(backend_class.get)
+        # The default `get_many` calls `get` for each key
+        if backend_class.get_many is not BaseCache.get_many:
+            backend_class.get_many = _instrument_cache_get_many(backend_class.get_many)
@@ -0,0 +1,104 @@
+import os
+from typing import Any, Callable, Iterator, Self
+
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Sum
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily, SummaryMetricFamily
+from prometheus_client.registry import REGISTRY, Collector
+from requests import Response
+
+from integrations.models import ImportJob
+
+# With multiple processes (e.g. gunicorn workers) the metrics are written to files in this directory,
+# see https://prometheus.github.io/client_python/multiprocess/
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+REQUEST_DURATION = Histogram(
+    "dome_request_duration_seconds",
+    "Time until the view returned the response.",
+    ["view", "method"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "dome_request_db_queries",
+    "Number of database queries of a request.",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+CACHE_READS = Counter(
+    "dome_cache_reads_total",
+    "Number of keys read from the cache during requests, by result (hit or miss).",
+    ["result"],
+)
+EXTERNAL_API_REQUEST_DURATION = Histogram(
+    "dome_external_api_request_duration_seconds",
+    "Time until the response headers of the external API were received.",
+    ["provider", "status_code"],
+)
+EXPORT_DURATION = Histogram(
+    "dome_export_duration_seconds",
+    "Time to stream a tracking data export.",
+    ["exporter"],
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+
+def external_api_response_hook(provider: str) -> Callable[..., None]:
+    """
+    `requests` response hook that records the latency of the API of the provider.
+    """
+
+    def hook(response: Response, *args: Any, **kwargs: Any) -> None:
+        # Responses served from the response cache did not reach the provider
+        if getattr(response, "from_cache", False):
+            return
+
+        EXTERNAL_API_REQUEST_DURATION.labels(provider, response.status_code).observe(response.elapsed.total_seconds())
+
+    return hook
+
+
+class ImportJobCollector(Collector):
+    """
+    Import jobs by importer and status, with the duration of the finished ones.
+
+    Read from the database when scraped, so the jobs of all worker processes are included.
+    """
+
+    def collect(self: Self) -> Iterator[GaugeMetricFamily | SummaryMetricFamily]:
+        jobs = GaugeMetricFamily("dome_import_jobs", "Number of import jobs.", labels=["importer", "status"])
+        for row in ImportJob.objects.order_by().values("importer_name", "status").annotate(count=Count("pk")):
+            jobs.add_metric([row["importer_name"], ImportJob.Status(row["status"]).label], row["count"])
+        yield jobs
+
+        summary = SummaryMetricFamily(
+            "dome_import_job_duration_seconds", "Duration of the finished import jobs.", labels=["importer"]
+        )
+        finished_jobs = (
+            ImportJob.objects.filter(started_at__isnull=False, finished_at__isnull=False)
+            .order_by()
+            .values("importer_name")
+            .annotate(
+                count=Count("pk"),
+                duration=Sum(ExpressionWrapper(F("finished_at") - F("started_at"), output_field=DurationField())),
+            )
+        )
+        for row in finished_jobs:
+            summary.add_metric([row["importer_name"]], row["count"], row["duration"].total_seconds())
+        yield summary
+
+
+_database_registry = CollectorRegistry()
+_database_registry.register(ImportJobCollector())
+
+
+def generate_metrics() -> bytes:
+    """
+    All metrics in the Prometheus text format, aggregated from all processes in the multiprocess mode.
+    """
+    if os.environ.get(MULTIPROCESS_DIR_ENV):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry) + generate_latest(_database_registry)
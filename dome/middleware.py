@@ -0,0 +1,99 @@
+import logging
+import time
+from typing import Callable, Self
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from dome.instrumentation import RequestMetrics, collect_metrics
+from dome.metrics import CACHE_READS, REQUEST_DB_QUERIES, REQUEST_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimingMiddleware:
+    """
+    Measure the database, template and cache usage of each request,
+    report it in the `Server-Timing` header and log it.
+
+    Requests slower than `SLOW_REQUEST_THRESHOLD_MS` also log all their queries.
+    Only the time until the view returns is measured, not streaming the response.
+    """
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.REQUEST_TIMING_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        start = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        response["Server-Timing"] = self.get_server_timing(metrics, duration)
+        self.log_request(request, response, metrics, duration)
+        return response
+
+    def get_server_timing(self: Self, metrics: RequestMetrics, duration: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={metrics.query_time * 1000:.1f};desc="{metrics.query_count} queries"',
+                f"tpl;dur={metrics.template_time * 1000:.1f}",
+                f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+                f"total;dur={duration * 1000:.1f}",
+            ]
+        )
+
+    def log_request(
+        self: Self, request: HttpRequest, response: HttpResponse, metrics: RequestMetrics, duration: float
+    ) -> None:
+        extra = {
+            "method": request.method,
+            "path": request.path,
+            "status_code": response.status_code,
+            "duration_ms": round(duration * 1000, 1),
+            "db_queries": metrics.query_count,
+            "db_time_ms": round(metrics.query_time * 1000, 1),
+            "template_time_ms": round(metrics.template_time * 1000, 1),
+            "cache_hits": metrics.cache_hits,
+            "cache_misses": metrics.cache_misses,
+        }
+
+        if duration * 1000 < settings.SLOW_REQUEST_THRESHOLD_MS:
+            logger.info("Request finished", extra=extra)
+            return
+
+        queries = [f"({query.duration * 1000:.1f} ms) {query.sql}" for query in metrics.queries]
+        logger.warning("Slow request finished", extra={**extra, "queries": queries})
+
+
+class PrometheusMetricsMiddleware:
+    """
+    Record the latency, database queries and cache reads of each request for the `/metrics` endpoint.
+
+    Requests are labelled by the name of their URL pattern, so the number of series stays bounded.
+    """
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        start = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        view_name = request.resolver_match.view_name if request.resolver_match else "unresolved"
+        if view_name != "metrics":
+            REQUEST_DURATION.labels(view_name, request.method).observe(duration)
+            REQUEST_DB_QUERIES.labels(view_name).observe(metrics.query_count)
+            CACHE_READS.labels("hit").inc(metrics.cache_hits)
+            CACHE_READS.labels("miss").inc(metrics.cache_misses)
+
+        return response
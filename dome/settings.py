@@ -45,6 +45,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "dome.middleware.RequestTimingMiddleware",
+    "dome.middleware.PrometheusMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -85,6 +87,22 @@ if SENTRY_DSN := get_env_str("SENTRY_DSN"):
         send_default_pii=True,
     )
 
+# Request timing #
+# Server-Timing header and a log line with the database, template and cache usage of every request
+
+REQUEST_TIMING_ENABLED = get_env_bool("DJANGO_REQUEST_TIMING_ENABLED", False)
+
+# Requests slower than this also log all their queries
+SLOW_REQUEST_THRESHOLD_MS = get_env_int("DJANGO_SLOW_REQUEST_THRESHOLD_MS", 1000)
+
+# Metrics #
+# Prometheus metrics served at /metrics, set `PROMETHEUS_MULTIPROC_DIR` when running multiple processes
+
+METRICS_ENABLED = get_env_bool("DJANGO_METRICS_ENABLED", False)
+
+# Bearer token required to read the metrics, if set
+METRICS_TOKEN = get_env_str("DJANGO_METRICS_TOKEN")
+
 # Logging #
 # https://docs.djangoproject.com/en/4.2/howto/logging/
 
@@ -165,6 +183,18 @@ CACHES = {
     }
 }
 
+# The local memory cache is not shared between processes (e.g. gunicorn and import workers),
+# use a directory shared by all of them in production
+if CACHE_DIR := get_env_str("DJANGO_CACHE_DIR"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": CACHE_DIR,
+    }
+
+# Data derived from the users' libraries (e.g. the rendered dashboards) is only cached in a cache shared by all
+# processes, the version bumped by the process that changed a library would not invalidate the other processes' copies
+LIBRARY_CACHE_ENABLED = bool(CACHE_DIR)
+
 
 # Authentication #
 
@@ -259,3 +289,15 @@ TMDB_API_KEY = get_env_str("TMDB_API_KEY")
 
 IGDB_API_CLIENT_ID = get_env_str("IGDB_API_CLIENT_ID")
 IGDB_API_CLIENT_SECRET = get_env_str("IGDB_API_CLIENT_SECRET")
+
+# External API response cache #
+# SQLite database of the TMDB and IGDB responses, disabled if the path is empty.
+# Also keeps the rate limits of the APIs shared by all processes, otherwise each process is limited separately
+
+EXTERNAL_API_CACHE_PATH = get_env_str("DJANGO_EXTERNAL_API_CACHE_PATH")
+
+# Seconds until a cached response is revalidated
+EXTERNAL_API_CACHE_TTL = get_env_int("DJANGO_EXTERNAL_API_CACHE_TTL", 7 * 24 * 60 * 60)
+
+# Bytes of cached responses kept, the least recently used are evicted first
+EXTERNAL_API_CACHE_MAX_SIZE = get_env_int("DJANGO_EXTERNAL_API_CACHE_MAX_SIZE", 256 * 1024 * 1024)
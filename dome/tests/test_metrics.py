@@ -0,0 +1,55 @@
+from datetime import timedelta
+from typing import Self
+
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from dome.common.tests import AuthenticatedTestCase
+from integrations.models import ImportJob
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_TOKEN=None)
+class MetricsViewTestCase(AuthenticatedTestCase):
+    """Tests for the Prometheus metrics endpoint."""
+
+    def test_request_metrics_by_url_name(self: Self) -> None:
+        self.client.get(reverse("tracking:dashboard", kwargs={"username": self.user.username}))
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode()
+        self.assertIn('dome_request_duration_seconds_count{method="GET",view="tracking:dashboard"}', content)
+        self.assertIn('dome_request_db_queries_count{view="tracking:dashboard"}', content)
+        self.assertIn('dome_cache_reads_total{result="miss"}', content)
+        self.assertNotIn('view="metrics"', content)
+
+    def test_import_job_metrics(self: Self) -> None:
+        now = timezone.now()
+        ImportJob.objects.create(
+            user=self.user,
+            importer_name="goodreads_csv",
+            status=ImportJob.Status.COMPLETED,
+            started_at=now - timedelta(seconds=30),
+            finished_at=now,
+        )
+        ImportJob.objects.create(user=self.user, importer_name="goodreads_csv")
+
+        content = self.client.get(reverse("metrics")).content.decode()
+
+        self.assertIn('dome_import_jobs{importer="goodreads_csv",status="Completed"} 1.0', content)
+        self.assertIn('dome_import_jobs{importer="goodreads_csv",status="Queued"} 1.0', content)
+        self.assertIn('dome_import_job_duration_seconds_count{importer="goodreads_csv"} 1.0', content)
+        self.assertIn('dome_import_job_duration_seconds_sum{importer="goodreads_csv"} 30.0', content)
+
+    @override_settings(METRICS_TOKEN="secret")  # noqa: S106
+    def test_token_required(self: Self) -> None:
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+
+        response = self.client.get(reverse("metrics"), headers={"Authorization": "Bearer secret"})
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled(self: Self) -> None:
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
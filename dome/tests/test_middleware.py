@@ -0,0 +1,77 @@
+from typing import Self
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from dome.common.tests import AuthenticatedTestCase
+from dome.instrumentation import collect_metrics
+from entities.models import Movie
+
+
+@override_settings(REQUEST_TIMING_ENABLED=True, SLOW_REQUEST_THRESHOLD_MS=1000, LIBRARY_CACHE_ENABLED=True)
+class RequestTimingMiddlewareTestCase(AuthenticatedTestCase):
+    """Tests for the Server-Timing header and the request log."""
+
+    def setUp(self: Self) -> None:
+        cache.clear()
+        self.url = reverse("tracking:dashboard", kwargs={"username": self.user.username})
+
+    def test_server_timing_header(self: Self) -> None:
+        response = self.client.get(self.url)
+
+        server_timing = response["Server-Timing"]
+        self.assertRegex(server_timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(server_timing, r"tpl;dur=[\d.]+")
+        self.assertRegex(server_timing, r'cache;desc="\d+ hits, \d+ misses"')
+        self.assertRegex(server_timing, r"total;dur=[\d.]+")
+
+    def test_request_logged(self: Self) -> None:
+        with self.assertLogs("dome.middleware", level="INFO") as logs:
+            self.client.get(self.url)
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "Request finished")
+        self.assertEqual(record.path, self.url)
+        self.assertEqual(record.status_code, 200)
+        self.assertGreater(record.db_queries, 0)
+        self.assertGreater(record.template_time_ms, 0)
+        # The dashboard fragment and the library version are not cached yet
+        self.assertGreater(record.cache_misses, 0)
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0)
+    def test_slow_request_logs_queries(self: Self) -> None:
+        with self.assertLogs("dome.middleware", level="WARNING") as logs:
+            self.client.get(self.url)
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "Slow request finished")
+        self.assertEqual(len(record.queries), record.db_queries)
+        self.assertIn("SELECT", record.queries[0])
+
+    @override_settings(REQUEST_TIMING_ENABLED=False)
+    def test_disabled(self: Self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertNotIn("Server-Timing", response)
+
+
+class CollectMetricsTestCase(TestCase):
+    def test_counts_queries_and_cache_reads(self: Self) -> None:
+        cache.set("cached-key", 1)
+
+        with collect_metrics() as metrics:
+            Movie.objects.count()
+            cache.get("cached-key")
+            cache.get("missing-key")
+            cache.get_or_set("other-key", 2)
+
+        self.assertGreater(metrics.query_count, 0)
+        # `get_or_set` reads the key again after setting it
+        self.assertEqual(metrics.cache_hits, 2)
+        self.assertEqual(metrics.cache_misses, 2)
+        # Nothing is collected outside of the block
+        query_count = metrics.query_count
+        Movie.objects.count()
+        cache.get("cached-key")
+        self.assertEqual((metrics.query_count, metrics.cache_hits), (query_count, 2))
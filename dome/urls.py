@@ -5,13 +5,14 @@ from django.urls import include, path
 from django.views.defaults import page_not_found
 from django.views.generic import TemplateView
 
-from dome.views import IndexView, ManifestView
+from dome.views import IndexView, ManifestView, MetricsView
 
 urlpatterns = [
     *[
         path("admin/", admin.site.urls),
         path("", IndexView.as_view(), name="index"),
         path("manifest.json", ManifestView.as_view(), name="manifest"),
+        path("metrics", MetricsView.as_view(), name="metrics"),
         path("robots.txt", TemplateView.as_view(template_name="robots.txt", content_type="text/plain"), name="robots"),
         path("", include("users.urls")),
         path("entities/", include("entities.urls")),
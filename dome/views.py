@@ -1,9 +1,14 @@
 from typing import Any
 
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.templatetags.static import static
 from django.urls import reverse_lazy
+from django.utils.crypto import constant_time_compare
 from django.views.generic import RedirectView, View
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from dome.metrics import generate_metrics
 
 
 class IndexView(RedirectView):
@@ -33,3 +38,20 @@ class ManifestView(View):
         }
 
         return JsonResponse(data)
+
+
+class MetricsView(View):
+    """
+    Metrics in the Prometheus text format, only available if enabled in the settings.
+    """
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not settings.METRICS_ENABLED:
+            raise Http404
+
+        if settings.METRICS_TOKEN and not constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+        ):
+            return HttpResponse(status=401)
+
+        return HttpResponse(generate_metrics(), content_type=CONTENT_TYPE_LATEST)
@@ -1,11 +1,15 @@
 import datetime
-from typing import ClassVar, Self
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, ClassVar, Self
 
 from django.contrib import admin, messages
 from django.core.files import File
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import path
 from django.urls.resolvers import URLPattern
 from django.utils.safestring import mark_safe
@@ -27,6 +31,18 @@ from entities.models import (
 from integrations.external.igdb import igdb_client
 from integrations.external.tmdb import TMDBSupportedEntityType, tmdb_client
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of entities fetched concurrently from each provider by the bulk fill
+FILL_PROVIDER_CONCURRENCY = {"tmdb": 8, "igdb": 4}
+
+# Number of filled entities saved in a single transaction by the bulk fill
+FILL_BATCH_SIZE = 50
+
+_fill_provider_semaphores = {
+    provider: threading.BoundedSemaphore(concurrency) for provider, concurrency in FILL_PROVIDER_CONCURRENCY.items()
+}
+
 
 class MovieInline(admin.TabularInline):
     model = Movie.tags.through
@@ -123,6 +139,9 @@ class EntityBaseAdmin(admin.ModelAdmin):
 
     actions = ("fill_automagically_action",)
 
+    # External provider of the data filled automagically, see `FILL_PROVIDER_CONCURRENCY`
+    fill_provider: ClassVar[str | None] = None
+
     def redirect_to_change_view(self: Self, object_id: int) -> HttpResponse:
         """
         Redirect to change view (details) of the entity.
@@ -152,200 +171,286 @@ class EntityBaseAdmin(admin.ModelAdmin):
         ]
         return custom_urls + default_urls
 
-    def _fill_automagically(self: Self, request: HttpRequest, object_id: int) -> None:
+    def fetch_fill_data(self: Self, entity: EntityBase) -> dict[str, Any] | None:
         """
-        Fill entity data using entity-specific approach (usually external API call).
+        Fetch the entity data from the external provider, `None` if nothing was found.
 
-        Save the entity after filling the data.
+        Only does network calls (including storing the cover image, which is not saved to the entity yet)
+        and no database queries, so it can run in a thread.
         """
         raise NotImplementedError
 
+    def apply_fill_data(self: Self, request: HttpRequest, entity: EntityBase, data: dict[str, Any]) -> None:
+        """
+        Fill the empty fields of the entity with the fetched data and save it.
+        """
+        raise NotImplementedError
+
+    def _fill_automagically(self: Self, request: HttpRequest, entity: EntityBase) -> bool:
+        """
+        Fill entity data using entity-specific approach (usually external API call).
+
+        Return whether any data was found.
+        """
+        data = self.fetch_fill_data(entity)
+        if data is None:
+            return False
+
+        self.apply_fill_data(request, entity, data)
+        return True
+
+    def _run_concurrently(
+        self: Self, func: Callable[[EntityBase], dict[str, Any] | None], entities: list[EntityBase]
+    ) -> dict[int, dict[str, Any] | Exception | None]:
+        """
+        Run the fetch for each entity in a thread pool,
+        with at most `FILL_PROVIDER_CONCURRENCY` concurrent fetches per provider (across all requests).
+        """
+        semaphore = _fill_provider_semaphores[self.fill_provider]
+
+        def fetch(entity: EntityBase) -> dict[str, Any] | None:
+            with semaphore:
+                return func(entity)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=FILL_PROVIDER_CONCURRENCY[self.fill_provider]) as executor:
+            futures = {executor.submit(fetch, entity): entity for entity in entities}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future].pk] = future.result()
+                except Exception as e:
+                    results[futures[future].pk] = e
+
+        return results
+
+    def fetch_fill_data_many(self: Self, entities: list[EntityBase]) -> dict[int, dict[str, Any] | Exception | None]:
+        """
+        Fetch the data of the entities for the bulk fill, by entity pk, with the exception if the fetch failed.
+        """
+        return self._run_concurrently(self.fetch_fill_data, entities)
+
     @admin.action(description="Fill automagically", permissions=["change"])
     def fill_automagically_action(self, request: HttpRequest, queryset: QuerySet[EntityBase]) -> None:
-        try:
-            for entity in queryset:
-                self._fill_automagically(request=request, object_id=entity.id)
-        except NotImplementedError:
+        if self.fill_provider is None:
             messages.add_message(request, messages.WARNING, "Cannot fill automagically for this entity type.")
-        else:
+            return
+
+        entities = list(queryset)
+        results = self.fetch_fill_data_many(entities)
+
+        filled = []
+        for i in range(0, len(entities), FILL_BATCH_SIZE):
+            with transaction.atomic():
+                for entity in entities[i : i + FILL_BATCH_SIZE]:
+                    data = results[entity.pk]
+                    if data is None:
+                        messages.add_message(request, messages.ERROR, f"{entity}: No data found.")
+                        continue
+
+                    if isinstance(data, Exception):
+                        logger.error("Failed to fetch entity data", exc_info=data, extra={"entity_id": entity.pk})
+                        messages.add_message(request, messages.ERROR, f"{entity}: {data!r}")
+                        continue
+
+                    try:
+                        # A failed entity does not roll back the rest of the batch
+                        with transaction.atomic():
+                            self.apply_fill_data(request, entity, data)
+                    except Exception as e:
+                        logger.exception("Failed to fill entity data", extra={"entity_id": entity.pk})
+                        messages.add_message(request, messages.ERROR, f"{entity}: {e!r}")
+                    else:
+                        filled.append(entity)
+
+        if filled:
             messages.add_message(
-                request, messages.SUCCESS, f"Data filled automagically for {queryset.count()} entities."
+                request,
+                messages.SUCCESS,
+                f"Data filled automagically for {len(filled)} entities: {', '.join(entity.name for entity in filled)}.",
             )
 
     def fill_automagically_view(self: Self, request: HttpRequest, object_id: int) -> HttpResponse:
+        entity = get_object_or_404(self.model, pk=object_id)
         try:
-            self._fill_automagically(request=request, object_id=object_id)
+            found = self._fill_automagically(request=request, entity=entity)
         except NotImplementedError:
             messages.add_message(request, messages.WARNING, "Cannot fill automagically for this entity type.")
         else:
-            messages.add_message(request, messages.SUCCESS, "Entity data filled automagically.")
+            if found:
+                messages.add_message(request, messages.SUCCESS, "Entity data filled automagically.")
+            else:
+                messages.add_message(
+                    request, messages.ERROR, f"No data found for this {self.model._meta.verbose_name}."
+                )
 
-        app_label = self.model._meta.app_label
-        model_name = self.model._meta.model_name
-        return redirect(f"admin:{app_label}_{model_name}_change", object_id)
+        return self.redirect_to_change_view(object_id)
 
 
 @admin.register(Movie)
 class MovieAdmin(EntityBaseAdmin):
-    def _fill_automagically(self, request: HttpRequest, object_id: int) -> None:
-        movie_entity_obj = Movie.objects.get(id=object_id)
+    fill_provider = "tmdb"
 
-        response = tmdb_client.search(TMDBSupportedEntityType.MOVIE, movie_entity_obj.name)
+    def fetch_fill_data(self, entity: Movie) -> dict[str, Any] | None:
+        response = tmdb_client.search(TMDBSupportedEntityType.MOVIE, entity.name)
         if len(response["results"]) < 1:
-            messages.add_message(request, messages.ERROR, "No data found for this movie.")
-            return
+            return None
 
         movie_id = response["results"][0]["id"]
         movie_details = tmdb_client.get_details(TMDBSupportedEntityType.MOVIE, movie_id)
 
-        if not movie_entity_obj.description:
-            movie_entity_obj.description = movie_details["overview"]
+        if not entity.image:
+            image_path = movie_details["poster_path"]
+            image_content = File(tmdb_client.get_image("w500", image_path))
+            entity.image.save(image_path, image_content, save=False)
 
-        if not movie_entity_obj.length:
-            movie_entity_obj.length = movie_details["runtime"]
+        return movie_details
 
-        if not movie_entity_obj.release_date:
-            movie_entity_obj.release_date = movie_details["release_date"]
+    def apply_fill_data(self, request: HttpRequest, entity: Movie, data: dict[str, Any]) -> None:
+        movie_details = data
 
-        if not movie_entity_obj.director:
-            movie_entity_obj.director = [
-                person["name"] for person in movie_details["credits"]["crew"] if person["job"] == "Director"
-            ]
+        if not entity.description:
+            entity.description = movie_details["overview"]
 
-        if not movie_entity_obj.cast:
-            movie_entity_obj.cast = [person["name"] for person in movie_details["credits"]["cast"][:8]]
+        if not entity.length:
+            entity.length = movie_details["runtime"]
 
-        if not movie_entity_obj.tags.exists():
-            tag_objs = []
-            for genre in movie_details["genres"]:
-                tag = MovieTag.objects.get_or_create_with_aliases(genre["name"])[0]
-                tag_objs.append(tag)
+        if not entity.release_date:
+            entity.release_date = movie_details["release_date"]
 
-            movie_entity_obj.tags.set(tag_objs)
+        if not entity.director:
+            entity.director = [
+                person["name"] for person in movie_details["credits"]["crew"] if person["job"] == "Director"
+            ]
 
-        if not movie_entity_obj.imdb_url:
-            movie_entity_obj.imdb_url = make_imdb_url(movie_details["imdb_id"])
+        if not entity.cast:
+            entity.cast = [person["name"] for person in movie_details["credits"]["cast"][:8]]
 
-        if not movie_entity_obj.image:
-            image_path = movie_details["poster_path"]
-            image_content = File(tmdb_client.get_image("w500", image_path))
-            movie_entity_obj.image.save(image_path, image_content, save=False)
+        if not entity.tags.exists():
+            tag_objs = MovieTag.objects.resolve_many(genre["name"] for genre in movie_details["genres"])
+            entity.tags.set(tag_objs.values())
 
-        movie_entity_obj.save()
+        if not entity.imdb_url:
+            entity.imdb_url = make_imdb_url(movie_details["imdb_id"])
 
-        return self.redirect_to_change_view(object_id)
+        entity.save()
 
 
 @admin.register(Show)
 class ShowAdmin(EntityBaseAdmin):
-    def _fill_automagically(self, request: HttpRequest, object_id: int) -> None:
-        show_entity_obj = Show.objects.get(id=object_id)
+    fill_provider = "tmdb"
 
-        response = tmdb_client.search(TMDBSupportedEntityType.SHOW, show_entity_obj.name)
+    def fetch_fill_data(self, entity: Show) -> dict[str, Any] | None:
+        response = tmdb_client.search(TMDBSupportedEntityType.SHOW, entity.name)
         if len(response["results"]) < 1:
-            messages.add_message(request, messages.ERROR, "No data found for this show.")
-            return
+            return None
 
         show_id = response["results"][0]["id"]
         show_details = tmdb_client.get_details(TMDBSupportedEntityType.SHOW, show_id)
 
-        if not show_entity_obj.description:
-            show_entity_obj.description = show_details["overview"]
+        if not entity.image:
+            image_path = show_details["poster_path"]
+            image_content = File(tmdb_client.get_image("w500", image_path))
+            entity.image.save(image_path, image_content, save=False)
 
-        if not show_entity_obj.release_date:
-            show_entity_obj.release_date = show_details["first_air_date"]
+        return show_details
 
-        if not show_entity_obj.tags.exists():
-            tag_objs = []
-            for genre in show_details["genres"]:
-                tag = ShowTag.objects.get_or_create(name=genre["name"])[0]
-                tag_objs.append(tag)
+    def apply_fill_data(self, request: HttpRequest, entity: Show, data: dict[str, Any]) -> None:
+        show_details = data
 
-            show_entity_obj.tags.set(tag_objs)
+        if not entity.description:
+            entity.description = show_details["overview"]
 
-        if not show_entity_obj.image:
-            image_path = show_details["poster_path"]
-            image_content = File(tmdb_client.get_image("w500", image_path))
-            show_entity_obj.image.save(image_path, image_content, save=False)
+        if not entity.release_date:
+            entity.release_date = show_details["first_air_date"]
 
-        show_entity_obj.save()
+        if not entity.tags.exists():
+            tag_objs = ShowTag.objects.resolve_many(genre["name"] for genre in show_details["genres"])
+            entity.tags.set(tag_objs.values())
 
-        return self.redirect_to_change_view(object_id)
+        entity.save()
 
 
 @admin.register(Game)
 class GameAdmin(EntityBaseAdmin):
     autocomplete_fields = (*EntityBaseAdmin.autocomplete_fields, *("platforms",))
 
-    def _fill_automagically(self, request: HttpRequest, object_id: int) -> None:
-        game_entity_obj = Game.objects.get(id=object_id)
+    fill_provider = "igdb"
 
-        response = igdb_client.search(game_entity_obj.name)
+    def _fetch_game_data(self, entity: Game, response: list[dict[str, Any]]) -> dict[str, Any] | None:
         if len(response) < 1:
-            messages.add_message(request, messages.ERROR, "No data found for this game.")
-            return
+            return None
 
         game_details = response[0]
 
-        if not game_entity_obj.description:
-            game_entity_obj.description = game_details["summary"]
+        if not entity.image:
+            image_id = game_details["cover"]["image_id"]
+            image_content = File(igdb_client.get_cover_image(image_id))
+            entity.image.save(f"{image_id}.webp", image_content, save=False)
+
+        return game_details
+
+    def fetch_fill_data(self, entity: Game) -> dict[str, Any] | None:
+        return self._fetch_game_data(entity, igdb_client.search(entity.name))
 
-        if not game_entity_obj.release_date:
-            game_entity_obj.release_date = datetime.date.fromtimestamp(game_details["first_release_date"])
+    def fetch_fill_data_many(self, entities: list[Game]) -> dict[int, dict[str, Any] | Exception | None]:
+        # The games are searched with multiqueries, only the cover images are fetched concurrently
+        try:
+            responses = igdb_client.search_many(entity.name for entity in entities)
+        except Exception as e:
+            logger.exception("Failed to search games")
+            return dict.fromkeys((entity.pk for entity in entities), e)
 
-        if not game_entity_obj.tags.exists():
-            tag_objs = []
-            for genre in game_details["genres"]:
-                tag = GameTag.objects.get_or_create_with_aliases(genre["name"])[0]
-                tag_objs.append(tag)
+        return self._run_concurrently(lambda entity: self._fetch_game_data(entity, responses[entity.name]), entities)
 
-            game_entity_obj.tags.set(tag_objs)
+    def apply_fill_data(self, request: HttpRequest, entity: Game, data: dict[str, Any]) -> None:
+        game_details = data
 
-        if not game_entity_obj.platforms.exists():
-            platform_objs = []
-            for platform in game_details["platforms"]:
-                try:
-                    platform_obj = Platform.objects.get_with_aliases(platform["name"])
-                    platform_objs.append(platform_obj)
-                except Platform.DoesNotExist:
+        if not entity.description:
+            entity.description = game_details["summary"]
+
+        if not entity.release_date:
+            entity.release_date = datetime.date.fromtimestamp(game_details["first_release_date"])
+
+        if not entity.tags.exists():
+            tag_objs = GameTag.objects.resolve_many(genre["name"] for genre in game_details["genres"])
+            entity.tags.set(tag_objs.values())
+
+        if not entity.platforms.exists():
+            platform_names = [platform["name"] for platform in game_details["platforms"]]
+            platform_objs = Platform.objects.resolve_many(platform_names, create_missing=False)
+            for platform_name in platform_names:
+                if platform_name not in platform_objs:
                     messages.add_message(
                         request,
                         messages.WARNING,
-                        f"Platform '{platform['name']}' not found. Please create it first.",
+                        f"Platform '{platform_name}' not found. Please create it first.",
                     )
 
-            game_entity_obj.platforms.set(platform_objs)
+            entity.platforms.set(platform_objs.values())
 
-        if not game_entity_obj.developer:
+        if not entity.developer:
             for company in game_details["involved_companies"]:
                 if company["developer"]:
-                    game_entity_obj.developer.append(company["company"]["name"])
+                    entity.developer.append(company["company"]["name"])
 
-        if not game_entity_obj.publisher:
+        if not entity.publisher:
             for company in game_details["involved_companies"]:
                 if company["publisher"]:
-                    game_entity_obj.publisher.append(company["company"]["name"])
-
-        if not game_entity_obj.image:
-            image_id = game_details["cover"]["image_id"]
-            image_content = File(igdb_client.get_cover_image(image_id))
-            game_entity_obj.image.save(f"{image_id}.webp", image_content, save=False)
+                    entity.publisher.append(company["company"]["name"])
 
-        if not game_entity_obj.steam_url:
+        if not entity.steam_url:
             for website in game_details.get("websites", []):
                 if website["type"]["type"] == "Steam":
-                    game_entity_obj.steam_url = website["url"]
+                    entity.steam_url = website["url"]
                     break
 
-        if not game_entity_obj.wikipedia_url:
+        if not entity.wikipedia_url:
             for website in game_details.get("websites", []):
                 if website["type"]["type"] == "Wikipedia":
-                    game_entity_obj.wikipedia_url = website["url"]
+                    entity.wikipedia_url = website["url"]
                     break
 
-        game_entity_obj.save()
-
-        return self.redirect_to_change_view(object_id)
+        entity.save()
 
 
 @admin.register(Book)
@@ -0,0 +1,23 @@
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+from entities import search
+
+
+def create_search_index(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    search.create_search_index(schema_editor.connection)
+
+
+def drop_search_index(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    search.drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("entities", "0002_add_aliases_to_entities"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
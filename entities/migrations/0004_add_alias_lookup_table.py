@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-18 14:18
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+ALIASED_MODELS = ("movietag", "showtag", "gametag", "booktag", "platform", "movie", "show", "game", "book")
+
+
+def populate_aliases(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Alias = apps.get_model("entities", "Alias")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    for model_name in ALIASED_MODELS:
+        model = apps.get_model("entities", model_name)
+        content_type = ContentType.objects.get_for_model(model)
+
+        aliases = []
+        for obj in model.objects.exclude(aliases=[]).only("id", "aliases").iterator():
+            keys = {
+                unicodedata.normalize("NFKC", alias).casefold().strip()
+                for alias in obj.aliases
+                if isinstance(alias, str) and alias.strip()
+            }
+            aliases.extend(Alias(content_type=content_type, object_id=obj.pk, key=key) for key in keys)
+
+        Alias.objects.bulk_create(aliases, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("entities", "0003_entity_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Alias",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("key", models.CharField(max_length=255)),
+                (
+                    "content_type",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "aliases",
+                "indexes": [models.Index(fields=["content_type", "object_id"], name="entities_al_content_4b4a3d_idx")],
+                "constraints": [models.UniqueConstraint(fields=("content_type", "key"), name="unique_alias_key")],
+            },
+        ),
+        migrations.RunPython(populate_aliases, migrations.RunPython.noop),
+    ]
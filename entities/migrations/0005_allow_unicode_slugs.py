@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("entities", "0004_add_alias_lookup_table"),
+    ]
+
+    # Only the validation of the field changes, altering the tables on SQLite would rebuild them
+    # and drop the triggers of the search index
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="book",
+                    name="slug",
+                    field=models.SlugField(allow_unicode=True, max_length=128, unique=True),
+                ),
+                migrations.AlterField(
+                    model_name="game",
+                    name="slug",
+                    field=models.SlugField(allow_unicode=True, max_length=128, unique=True),
+                ),
+                migrations.AlterField(
+                    model_name="movie",
+                    name="slug",
+                    field=models.SlugField(allow_unicode=True, max_length=128, unique=True),
+                ),
+                migrations.AlterField(
+                    model_name="show",
+                    name="slug",
+                    field=models.SlugField(allow_unicode=True, max_length=128, unique=True),
+                ),
+            ],
+        ),
+    ]
@@ -1,10 +1,14 @@
 import random
 import string
+import unicodedata
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import ClassVar, Iterable, Self
 
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MaxLengthValidator
 from django.db import models
+from django.db.models import Case, Q, Value, When
 from django.db.models.functions import Lower
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -15,7 +19,80 @@ from entities.helpers import format_time_spent
 ### Near-constant models ###
 
 
+def normalize_alias(value: str) -> str:
+    """
+    Normalize a name or an alias to the key used for alias lookups.
+    """
+    return unicodedata.normalize("NFKC", value).casefold().strip()
+
+
+class AliasQuerySet(models.QuerySet):
+    def for_object(self: Self, obj: models.Model) -> Self:
+        return self.filter(content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk)
+
+    def sync_for(self: Self, obj: models.Model) -> None:
+        """
+        Make the alias rows of the object match its `aliases` JSONField.
+
+        Aliases that are already used by another object of the same model are skipped.
+        """
+        content_type = ContentType.objects.get_for_model(obj)
+        keys = {normalize_alias(alias) for alias in obj.aliases or [] if isinstance(alias, str) and alias.strip()}
+        existing_keys = set(self.for_object(obj).values_list("key", flat=True))
+        if keys == existing_keys:
+            return
+
+        if removed_keys := existing_keys - keys:
+            self.for_object(obj).filter(key__in=removed_keys).delete()
+
+        self.bulk_create(
+            [Alias(content_type=content_type, object_id=obj.pk, key=key) for key in keys - existing_keys],
+            ignore_conflicts=True,
+        )
+
+
+class Alias(models.Model):
+    """
+    Normalized keys of the `aliases` of tags, platforms and entities,
+    maintained by receivers so that alias lookups use an index.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    content_object = GenericForeignKey("content_type", "object_id")
+
+    key = models.CharField(max_length=255)
+
+    objects = AliasQuerySet.as_manager()
+
+    class Meta:
+        verbose_name_plural = "aliases"
+        indexes: ClassVar = [
+            models.Index(fields=["content_type", "object_id"]),
+        ]
+        constraints: ClassVar = [
+            models.UniqueConstraint(fields=["content_type", "key"], name="unique_alias_key"),
+        ]
+
+    def __str__(self: Self) -> str:
+        return self.key
+
+
 class ObjectWithAliasQuerySet(models.QuerySet):
+    def _filter_by_name_or_alias(self: Self, value: str) -> Self:
+        """
+        Filter by the name or any of the aliases (through the `Alias` table), case-insensitively.
+        Objects matching by name are ordered first.
+        """
+        alias_object_ids = Alias.objects.filter(
+            content_type=ContentType.objects.get_for_model(self.model), key=normalize_alias(value)
+        ).values("object_id")
+        return (
+            self.filter(Q(name__iexact=value) | Q(pk__in=alias_object_ids))
+            .annotate(_alias_match=Case(When(name__iexact=value, then=Value(0)), default=Value(1)))
+            .order_by("_alias_match", "pk")
+        )
+
     def get_with_aliases(self: Self, value: str) -> Self:
         """
         Get an object by its name or any of its aliases, case-insensitively.
@@ -23,18 +100,11 @@ class ObjectWithAliasQuerySet(models.QuerySet):
         Requires that the model has a 'name' field and an 'aliases' JSONField
         containing a list of strings.
         """
-        normalized_value = value.casefold()
-        try:
-            return self.get(name__iexact=value)
-        except self.model.DoesNotExist:
-            for obj in self.exclude(aliases=[]).only("id", "aliases"):
-                aliases = getattr(obj, "aliases", []) or []
-                if any(isinstance(alias, str) and alias.casefold() == normalized_value for alias in aliases):
-                    return obj
+        obj = self._filter_by_name_or_alias(value).first()
+        if obj is None:
+            raise self.model.DoesNotExist(f"{self.model._meta.object_name} matching alias {value!r} does not exist.")
 
-            raise self.model.DoesNotExist(
-                f"{self.model._meta.object_name} matching alias {value!r} does not exist."
-            ) from None
+        return obj
 
     def get_or_create_with_aliases(self: Self, value: str) -> tuple[Self, bool]:
         """
@@ -44,17 +114,66 @@ class ObjectWithAliasQuerySet(models.QuerySet):
         Requires that the model has a 'name' field and an 'aliases' JSONField
         containing a list of strings.
         """
-        normalized_value = value.casefold()
         try:
-            return self.get(name__iexact=value), False
+            return self.get_with_aliases(value), False
         except self.model.DoesNotExist:
-            for obj in self.exclude(aliases=[]).only("id", "aliases"):
-                aliases = getattr(obj, "aliases", []) or []
-                if any(isinstance(alias, str) and alias.casefold() == normalized_value for alias in aliases):
-                    return obj, False
-
             return self.get_or_create(name=value)
 
+    def resolve_many(self: Self, values: Iterable[str], create_missing: bool = True) -> dict[str, models.Model]:
+        """
+        Resolve many names at once by their names or aliases, case-insensitively,
+        using a constant number of queries.
+
+        Names are looked up using the `lower(name)` unique index and the `Alias` table.
+
+        If `create_missing` is set, objects are bulk-created for the names that were not found,
+        otherwise these names are left out of the returned mapping.
+
+        Requires that the model has a 'name' field and an 'aliases' JSONField
+        containing a list of strings.
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return {}
+
+        keys = {normalize_alias(value) for value in values}
+        content_type = ContentType.objects.get_for_model(self.model)
+        object_id_by_alias_key = dict(
+            Alias.objects.filter(content_type=content_type, key__in=keys).values_list("key", "object_id")
+        )
+
+        objects = list(
+            self.annotate(lower_name=Lower("name")).filter(
+                Q(lower_name__in={value.lower() for value in values})
+                | Q(name__in=values)
+                | Q(pk__in=object_id_by_alias_key.values())
+            )
+        )
+        # Name matches take precedence over alias matches
+        obj_by_key = {}
+        for obj in objects:
+            if (key := normalize_alias(obj.name)) in keys:
+                obj_by_key[key] = obj
+
+        objs_by_id = {obj.pk: obj for obj in objects}
+        for key, object_id in object_id_by_alias_key.items():
+            if key not in obj_by_key and object_id in objs_by_id:
+                obj_by_key[key] = objs_by_id[object_id]
+
+        if create_missing:
+            missing_values = {}
+            for value in values:
+                missing_values.setdefault(normalize_alias(value), value)
+            for key in obj_by_key:
+                missing_values.pop(key, None)
+
+            if missing_values:
+                self.bulk_create([self.model(name=value) for value in missing_values.values()], ignore_conflicts=True)
+                for obj in self.filter(name__in=missing_values.values()):
+                    obj_by_key.setdefault(normalize_alias(obj.name), obj)
+
+        return {value: obj_by_key[key] for value in values if (key := normalize_alias(value)) in obj_by_key}
+
 
 class TagBase(TimestampedModel):
     name = models.CharField(max_length=255, unique=True)
@@ -104,23 +223,46 @@ class Platform(TimestampedModel):
 ### Dynamic models ###
 
 
-class EntityQueryset(models.QuerySet):
-    def get_with_aliases(self: Self, value: str) -> Self:
-        """
-        Get an entity by its name or any of its aliases, case-insensitively.
+class EntityQueryset(ObjectWithAliasQuerySet):
+    def get_pks_by_names(self: Self, names: Iterable[str]) -> dict[str, int]:
         """
-        normalized_value = value.casefold()
-        try:
-            return self.get(name__iexact=value)
-        except self.model.DoesNotExist:
-            for obj in self.exclude(aliases=[]).only("id", "aliases"):
-                aliases = getattr(obj, "aliases", []) or []
-                if any(isinstance(alias, str) and alias.casefold() == normalized_value for alias in aliases):
-                    return obj
+        Map names to the primary keys of entities matching them by name or alias, case-insensitively.
 
-            raise self.model.DoesNotExist(
-                f"{self.model._meta.object_name} matching alias {value!r} does not exist."
-            ) from None
+        Names are looked up using the `lower(name)` unique index and the `Alias` table.
+        Names without a matching entity are left out of the returned mapping.
+        """
+        names = set(names)
+        if not names:
+            return {}
+
+        pk_by_name = {}
+        pk_by_lower_name = {}
+        for pk, name in (
+            self.annotate(lower_name=Lower("name"))
+            .filter(Q(lower_name__in={name.lower() for name in names}) | Q(name__in=names))
+            .order_by()
+            .values_list("pk", "name")
+        ):
+            pk_by_name[name] = pk
+            pk_by_lower_name[name.lower()] = pk
+
+        result = {}
+        for name in names:
+            if pk := pk_by_name.get(name) or pk_by_lower_name.get(name.lower()):
+                result[name] = pk
+
+        if unresolved_names := names - result.keys():
+            pk_by_alias_key = dict(
+                Alias.objects.filter(
+                    content_type=ContentType.objects.get_for_model(self.model),
+                    key__in={normalize_alias(name) for name in unresolved_names},
+                ).values_list("key", "object_id")
+            )
+            for name in unresolved_names:
+                if pk := pk_by_alias_key.get(normalize_alias(name)):
+                    result[name] = pk
+
+        return result
 
 
 def image_upload_destination(instance: models.Model, filename: str) -> str:
@@ -131,7 +273,7 @@ def image_upload_destination(instance: models.Model, filename: str) -> str:
 
 class EntityBase(TimestampedModel):
     name = models.CharField(max_length=128)
-    slug = models.SlugField(max_length=128, unique=True)
+    slug = models.SlugField(max_length=128, unique=True, allow_unicode=True)
     description = models.TextField(blank=True, validators=[MaxLengthValidator(500)])
 
     aliases = models.JSONField(
@@ -155,6 +297,9 @@ class EntityBase(TimestampedModel):
     # `get_<field_name>_display` on the model.
     ADDITIONAL_DETAIL_FIELDS: tuple[str] = ()
 
+    # Date field copied to the tracking objects to sort them by release date
+    RELEASE_DATE_FIELD = "release_date"
+
     objects = EntityQueryset.as_manager()
 
     # Used in the frontend to color the entity type record
@@ -275,6 +420,8 @@ class Book(EntityBase):
 
     ADDITIONAL_DETAIL_FIELDS = ("publish_date", "author")
 
+    RELEASE_DATE_FIELD = "publish_date"
+
     COLOR = "#2196f3"
 
     def __str__(self: Self) -> str:
@@ -1,10 +1,29 @@
+import logging
 from typing import Any
 
-from django.db.models.signals import post_delete
+from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.db.transaction import on_commit
 from django.dispatch import receiver
 
-from entities.models import Book, EntityBase, Game, Movie, Show
+from entities.models import (
+    Alias,
+    Book,
+    BookTag,
+    EntityBase,
+    Game,
+    GameTag,
+    Movie,
+    MovieTag,
+    Platform,
+    Show,
+    ShowTag,
+    TagBase,
+)
+from entities.search import restore_search_index_triggers
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_delete, sender=Movie)
@@ -15,3 +34,49 @@ def delete_image_file_on_obj_deletion(instance: EntityBase, **kwargs: Any) -> No
     """Delete the image file in storage when the parent object is deleted."""
 
     on_commit(lambda: instance.image.delete(save=False))
+
+
+@receiver(post_save, sender=MovieTag)
+@receiver(post_save, sender=ShowTag)
+@receiver(post_save, sender=GameTag)
+@receiver(post_save, sender=BookTag)
+@receiver(post_save, sender=Platform)
+@receiver(post_save, sender=Movie)
+@receiver(post_save, sender=Show)
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Book)
+def sync_aliases_on_obj_save(
+    instance: TagBase | Platform | EntityBase, update_fields: frozenset[str] | None = None, **kwargs: Any
+) -> None:
+    """Keep the normalized alias lookup table in sync with the `aliases` field."""
+
+    if update_fields is not None and "aliases" not in update_fields:
+        return
+
+    Alias.objects.sync_for(instance)
+
+
+@receiver(post_delete, sender=MovieTag)
+@receiver(post_delete, sender=ShowTag)
+@receiver(post_delete, sender=GameTag)
+@receiver(post_delete, sender=BookTag)
+@receiver(post_delete, sender=Platform)
+@receiver(post_delete, sender=Movie)
+@receiver(post_delete, sender=Show)
+@receiver(post_delete, sender=Game)
+@receiver(post_delete, sender=Book)
+def delete_aliases_on_obj_deletion(instance: TagBase | Platform | EntityBase, **kwargs: Any) -> None:
+    """Delete the alias lookup rows of the deleted object."""
+
+    Alias.objects.for_object(instance).delete()
+
+
+@receiver(post_migrate)
+def restore_search_index_triggers_on_migrate(sender: AppConfig, using: str, **kwargs: Any) -> None:
+    """Recreate the search index triggers dropped by the migrations rebuilding the entity tables."""
+
+    if sender.name != "entities":
+        return
+
+    if restore_search_index_triggers(connections[using]):
+        logger.warning("Restored the search index triggers and rebuilt the index", extra={"database": using})
@@ -0,0 +1,310 @@
+from functools import cached_property
+from typing import Any, Callable, Iterator, NamedTuple, Self
+
+from django.db import connection, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+# Maintained by SQLite triggers, see `create_search_index`.
+SEARCH_INDEX_TABLE = "entities_search_index"
+
+# Entity table, entity type (verbose name), type code and JSON credit columns
+# that are indexed together with the name and aliases.
+# The type code is stored in the high bits of the index rowid
+# so rows can be updated and deleted by rowid only.
+SEARCH_INDEX_SOURCES = (
+    ("entities_movie", "movie", 1, ("director", "cast")),
+    ("entities_show", "show", 2, ("creator", "stars")),
+    ("entities_game", "game", 3, ("developer", "publisher")),
+    ("entities_book", "book", 4, ("author",)),
+)
+
+SEARCH_INDEX_ROWID_SHIFT = 48
+
+SEARCH_INDEX_COLUMNS = "rowid, entity_type, entity_id, name, aliases, credits"
+
+SEARCH_INDEX_TRIGGER_ACTIONS = ("insert", "update", "delete")
+
+# The trigram tokenizer cannot match terms shorter than three characters,
+# shorter queries fall back to a `LIKE` scan of the (much smaller) index table.
+TRIGRAM_MIN_QUERY_LENGTH = 3
+
+# Weights of the index columns used by bm25:
+# entity_type, entity_id (both unindexed), name, aliases, credits.
+BM25_WEIGHTS = (0.0, 0.0, 10.0, 5.0, 1.0)
+
+
+class SearchHit(NamedTuple):
+    entity_type: str
+    entity_id: int
+
+
+def is_search_index_available() -> bool:
+    """
+    The full-text index is only maintained on SQLite (FTS5).
+    """
+    return connection.vendor == "sqlite"
+
+
+def _json_list_sql(column: str) -> str:
+    return f"""(SELECT group_concat(value, ' ') FROM json_each({column}))"""  # noqa: S608
+
+
+def _document_sql(row: str, entity_type: str, type_code: int, credit_columns: tuple[str, ...]) -> str:
+    credits_sql = " || ' ' || ".join(
+        f"""coalesce({_json_list_sql(f'{row}."{column}"')}, '')""" for column in credit_columns
+    )
+    return f"""
+        ({type_code} << {SEARCH_INDEX_ROWID_SHIFT}) + {row}.id,
+        '{entity_type}',
+        {row}.id,
+        {row}.name,
+        coalesce({_json_list_sql(f"{row}.aliases")}, ''),
+        {credits_sql}
+    """
+
+
+def _get_trigger_names(table: str) -> list[str]:
+    return [f"{table}_search_index_{action}" for action in SEARCH_INDEX_TRIGGER_ACTIONS]
+
+
+def _create_search_index_triggers(db_connection: BaseDatabaseWrapper) -> None:
+    with db_connection.cursor() as cursor:
+        for table, entity_type, type_code, credit_columns in SEARCH_INDEX_SOURCES:
+            rowid_sql = f"({type_code} << {SEARCH_INDEX_ROWID_SHIFT})"
+            watched_columns = ", ".join(f'"{column}"' for column in ("name", "aliases", *credit_columns))
+            insert_trigger, update_trigger, delete_trigger = _get_trigger_names(table)
+
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {insert_trigger} AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_COLUMNS})
+                    VALUES ({_document_sql("NEW", entity_type, type_code, credit_columns)});
+                END
+                """  # noqa: S608
+            )
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {update_trigger} AFTER UPDATE OF {watched_columns} ON {table} BEGIN
+                    DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = {rowid_sql} + OLD.id;
+                    INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_COLUMNS})
+                    VALUES ({_document_sql("NEW", entity_type, type_code, credit_columns)});
+                END
+                """  # noqa: S608
+            )
+            cursor.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {delete_trigger} AFTER DELETE ON {table} BEGIN
+                    DELETE FROM {SEARCH_INDEX_TABLE} WHERE rowid = {rowid_sql} + OLD.id;
+                END
+                """  # noqa: S608
+            )
+
+
+def rebuild_search_index(db_connection: BaseDatabaseWrapper) -> None:
+    """
+    Replace the content of the index with the current entities.
+    """
+    with transaction.atomic(using=db_connection.alias), db_connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_INDEX_TABLE}")  # noqa: S608
+        for table, entity_type, type_code, credit_columns in SEARCH_INDEX_SOURCES:
+            cursor.execute(
+                f"""
+                INSERT INTO {SEARCH_INDEX_TABLE}({SEARCH_INDEX_COLUMNS})
+                SELECT {_document_sql(table, entity_type, type_code, credit_columns)} FROM {table}
+                """  # noqa: S608
+            )
+
+
+def create_search_index(db_connection: BaseDatabaseWrapper) -> None:
+    """
+    Create the full-text index of the entities and the triggers keeping it in sync with the entity tables.
+    """
+    if db_connection.vendor != "sqlite":
+        return
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_INDEX_TABLE} USING fts5(
+                entity_type UNINDEXED,
+                entity_id UNINDEXED,
+                name,
+                aliases,
+                credits,
+                tokenize = 'trigram'
+            )
+            """
+        )
+
+    _create_search_index_triggers(db_connection)
+    rebuild_search_index(db_connection)
+
+
+def drop_search_index(db_connection: BaseDatabaseWrapper) -> None:
+    if db_connection.vendor != "sqlite":
+        return
+
+    with db_connection.cursor() as cursor:
+        for table, _entity_type, _type_code, _credit_columns in SEARCH_INDEX_SOURCES:
+            for trigger in _get_trigger_names(table):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+        cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_INDEX_TABLE}")
+
+
+def restore_search_index_triggers(db_connection: BaseDatabaseWrapper) -> bool:
+    """
+    Recreate the triggers of the index that are missing and rebuild the index if any were.
+
+    SQLite drops the triggers together with their table when a migration rebuilds it (e.g. `AlterField`),
+    the entities changed after that are not indexed. Return whether the triggers were restored.
+    """
+    if db_connection.vendor != "sqlite":
+        return False
+
+    expected_triggers = {trigger for table, *_source in SEARCH_INDEX_SOURCES for trigger in _get_trigger_names(table)}
+    with db_connection.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        names_by_type = {}
+        for object_type, name in cursor.fetchall():
+            names_by_type.setdefault(object_type, set()).add(name)
+
+    # Not created yet (or migrated backwards)
+    if SEARCH_INDEX_TABLE not in names_by_type.get("table", set()):
+        return False
+
+    if expected_triggers <= names_by_type.get("trigger", set()):
+        return False
+
+    _create_search_index_triggers(db_connection)
+    rebuild_search_index(db_connection)
+    return True
+
+
+def _escape_match_query(query: str) -> str:
+    """
+    Quote the query as a single FTS5 phrase so user input is never parsed as query syntax.
+    """
+    return '"{}"'.format(query.replace('"', '""'))
+
+
+def _escape_like_query(query: str) -> str:
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _get_where_clause(query: str) -> tuple[str, list[str]]:
+    if len(query) >= TRIGRAM_MIN_QUERY_LENGTH:
+        return f"{SEARCH_INDEX_TABLE} MATCH %s", [_escape_match_query(query)]
+
+    like_query = f"%{_escape_like_query(query)}%"
+    return (
+        "name LIKE %s ESCAPE '\\' OR aliases LIKE %s ESCAPE '\\' OR credits LIKE %s ESCAPE '\\'",
+        [like_query] * 3,
+    )
+
+
+def _get_order_by_clause(query: str) -> tuple[str, list[str]]:
+    """
+    Order hits by match tier: exact name > name prefix > alias > any other substring match.
+    Within a tier, hits are ordered by bm25 (if the trigram index is used) and name.
+    """
+    escaped_query = _escape_like_query(query)
+    tier_sql = """
+        CASE
+            WHEN name = %s COLLATE NOCASE THEN 0
+            WHEN name LIKE %s ESCAPE '\\' THEN 1
+            WHEN aliases LIKE %s ESCAPE '\\' THEN 2
+            ELSE 3
+        END
+    """
+    params = [query, f"{escaped_query}%", f"%{escaped_query}%"]
+
+    if len(query) >= TRIGRAM_MIN_QUERY_LENGTH:
+        weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+        return f"{tier_sql}, bm25({SEARCH_INDEX_TABLE}, {weights}), name", params
+
+    return f"{tier_sql}, name", params
+
+
+def count_search_index(query: str) -> int:
+    query = query.strip()
+    if not query:
+        return 0
+
+    where_sql, where_params = _get_where_clause(query)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {SEARCH_INDEX_TABLE} WHERE {where_sql}", where_params)  # noqa: S608
+        return cursor.fetchone()[0]
+
+
+def search_index(query: str, offset: int = 0, limit: int | None = None) -> list[SearchHit]:
+    """
+    Search entities of all types by name, aliases and credits in a single query.
+
+    Only the hits in the `offset`/`limit` window are fetched, ordered by relevance.
+    """
+    query = query.strip()
+    if not query:
+        return []
+
+    where_sql, where_params = _get_where_clause(query)
+    order_by_sql, order_by_params = _get_order_by_clause(query)
+    sql = f"""
+        SELECT entity_type, entity_id FROM {SEARCH_INDEX_TABLE}
+        WHERE {where_sql}
+        ORDER BY {order_by_sql}
+        LIMIT %s OFFSET %s
+    """  # noqa: S608
+    params = [*where_params, *order_by_params, -1 if limit is None else limit, offset]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [SearchHit(entity_type, entity_id) for entity_type, entity_id in cursor.fetchall()]
+
+
+class SearchResults:
+    """
+    Lazy, sliceable sequence of search results that can be passed to Django's `Paginator`.
+
+    Only the requested slice of hits is fetched from the index
+    and turned into objects with `hydrate`, so memory use is bounded by the page size.
+    """
+
+    ITERATION_CHUNK_SIZE = 100
+
+    def __init__(self: Self, query: str, hydrate: Callable[[list[SearchHit]], list[Any]]) -> None:
+        self.query = query
+        self.hydrate = hydrate
+
+    @cached_property
+    def total_count(self: Self) -> int:
+        return count_search_index(self.query)
+
+    def count(self: Self) -> int:
+        return self.total_count
+
+    def __len__(self: Self) -> int:
+        return self.total_count
+
+    def __getitem__(self: Self, key: int | slice) -> Any:
+        if isinstance(key, int):
+            results = self[key : key + 1]
+            if not results:
+                raise IndexError("Search result index out of range")
+            return results[0]
+
+        if key.step is not None:
+            raise ValueError("Search results do not support slicing with a step.")
+
+        start = key.start or 0
+        limit = None if key.stop is None else max(key.stop - start, 0)
+        if limit == 0:
+            return []
+
+        return self.hydrate(search_index(self.query, offset=start, limit=limit))
+
+    def __iter__(self: Self) -> Iterator[Any]:
+        offset = 0
+        while hits := search_index(self.query, offset=offset, limit=self.ITERATION_CHUNK_SIZE):
+            yield from self.hydrate(hits)
+            offset += len(hits)
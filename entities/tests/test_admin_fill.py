@@ -0,0 +1,163 @@
+from io import BytesIO
+from typing import Any, Self
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from entities.factories import BookFactory, GameFactory, MovieFactory
+from entities.models import Game, Movie, MovieTag
+
+User = get_user_model()
+
+TEST_STORAGES = {**settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+
+
+def get_movie_details(entity_type: str, title: str) -> dict[str, Any]:
+    return {
+        "overview": f"{title} overview",
+        "runtime": 120,
+        "release_date": "1999-03-31",
+        "credits": {"crew": [{"name": "Lana Wachowski", "job": "Director"}], "cast": [{"name": "Keanu Reeves"}]},
+        "genres": [{"name": "Action"}],
+        "imdb_id": "tt0133093",
+        "poster_path": f"/{title.lower().replace(' ', '-')}.jpg",
+    }
+
+
+def search_movie(entity_type: str, query: str) -> dict[str, Any]:
+    if query == "Unknown":
+        return {"results": []}
+    if query == "Broken":
+        raise ConnectionError("TMDB is down")
+    return {"results": [{"id": query}]}
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+@mock.patch("entities.admin.tmdb_client.get_image", side_effect=lambda size, path: BytesIO(b"image"))
+@mock.patch("entities.admin.tmdb_client.get_details", side_effect=get_movie_details)
+@mock.patch("entities.admin.tmdb_client.search", side_effect=search_movie)
+class FillAutomagicallyActionTestCase(TestCase):
+    """Tests for the bulk "Fill automagically" admin action."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.admin = User.objects.create_superuser(username="admin", password="12345")  # noqa: S106
+
+    def setUp(self: Self) -> None:
+        self.client.force_login(self.admin)
+
+    def _run_action(self: Self, model_name: str, entities: list[Any]) -> list[str]:
+        response = self.client.post(
+            reverse(f"admin:entities_{model_name}_changelist"),
+            {"action": "fill_automagically_action", "_selected_action": [entity.pk for entity in entities]},
+            follow=True,
+        )
+        self.assertEqual(response.status_code, 200)
+        return [str(message) for message in get_messages(response.wsgi_request)]
+
+    def test_fills_all_entities(self: Self, *mocks: mock.Mock) -> None:
+        movies = [MovieFactory(name=f"Movie {i}", description="") for i in range(5)]
+
+        messages = self._run_action("movie", movies)
+
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith("Data filled automagically for 5 entities"))
+        for movie in Movie.objects.filter(pk__in=[movie.pk for movie in movies]):
+            self.assertEqual(movie.description, f"{movie.name} overview")
+            self.assertEqual(movie.length, 120)
+            self.assertEqual(movie.director, ["Lana Wachowski"])
+            self.assertTrue(movie.image)
+        self.assertEqual(list(MovieTag.objects.values_list("name", flat=True)), ["Action"])
+
+    def test_reports_failed_entities(self: Self, *mocks: mock.Mock) -> None:
+        filled_movie = MovieFactory(name="The Matrix", description="")
+        unknown_movie = MovieFactory(name="Unknown", description="")
+        broken_movie = MovieFactory(name="Broken", description="")
+
+        with self.assertLogs("entities.admin", "ERROR"):
+            messages = self._run_action("movie", [filled_movie, unknown_movie, broken_movie])
+
+        self.assertIn("Unknown: No data found.", messages)
+        self.assertIn("Broken: ConnectionError('TMDB is down')", messages)
+        self.assertIn("Data filled automagically for 1 entities: The Matrix.", messages)
+
+        filled_movie.refresh_from_db()
+        unknown_movie.refresh_from_db()
+        self.assertEqual(filled_movie.description, "The Matrix overview")
+        self.assertEqual(unknown_movie.description, "")
+
+    def test_existing_data_is_kept(self: Self, *mocks: mock.Mock) -> None:
+        movie = MovieFactory(name="The Matrix", description="Red pill or blue pill")
+
+        self._run_action("movie", [movie])
+
+        movie.refresh_from_db()
+        self.assertEqual(movie.description, "Red pill or blue pill")
+        self.assertEqual(movie.release_date.isoformat(), "1999-03-31")
+
+    def test_unsupported_entity_type(self: Self, search_mock: mock.Mock, *mocks: mock.Mock) -> None:
+        messages = self._run_action("book", [BookFactory(name="The Invincible")])
+
+        self.assertEqual(messages, ["Cannot fill automagically for this entity type."])
+        search_mock.assert_not_called()
+
+    def test_single_entity_view(self: Self, *mocks: mock.Mock) -> None:
+        movie = MovieFactory(name="Unknown")
+
+        response = self.client.get(
+            reverse("admin:fill-automagically-entities-movie", kwargs={"object_id": movie.pk}), follow=True
+        )
+
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)], ["No data found for this movie."]
+        )
+
+
+def search_games(names: list[str]) -> dict[str, list[dict[str, Any]]]:
+    return {
+        name: [
+            {
+                "summary": f"{name} summary",
+                "first_release_date": 1600387200,
+                "genres": [],
+                "platforms": [],
+                "involved_companies": [{"developer": True, "publisher": False, "company": {"name": "Supergiant"}}],
+            }
+        ]
+        if name != "Unknown"
+        else []
+        for name in names
+    }
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class FillAutomagicallyGamesActionTestCase(TestCase):
+    """Tests for the bulk "Fill automagically" admin action of games, searched in batches."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.admin = User.objects.create_superuser(username="admin", password="12345")  # noqa: S106
+
+    def setUp(self: Self) -> None:
+        self.client.force_login(self.admin)
+
+    @mock.patch("entities.admin.igdb_client.search")
+    @mock.patch("entities.admin.igdb_client.search_many", side_effect=search_games)
+    def test_games_searched_together(self: Self, search_many_mock: mock.Mock, search_mock: mock.Mock) -> None:
+        games = [GameFactory(name=f"Game {i}", description="", image="cover.webp") for i in range(3)]
+        unknown_game = GameFactory(name="Unknown", description="")
+
+        self.client.post(
+            reverse("admin:entities_game_changelist"),
+            {"action": "fill_automagically_action", "_selected_action": [game.pk for game in [*games, unknown_game]]},
+        )
+
+        search_many_mock.assert_called_once()
+        search_mock.assert_not_called()
+        for game in Game.objects.filter(pk__in=[game.pk for game in games]):
+            self.assertEqual(game.description, f"{game.name} summary")
+            self.assertEqual(game.developer, ["Supergiant"])
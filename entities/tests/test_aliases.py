@@ -0,0 +1,83 @@
+from typing import Self
+
+from django.test import TestCase
+
+from entities.factories import MovieFactory
+from entities.models import Alias, GameTag, Movie, Platform
+
+
+class AliasLookupTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.platform = Platform.objects.create(name="PC (Microsoft Windows)", aliases=["PC", "Windows"])
+
+    def test_get_with_aliases_by_name(self: Self) -> None:
+        self.assertEqual(Platform.objects.get_with_aliases("pc (microsoft windows)"), self.platform)
+
+    def test_get_with_aliases_by_alias(self: Self) -> None:
+        with self.assertNumQueries(1):
+            self.assertEqual(Platform.objects.get_with_aliases("WINDOWS"), self.platform)
+
+    def test_get_with_aliases_normalizes_unicode(self: Self) -> None:
+        tag = GameTag.objects.create(name="Pokemon-like", aliases=["Poke\u0301mon"])
+        self.assertEqual(GameTag.objects.get_with_aliases("POK\u00c9MON"), tag)
+
+    def test_get_with_aliases_prefers_name_match(self: Self) -> None:
+        pc = Platform.objects.create(name="Windows")
+        self.assertEqual(Platform.objects.get_with_aliases("windows"), pc)
+
+    def test_get_with_aliases_does_not_exist(self: Self) -> None:
+        with self.assertRaises(Platform.DoesNotExist):
+            Platform.objects.get_with_aliases("Xbox")
+
+    def test_get_or_create_with_aliases(self: Self) -> None:
+        tag, created = GameTag.objects.get_or_create_with_aliases("Shooter")
+        self.assertTrue(created)
+
+        tag.aliases = ["FPS"]
+        tag.save()
+
+        self.assertEqual(GameTag.objects.get_or_create_with_aliases("fps"), (tag, False))
+
+    def test_aliases_follow_changes_and_deletion(self: Self) -> None:
+        movie = MovieFactory(name="Justice", aliases=["Napad"])
+        self.assertEqual(Movie.objects.get_with_aliases("napad"), movie)
+
+        movie.aliases = ["Atak"]
+        movie.save()
+        self.assertEqual(Movie.objects.get_with_aliases("atak"), movie)
+        with self.assertRaises(Movie.DoesNotExist):
+            Movie.objects.get_with_aliases("napad")
+
+        movie.delete()
+        self.assertFalse(Alias.objects.filter(key="atak").exists())
+
+    def test_resolve_many(self: Self) -> None:
+        shooter = GameTag.objects.create(name="Shooter", aliases=["FPS"])
+        rpg = GameTag.objects.create(name="Role-playing (RPG)")
+
+        with self.assertNumQueries(4):
+            tags = GameTag.objects.resolve_many(["fps", "ROLE-PLAYING (RPG)", "Shooter", "Indie", "indie"])
+
+        self.assertEqual(tags["fps"], shooter)
+        self.assertEqual(tags["Shooter"], shooter)
+        self.assertEqual(tags["ROLE-PLAYING (RPG)"], rpg)
+        self.assertEqual(tags["Indie"], tags["indie"])
+        self.assertEqual(GameTag.objects.filter(name__iexact="indie").count(), 1)
+
+    def test_resolve_many_with_many_names(self: Self) -> None:
+        GameTag.objects.bulk_create([GameTag(name=f"Tag {i}") for i in range(1500)])
+        names = [f"TAG {i}" for i in range(2000)]
+
+        tags = GameTag.objects.resolve_many(names)
+
+        self.assertEqual(len(tags), 2000)
+        self.assertEqual(tags["TAG 0"].name, "Tag 0")
+        self.assertEqual(tags["TAG 1999"].name, "TAG 1999")
+        self.assertEqual(GameTag.objects.count(), 2000)
+
+    def test_resolve_many_without_creating(self: Self) -> None:
+        platforms = Platform.objects.resolve_many(["PC", "Xbox"], create_missing=False)
+
+        self.assertEqual(platforms, {"PC": self.platform})
+        self.assertFalse(Platform.objects.filter(name="Xbox").exists())
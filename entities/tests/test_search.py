@@ -1,13 +1,17 @@
 from typing import Iterable, Self
 
 from django.contrib.auth import get_user_model
-from django.db.models import QuerySet
-from django.test import RequestFactory, TestCase
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.db.models import QuerySet, TextField
+from django.test import RequestFactory, TestCase, TransactionTestCase
 from django.urls import reverse
 
 from entities.factories import BookFactory, GameFactory, MovieFactory, ShowFactory
-from entities.models import EntityBase
+from entities.models import EntityBase, Movie
+from entities.search import count_search_index, restore_search_index_triggers
 from entities.views import EntitiesSearchView
+from tracking.models import TrackingObject
 
 User = get_user_model()
 
@@ -63,3 +67,89 @@ class SearchTestCase(TestCase):
         MovieFactory(name="Justice", aliases=["Napad"])
         queryset = self._make_search_query("Napad")
         self._assert_results_desired(queryset, ["Justice"])
+
+    def test_search_by_credits(self: Self) -> None:
+        MovieFactory(name="Oppenheimer", director=["Christopher Nolan"])
+        queryset = self._make_search_query("Nolan")
+        self._assert_results_desired(queryset, ["Oppenheimer"])
+
+    def test_search_ranks_name_matches_before_alias_matches(self: Self) -> None:
+        BookFactory(name="Solaris")
+        MovieFactory(name="Solyaris", aliases=["Solaris"])
+        queryset = self._make_search_query("Solaris")
+        self.assertEqual([x.name for x in queryset], ["Solaris", "Solyaris"])
+
+    def test_search_short_query(self: Self) -> None:
+        queryset = self._make_search_query("IT")
+        self.assertIn("The IT Crowd", [x.name for x in queryset])
+
+    def test_search_index_follows_rename_and_deletion(self: Self) -> None:
+        movie = MovieFactory(name="Blade Runner")
+        movie.name = "Blade Runner 2049"
+        movie.save()
+        self._assert_results_desired(self._make_search_query("2049"), ["Blade Runner 2049"])
+
+        movie.delete()
+        self._assert_results_desired(self._make_search_query("Blade Runner"), [])
+
+    def test_search_includes_tracking_status(self: Self) -> None:
+        movie = MovieFactory(name="Arrival")
+        TrackingObject.objects.create(user=self.user, content_object=movie, status=TrackingObject.Status.PLANNED)
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("entities:entities-search"), query_params={"search": "Arrival"})
+        self.assertEqual(response.context["object_list"][0].tracking_status, TrackingObject.Status.PLANNED)
+
+    def test_search_ranking_tiers(self: Self) -> None:
+        MovieFactory(name="Dune Messiah")
+        BookFactory(name="Children of Dune")
+        GameFactory(name="Spice Wars", aliases=["Dune: Spice Wars"])
+        ShowFactory(name="Dune")
+        queryset = self._make_search_query("dune")
+        self.assertEqual(
+            [x.name for x in queryset],
+            ["Dune", "Dune Messiah", "Spice Wars", "Children of Dune"],
+        )
+
+    def test_search_view_is_paginated(self: Self) -> None:
+        for i in range(25):
+            BookFactory(name=f"Discworld {i}")
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("entities:entities-search"), {"search": "Discworld", "page": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["paginator"].count, 25)
+        self.assertEqual(len(response.context["object_list"]), 5)
+
+
+class SearchIndexTriggersTestCase(TransactionTestCase):
+    """Tests for the search index triggers surviving the rebuilds of the entity tables."""
+
+    def _get_trigger_names(self: Self) -> set[str]:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'entities_movie'")
+            return {name for (name,) in cursor.fetchall()}
+
+    def _alter_description(self: Self, old_field: TextField, new_field: TextField) -> None:
+        new_field.set_attributes_from_name("description")
+        with connection.schema_editor() as schema_editor:
+            schema_editor.alter_field(Movie, old_field, new_field)
+        restore_search_index_triggers(connection)
+
+    def test_triggers_restored_after_table_rebuild(self: Self) -> None:
+        old_field = Movie._meta.get_field("description")
+        new_field = TextField(blank=True, null=True)
+        new_field.set_attributes_from_name("description")
+        with connection.schema_editor() as schema_editor:
+            schema_editor.alter_field(Movie, old_field, new_field)
+        self.addCleanup(self._alter_description, new_field, old_field.clone())
+        MovieFactory(name="Blade Runner")
+        self.assertFalse(self._get_trigger_names())
+
+        with self.assertLogs("entities.receivers", "WARNING"):
+            emit_post_migrate_signal(0, False, DEFAULT_DB_ALIAS)
+
+        self.assertEqual(len(self._get_trigger_names()), 3)
+        MovieFactory(name="Arrival")
+        self.assertEqual(count_search_index("Blade Runner"), 1)
+        self.assertEqual(count_search_index("Arrival"), 1)
@@ -0,0 +1,87 @@
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from entities.factories import BookFactory, MovieFactory
+from tracking.helpers import annotate_tracking_statuses
+from tracking.models import TrackingObject
+
+User = get_user_model()
+
+
+class TrackingStatusTestCase(TestCase):
+    """Tests for the batched lookup of the user's tracking statuses of listed entities."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        cls.tracked_movie = MovieFactory(name="The Matrix")
+        cls.untracked_movie = MovieFactory(name="The Matrix Reloaded")
+        cls.tracked_book = BookFactory(name="The Invincible")
+        TrackingObject.objects.create(
+            user=cls.user, content_object=cls.tracked_movie, status=TrackingObject.Status.COMPLETED
+        )
+        TrackingObject.objects.create(
+            user=cls.user, content_object=cls.tracked_book, status=TrackingObject.Status.IN_PROGRESS
+        )
+
+    def test_annotate_tracking_statuses_of_mixed_types(self: Self) -> None:
+        entities = [self.tracked_movie, self.untracked_movie, self.tracked_book]
+
+        with self.assertNumQueries(1):
+            annotate_tracking_statuses(self.user, entities)
+
+        self.assertEqual(self.tracked_movie.tracking_status, TrackingObject.Status.COMPLETED)
+        self.assertIsNone(self.untracked_movie.tracking_status)
+        self.assertEqual(self.tracked_book.tracking_status, TrackingObject.Status.IN_PROGRESS)
+
+    def test_anonymous_user_has_no_statuses(self: Self) -> None:
+        self.client.logout()
+        response = self.client.get(reverse("entities:entities-list", kwargs={"entity_type": "movies"}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(entity.tracking_status is None for entity in response.context["object_list"]))
+
+    def test_list_view_statuses(self: Self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("entities:entities-list", kwargs={"entity_type": "movies"}))
+
+        statuses = {entity.name: entity.tracking_status for entity in response.context["object_list"]}
+        self.assertEqual(statuses, {"The Matrix": TrackingObject.Status.COMPLETED, "The Matrix Reloaded": None})
+
+    def test_search_view_statuses(self: Self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("entities:entities-search"), query_params={"search": "The"})
+
+        statuses = {entity.name: entity.tracking_status for entity in response.context["object_list"]}
+        self.assertEqual(
+            statuses,
+            {
+                "The Matrix": TrackingObject.Status.COMPLETED,
+                "The Matrix Reloaded": None,
+                "The Invincible": TrackingObject.Status.IN_PROGRESS,
+            },
+        )
+
+    def test_detail_view_tracking_object(self: Self) -> None:
+        self.client.force_login(self.user)
+        tracked_url = reverse("entities:entities-detail", kwargs={"entity_type": "movies", "pk": self.tracked_movie.pk})
+        untracked_url = reverse(
+            "entities:entities-detail", kwargs={"entity_type": "movies", "pk": self.untracked_movie.pk}
+        )
+
+        with CaptureQueriesContext(connection) as tracked_context:
+            response = self.client.get(tracked_url)
+        self.assertEqual(response.context["tracking_obj"].status, TrackingObject.Status.COMPLETED)
+
+        with CaptureQueriesContext(connection) as untracked_context:
+            response = self.client.get(untracked_url)
+        self.assertIsNone(response.context["tracking_obj"])
+
+        # A single lookup of the tracking object, whether the entity is tracked or not
+        self.assertEqual(len(untracked_context.captured_queries), len(tracked_context.captured_queries))
@@ -1,22 +1,25 @@
+from collections import defaultdict
 from itertools import chain
 from typing import Any, Self
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import OuterRef, QuerySet, Subquery
+from django.db.models import QuerySet
 from django.urls import reverse
 from django.views.generic import DetailView, ListView
 from django_filters.filterset import FilterSet
 from django_filters.views import FilterView
 
-from dome.common.mixins import ElidedPaginationMixin
+from dome.common.mixins import CursorPaginationMixin, ElidedPaginationMixin
 from entities.filters import EntitySearchFilter
-from entities.mappings import ENTITY_MODEL_TO_FILTER_MAPPING
+from entities.mappings import ENTITY_MODEL_TO_FILTER_MAPPING, get_model_from_entity_type
 from entities.mixins import DynamicEntityMixin
 from entities.models import Book, EntityBase, Game, Movie, Show
+from entities.search import SearchHit, SearchResults, is_search_index_available
+from tracking.helpers import annotate_tracking_statuses
 from tracking.models import TrackingObject
 
 
-class EntitiesListView(ElidedPaginationMixin, DynamicEntityMixin, FilterView):
+class EntitiesListView(CursorPaginationMixin, DynamicEntityMixin, FilterView):
     """
     View for rendering a list of entities of a type passed in the URL.
     """
@@ -24,29 +27,16 @@ class EntitiesListView(ElidedPaginationMixin, DynamicEntityMixin, FilterView):
     template_name = "entities/entities_list.html"
 
     paginate_by = 20
+    cursor_default_ordering = "name"
 
     def get_filterset_class(self: Self) -> type[FilterSet]:
         return ENTITY_MODEL_TO_FILTER_MAPPING[self.model]
 
-    def get_queryset(self: Self) -> QuerySet[EntityBase]:
-        """
-        Get queryset based on entity type passed in URL.
-        Annotate with tracking status if user is authenticated.
-        """
-        queryset = super().get_queryset()
-
-        if self.request.user.is_authenticated:
-            # Get content type for this entity model
-            content_type = ContentType.objects.get_for_model(self.model)
-
-            # Subquery to get tracking status for each entity
-            tracking_status = TrackingObject.objects.filter(
-                user=self.request.user, content_type=content_type, object_id=OuterRef("pk")
-            ).values("status")[:1]
-
-            queryset = queryset.annotate(tracking_status=Subquery(tracking_status))
-
-        return queryset
+    def get_context_data(self: Self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        # Only the entities on the current page are looked up
+        annotate_tracking_statuses(self.request.user, context["object_list"])
+        return context
 
 
 class EntitiesDetailView(DynamicEntityMixin, DetailView):
@@ -81,38 +71,52 @@ class EntitiesDetailView(DynamicEntityMixin, DetailView):
         return context
 
 
-class EntitiesSearchView(ListView):
+class EntitiesSearchView(ElidedPaginationMixin, ListView):
     template_name = "entities/entities_search.html"
 
+    paginate_by = 20
+
     def _prepare_queryset(self, model: type[EntityBase]) -> QuerySet[EntityBase]:
         filtered_qs = EntitySearchFilter(
             self.request.GET,
             queryset=model.objects.all(),
         ).qs
 
-        # Add tracking status if user is authenticated
-        if self.request.user.is_authenticated:
-            content_type = ContentType.objects.get_for_model(model)
-            tracking_status = TrackingObject.objects.filter(
-                user=self.request.user, content_type=content_type, object_id=OuterRef("pk")
-            ).values("status")[:1]
-
-            filtered_qs = filtered_qs.annotate(tracking_status=Subquery(tracking_status))
-
         # Remove any ordering before combining
         return filtered_qs.order_by()
 
+    def _hydrate_search_hits(self: Self, hits: list[SearchHit]) -> list[EntityBase]:
+        """
+        Resolve ranked hits from the full-text index to entities,
+        fetching each entity type with a single query.
+        """
+        ids_by_model = defaultdict(list)
+        for hit in hits:
+            ids_by_model[get_model_from_entity_type(hit.entity_type)].append(hit.entity_id)
+
+        entities = {}
+        for model, ids in ids_by_model.items():
+            for entity in model.objects.filter(pk__in=ids):
+                entities[(model._meta.verbose_name, entity.pk)] = entity
+
+        return [entities[hit] for hit in hits if hit in entities]
+
     def get_queryset(self) -> QuerySet[EntityBase]:
         """
         Overriding `get_queryset` with filters because it is not possible
         to use `.annotate` (required for the ranking) after `.union`.
         """
 
-        if not self.request.GET.get("search"):
+        search_query = self.request.GET.get("search")
+        if not search_query:
             # If no search query is provided, just return an empty list
             # to focus on rendering the page
             return []
 
+        if is_search_index_available():
+            # Only the rows of the requested page are fetched and hydrated
+            return SearchResults(search_query, hydrate=self._hydrate_search_hits)
+
         # Get querysets for each model type
         movie_qs = self._prepare_queryset(Movie)
         show_qs = self._prepare_queryset(Show)
@@ -128,4 +132,6 @@ class EntitiesSearchView(ListView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["search_query"] = self.request.GET.get("search", "")
+        # Only the entities on the current page are looked up
+        annotate_tracking_statuses(self.request.user, context["object_list"])
         return context
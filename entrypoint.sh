@@ -2,14 +2,27 @@
 
 set -euo pipefail
 
-python manage.py migrate
-
 PROCESS_TYPE=$1
 
 echo "Running process type: $PROCESS_TYPE"
 
 if [ "$PROCESS_TYPE" = "server" ]; then
+    python manage.py migrate
+
+    if [ -n "${PROMETHEUS_MULTIPROC_DIR:-}" ]; then
+        # Metrics of the previous server processes must not be aggregated with the new ones
+        rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+        mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    fi
     exec gunicorn --bind 0.0.0.0:8000 --workers 2 --worker-class gevent --log-level INFO --access-logfile "-" --error-logfile "-" dome.wsgi
+elif [ "$PROCESS_TYPE" = "worker" ]; then
+    # The migrations are applied by the server
+    until python manage.py migrate --check > /dev/null 2>&1; do
+        echo "Waiting for the migrations to be applied..."
+        sleep 2
+    done
+
+    exec python manage.py run_import_worker
 else
     echo "Unknown process type: $PROCESS_TYPE"
 fi
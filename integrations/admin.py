@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from integrations.models import ImportJob
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_select_related = ("user",)
+    list_display = ("importer_name", "user", "status", "rows_processed", "rows_created", "created_at")
+    list_filter = ("status",)
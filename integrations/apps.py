@@ -1,6 +1,12 @@
+from typing import Self
+
 from django.apps import AppConfig
 
 
 class IntegrationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "integrations"
+
+    def ready(self: Self) -> None:
+        # Make sure the receivers are imported
+        from integrations import receivers  # noqa: F401
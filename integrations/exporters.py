@@ -1,14 +1,44 @@
 import csv
+import json
 import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from itertools import islice
 from typing import Any, Generator, Iterator, Self
 
+from django.contrib.contenttypes.models import ContentType
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import QuerySet
 from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.text import compress_sequence
 
-from tracking.models import TrackingObject
+from dome.metrics import EXPORT_DURATION
+from tracking.helpers import attach_content_objects
+from tracking.models import TrackingObject, TrackingObjectTombstone
 from users.models import User
 
 logger = logging.getLogger(__name__)
 
+SYNC_TOKEN_SALT = "integrations.exporters.sync_token"  # noqa: S105
+
+
+def make_sync_token(timestamp: datetime) -> str:
+    """
+    Return an opaque token that can be passed to a later export to get only the changes made after `timestamp`.
+    """
+    return signing.dumps(timestamp.isoformat(), salt=SYNC_TOKEN_SALT)
+
+
+def parse_sync_token(token: str) -> datetime:
+    """
+    Raises `signing.BadSignature` if the token has not been issued by `make_sync_token`.
+    """
+    return datetime.fromisoformat(signing.loads(token, salt=SYNC_TOKEN_SALT))
+
 
 class Echo:
     """An object that implements just the write method of the file-like
@@ -20,25 +50,124 @@ class Echo:
         return value
 
 
-class Exporter:
-    def __init__(self: Self, user: User, output_filename: str) -> None:
+class BaseExporter(ABC):
+    EXPORTER_NAME: str
+    FILE_EXTENSION: str
+    CONTENT_TYPE: str
+
+    # Whether the format can represent deletions, which is required for incremental exports
+    SUPPORTS_INCREMENTAL = False
+
+    CHUNK_SIZE = 1000
+
+    # Fields of the tracking objects and of the referenced entities loaded for the export,
+    # `None` loads all entity fields
+    TRACKING_OBJECT_FIELDS: tuple[str, ...] = ("content_type", "object_id", "status", "rating", "notes")
+    ENTITY_FIELDS: tuple[str, ...] | None = ("name",)
+
+    def __init__(
+        self: Self, user: User, output_filename: str, compress: bool = False, since: datetime | None = None
+    ) -> None:
+        """
+        If `since` is given, only the tracking objects changed and deleted at or after that time are exported.
+        """
+        if since is not None and not self.SUPPORTS_INCREMENTAL:
+            raise ValueError(f"{self.__class__.__name__} does not support incremental exports")
+
         self.user = user
         self.output_filename = output_filename
+        self.compress = compress
+        self.since = since
+
+        # Taken before anything is read, so changes made during the export are included in the next one
+        self.started_at = timezone.now()
+
+    def get_queryset(self: Self) -> QuerySet[TrackingObject]:
+        queryset = TrackingObject.objects.filter(user=self.user)
+        if self.since is not None:
+            queryset = queryset.filter(updated_at__gte=self.since)
+        return queryset.only(*self.TRACKING_OBJECT_FIELDS).order_by("pk")
+
+    def get_tombstones(self: Self) -> Iterator[TrackingObjectTombstone]:
+        if self.since is None:
+            return iter(())
 
-    def get_objects_iterator(self: Self) -> Iterator[TrackingObject]:
         return (
-            TrackingObject.objects.filter(user=self.user).prefetch_related("content_object").iterator(chunk_size=1000)
+            TrackingObjectTombstone.objects.filter(user=self.user, deleted_at__gte=self.since)
+            .order_by("deleted_at", "pk")
+            .iterator(chunk_size=self.CHUNK_SIZE)
         )
 
+    def get_next_sync_token(self: Self) -> str:
+        return make_sync_token(self.started_at)
+
+    def get_entity_queryset(self: Self, model: type[models.Model]) -> QuerySet:
+        queryset = model.objects.order_by()
+        if self.ENTITY_FIELDS is not None:
+            queryset = queryset.only(*self.ENTITY_FIELDS)
+        return queryset
+
+    def get_objects_iterator(self: Self) -> Iterator[TrackingObject]:
+        objects = self.get_queryset().iterator(chunk_size=self.CHUNK_SIZE)
+        while chunk := list(islice(objects, self.CHUNK_SIZE)):
+            attach_content_objects(chunk, self.get_entity_queryset)
+            yield from chunk
+
+    def get_exported_objects(self: Self) -> Generator[TrackingObject, None, None]:
+        for obj in self.get_objects_iterator():
+            if obj.content_object is None:
+                logger.warning("Entity not found, skipping tracking object", extra={"tracking_object_id": obj.pk})
+                continue
+
+            yield obj
+
+    @abstractmethod
+    def get_content(self: Self) -> Iterator[str]:
+        """
+        Return the exported file as a stream of text chunks.
+        """
+
+    def get_filename(self: Self) -> str:
+        filename = f"{self.output_filename}.{self.FILE_EXTENSION}"
+        if self.compress:
+            filename += ".gz"
+        return filename
+
+    def get_timed_content(self: Self) -> Iterator[str]:
+        start = time.perf_counter()
+        yield from self.get_content()
+        EXPORT_DURATION.labels(self.EXPORTER_NAME).observe(time.perf_counter() - start)
+
+    def get_streaming_response(self: Self) -> StreamingHttpResponse:
+        content = (chunk.encode() for chunk in self.get_timed_content())
+        content_type = self.CONTENT_TYPE
+        if self.compress:
+            # Compressed on the fly, the gzip stream is emitted as soon as the compressor has output ready
+            content = compress_sequence(content)
+            content_type = "application/gzip"
+
+        return StreamingHttpResponse(
+            content,
+            content_type=content_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{self.get_filename()}"',
+                "X-Sync-Token": self.get_next_sync_token(),
+            },
+        )
+
+
+class CSVExporter(BaseExporter):
+    EXPORTER_NAME = "csv"
+    FILE_EXTENSION = "csv"
+    CONTENT_TYPE = "text/csv"
+
     def get_headers_row(self: Self) -> list[str]:
         return ["Title", "Type", "Status", "Rating", "Notes"]
 
     def get_rows(self: Self) -> Generator[list[str], None, None]:
-        objects = self.get_objects_iterator()
-
         yield self.get_headers_row()
 
-        for obj in objects:
+        for obj in self.get_exported_objects():
             yield self.get_row(obj)
 
     def get_row(self: Self, obj: TrackingObject) -> list[str]:
@@ -52,11 +181,106 @@ class Exporter:
             obj.notes,
         ]
 
-    def get_streaming_response(self: Self) -> StreamingHttpResponse:
+    def get_content(self: Self) -> Iterator[str]:
         buffer = Echo()
         writer = csv.writer(buffer)
-        return StreamingHttpResponse(
-            (writer.writerow(row) for row in self.get_rows()),
-            content_type="text/csv",
-            headers={"Content-Disposition": f'attachment; filename="{self.output_filename}.csv"'},
-        )
+        return (writer.writerow(row) for row in self.get_rows())
+
+
+class JSONExporter(BaseExporter):
+    """
+    Full-fidelity export with all entity metadata, including tags, platforms and external URLs.
+    """
+
+    EXPORTER_NAME = "json"
+    FILE_EXTENSION = "json"
+    CONTENT_TYPE = "application/json"
+
+    SUPPORTS_INCREMENTAL = True
+
+    TRACKING_OBJECT_FIELDS = (*BaseExporter.TRACKING_OBJECT_FIELDS, "created_at", "updated_at")
+    ENTITY_FIELDS = None
+
+    def get_entity_queryset(self: Self, model: type[models.Model]) -> QuerySet:
+        many_to_many_fields = [field.name for field in model._meta.many_to_many]
+        return super().get_entity_queryset(model).prefetch_related(*many_to_many_fields)
+
+    def get_entity_record(self: Self, entity: models.Model) -> dict[str, Any]:
+        record = {"type": entity._meta.verbose_name, "id": entity.pk}
+        for field in entity._meta.concrete_fields:
+            if field.primary_key:
+                continue
+
+            value = field.value_from_object(entity)
+            if isinstance(field, models.FileField):
+                value = value.name
+
+            record[field.name] = value
+
+        for field in entity._meta.many_to_many:
+            # Uses the prefetched objects
+            record[field.name] = [related_obj.name for related_obj in getattr(entity, field.name).all()]
+
+        return record
+
+    def get_record(self: Self, obj: TrackingObject) -> dict[str, Any]:
+        return {
+            "entity": self.get_entity_record(obj.content_object),
+            "status": obj.get_status_display(),
+            "rating": obj.rating,
+            "notes": obj.notes,
+            "created_at": obj.created_at,
+            "updated_at": obj.updated_at,
+        }
+
+    def get_tombstone_record(self: Self, tombstone: TrackingObjectTombstone) -> dict[str, Any]:
+        content_type = ContentType.objects.get_for_id(tombstone.content_type_id)
+        return {
+            "entity": {"type": content_type.model_class()._meta.verbose_name, "id": tombstone.object_id},
+            "deleted": True,
+            "deleted_at": tombstone.deleted_at,
+        }
+
+    def get_records(self: Self) -> Generator[dict[str, Any], None, None]:
+        # Deletions go first, so a tracking object deleted and then re-created ends up present
+        for tombstone in self.get_tombstones():
+            yield self.get_tombstone_record(tombstone)
+
+        for obj in self.get_exported_objects():
+            yield self.get_record(obj)
+
+    def serialize_record(self: Self, record: dict[str, Any]) -> str:
+        return json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False)
+
+    def get_content(self: Self) -> Generator[str, None, None]:
+        yield "["
+
+        separator = "\n"
+        for record in self.get_records():
+            yield separator + self.serialize_record(record)
+            separator = ",\n"
+
+        yield "\n]\n"
+
+
+class NDJSONExporter(JSONExporter):
+    """
+    Same records as the JSON export, one JSON document per line.
+    """
+
+    EXPORTER_NAME = "ndjson"
+    FILE_EXTENSION = "ndjson"
+    CONTENT_TYPE = "application/x-ndjson"
+
+    def get_content(self: Self) -> Generator[str, None, None]:
+        for record in self.get_records():
+            yield self.serialize_record(record) + "\n"
+
+
+EXPORTERS = [
+    CSVExporter,
+    JSONExporter,
+    NDJSONExporter,
+]
+
+EXPORTER_MAPPING = {exporter.EXPORTER_NAME: exporter for exporter in EXPORTERS}
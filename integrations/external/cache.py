@@ -0,0 +1,262 @@
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Iterator, NamedTuple, Self
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Response headers stored with the cached content
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# Seconds during which the access time of an entry is not updated again,
+# so most cache hits only read the database instead of waiting for its write lock
+ACCESSED_AT_UPDATE_INTERVAL = 5 * 60
+
+
+def make_cache_key(request: requests.PreparedRequest) -> str:
+    """
+    Key of the request, independent of the order of the query parameters, the case of the host
+    and the whitespace in the body. Headers (e.g. the rotating access tokens) are not part of the key.
+    """
+    url = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+    normalized_url = urlunsplit((url.scheme.lower(), url.netloc.lower(), url.path, query, ""))
+
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode()
+
+    key = f"{request.method} {normalized_url}\n".encode() + b" ".join(body.split())
+    return hashlib.sha256(key).hexdigest()
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    expires_at: float
+
+    @property
+    def is_fresh(self: Self) -> bool:
+        return self.expires_at > time.time()
+
+    def to_response(self: Self, request: requests.PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = HTTPStatus(self.status_code).phrase
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response.url = request.url
+        response.request = request
+        response.from_cache = True
+        return response
+
+
+class SQLiteDatabase:
+    """
+    SQLite database shared by all processes.
+
+    Each process opens a single connection, creating the schema, and its threads (or greenlets)
+    use it one at a time.
+    """
+
+    def __init__(self: Self, path: str, schema: tuple[str, ...]) -> None:
+        self.path = path
+        self.schema = schema
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connect(self: Self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            # A connection inherited from the parent process is not reused
+            if self._connection is None or self._pid != os.getpid():
+                self._connection = self._open()
+                self._pid = os.getpid()
+
+            yield self._connection
+
+    def _open(self: Self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in self.schema:
+            connection.execute(statement)
+
+        return connection
+
+    def close(self: Self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+class ResponseCache:
+    """
+    Responses of the external APIs stored in a SQLite database, shared by all processes and threads.
+
+    Entries are fresh for `ttl` seconds, stale entries with an ETag or Last-Modified header are revalidated
+    with a conditional request. The least recently used entries are evicted when the stored content
+    exceeds `max_size` bytes.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            content BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)",
+    )
+
+    def __init__(self: Self, path: str, ttl: int, max_size: int) -> None:
+        self.database = SQLiteDatabase(path, self.SCHEMA)
+        self.ttl = ttl
+        self.max_size = max_size
+
+    def get(self: Self, key: str) -> CachedResponse | None:
+        """
+        Get the response, stale or not, and mark it as recently used (at most every `ACCESSED_AT_UPDATE_INTERVAL`).
+        """
+        with self.database.connect() as connection:
+            row = connection.execute(
+                "SELECT status_code, headers, content, expires_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            status_code, headers, content, expires_at, accessed_at = row
+            now = time.time()
+            if now - accessed_at >= ACCESSED_AT_UPDATE_INTERVAL:
+                connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+
+        return CachedResponse(status_code, json.loads(headers), content, expires_at)
+
+    def set(self: Self, key: str, response: requests.Response) -> None:
+        content = response.content
+        if len(content) > self.max_size:
+            return
+
+        headers = {header: response.headers[header] for header in CACHED_HEADERS if header in response.headers}
+        now = time.time()
+        with self.database.connect() as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, json.dumps(headers), content, len(content), now + self.ttl, now),
+            )
+            self._evict(connection)
+
+    def refresh(self: Self, key: str) -> None:
+        """
+        Extend the freshness of the entry after a "304 Not Modified" response.
+        """
+        with self.database.connect() as connection:
+            connection.execute("UPDATE responses SET expires_at = ? WHERE key = ?", (time.time() + self.ttl, key))
+
+    def _evict(self: Self, connection: sqlite3.Connection) -> None:
+        """
+        Delete the least recently used entries over the maximum size.
+        """
+        connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS total_size FROM responses
+                ) WHERE total_size > ?
+            )
+            """,
+            (self.max_size,),
+        )
+
+    def clear(self: Self) -> None:
+        with self.database.connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+
+class CachingAdapter(BaseAdapter):
+    """
+    Transport adapter that serves the successful responses of `methods` from the response cache,
+    other requests are sent by the wrapped `adapter`.
+    """
+
+    def __init__(
+        self: Self, response_cache: ResponseCache, adapter: BaseAdapter, methods: tuple[str, ...] = ("GET",)
+    ) -> None:
+        super().__init__()
+        self.response_cache = response_cache
+        self.adapter = adapter
+        self.methods = methods
+
+    def send(self: Self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if request.method not in self.methods or kwargs.get("stream"):
+            return self.adapter.send(request, **kwargs)
+
+        key = make_cache_key(request)
+        cached_response = self.response_cache.get(key)
+        if cached_response is not None:
+            if cached_response.is_fresh:
+                return cached_response.to_response(request)
+
+            request = request.copy()
+            if etag := cached_response.headers.get("ETag"):
+                request.headers["If-None-Match"] = etag
+            if last_modified := cached_response.headers.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = self.adapter.send(request, **kwargs)
+        if cached_response is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            # Release the connection of the discarded response
+            response.close()
+            self.response_cache.refresh(key)
+            return cached_response.to_response(request)
+
+        if response.status_code == HTTPStatus.OK:
+            self.response_cache.set(key, response)
+
+        return response
+
+    def close(self: Self) -> None:
+        self.adapter.close()
+
+
+@functools.cache
+def get_response_cache() -> ResponseCache | None:
+    if not settings.EXTERNAL_API_CACHE_PATH:
+        return None
+
+    return ResponseCache(
+        settings.EXTERNAL_API_CACHE_PATH, settings.EXTERNAL_API_CACHE_TTL, settings.EXTERNAL_API_CACHE_MAX_SIZE
+    )
+
+
+def mount_response_cache(session: requests.Session, *prefixes: str, methods: tuple[str, ...] = ("GET",)) -> None:
+    """
+    Cache the responses of the session for the URLs starting with the prefixes, if the cache is enabled.
+
+    Wraps the adapters already mounted for the prefixes.
+    """
+    if (response_cache := get_response_cache()) is None:
+        return
+
+    for prefix in prefixes:
+        session.mount(prefix, CachingAdapter(response_cache, session.get_adapter(prefix), methods=methods))
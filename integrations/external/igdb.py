@@ -1,7 +1,14 @@
+from collections.abc import Iterable
+from http import HTTPStatus
 from io import BytesIO
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+
+from dome.metrics import external_api_response_hook
+from integrations.external.cache import mount_response_cache
+from integrations.external.transport import mount_provider_transport
 
 
 class IGDBClient:
@@ -12,40 +19,110 @@ class IGDBClient:
 
     BASE_API_URL = "https://api.igdb.com/v4"
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
+    IMAGE_BASE_URL = "https://images.igdb.com/igdb/image/upload"
 
-    def get_access_token(self) -> str:
-        url = self.AUTH_URL
-        url += f"?client_id={self.API_CLIENT_ID}"
-        url += f"&client_secret={self.API_CLIENT_SECRET}"
-        url += "&grant_type=client_credentials"
+    # Maximum number of queries in a single multiquery request
+    MULTIQUERY_MAX_QUERIES = 10
 
-        response = requests.post(url, timeout=5)
-        return response.json().get("access_token")
+    # The access token is shared by all processes through the cache
+    ACCESS_TOKEN_CACHE_KEY = "igdb-access-token"  # noqa: S105
+    # Seconds before its expiration when the access token is refreshed
+    ACCESS_TOKEN_REFRESH_MARGIN = 10 * 60
 
-    def search(self, query: str) -> dict:
-        url = f"{self.BASE_API_URL}/games"
-
-        headers = {
-            "Accept": "application/json",
-            "Client-ID": self.API_CLIENT_ID,
-            "Authorization": f"Bearer {self.get_access_token()}",
-        }
-
-        data = f'search "{query}";'
+    def __init__(self) -> None:
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json", "Client-ID": self.API_CLIENT_ID})
+        self.session.hooks["response"].append(external_api_response_hook("igdb"))
+        # The CDN of the images is not rate limited
+        mount_provider_transport(self.session, "igdb", self.BASE_API_URL)
+        mount_provider_transport(self.session, "igdb", self.IMAGE_BASE_URL, rate_limited=False)
+        # The API queries are sent as POST requests, the access token requests are not cached
+        mount_response_cache(self.session, self.BASE_API_URL, methods=("POST",))
+        mount_response_cache(self.session, self.IMAGE_BASE_URL)
+
+    def get_access_token(self, refresh: bool = False) -> str:
+        """
+        Get the cached access token, or request a new one if it is (about to be) expired or `refresh` is set.
+        """
+        if not refresh and (access_token := cache.get(self.ACCESS_TOKEN_CACHE_KEY)):
+            return access_token
+
+        response = self.session.post(
+            self.AUTH_URL,
+            params={
+                "client_id": self.API_CLIENT_ID,
+                "client_secret": self.API_CLIENT_SECRET,
+                "grant_type": "client_credentials",
+            },
+            timeout=5,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        cache.set(
+            self.ACCESS_TOKEN_CACHE_KEY,
+            data["access_token"],
+            max(data["expires_in"] - self.ACCESS_TOKEN_REFRESH_MARGIN, 0),
+        )
+        return data["access_token"]
+
+    def post(self, endpoint: str, data: str) -> requests.Response:
+        """
+        Send an APIcalypse query to the endpoint, retrying once with a new access token if it was rejected.
+        """
+        url = f"{self.BASE_API_URL}/{endpoint}"
+
+        response = self.session.post(
+            url, headers={"Authorization": f"Bearer {self.get_access_token()}"}, data=data, timeout=5
+        )
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            response = self.session.post(
+                url, headers={"Authorization": f"Bearer {self.get_access_token(refresh=True)}"}, data=data, timeout=5
+            )
+
+        return response
+
+    def _get_search_query(self, query: str) -> str:
+        escaped_query = query.replace('"', '\\"')
+        data = f'search "{escaped_query}";'
         data += "fields name, cover.image_id, first_release_date, platforms.name, summary, genres.name, "
         data += "websites.type.type, websites.url, "
         data += "involved_companies.developer, involved_companies.publisher, involved_companies.company.name;"
         data += "limit 1;"
+        return data
 
-        response = self.session.post(url, headers=headers, data=data, timeout=5)
+    def search(self, query: str) -> dict:
+        response = self.post("games", self._get_search_query(query))
+        response.raise_for_status()
         return response.json()
 
+    def search_many(self, queries: Iterable[str]) -> dict[str, list[dict]]:
+        """
+        Search games for each of the queries, `MULTIQUERY_MAX_QUERIES` per request.
+
+        Return the results of each query, like `search`.
+        """
+        queries = list(dict.fromkeys(queries))
+        results = {}
+        for i in range(0, len(queries), self.MULTIQUERY_MAX_QUERIES):
+            batch = queries[i : i + self.MULTIQUERY_MAX_QUERIES]
+            # The queries are named by their index, the names are returned with the results
+            data = "".join(
+                f'query games "{index}" {{{self._get_search_query(query)}}};' for index, query in enumerate(batch)
+            )
+
+            response = self.post("multiquery", data)
+            response.raise_for_status()
+            for query_results in response.json():
+                results[batch[int(query_results["name"])]] = query_results["result"]
+
+        return results
+
     def get_cover_image(self, image_id: str) -> BytesIO:
-        url = f"https://images.igdb.com/igdb/image/upload/t_cover_big/{image_id}.webp"
+        url = f"{self.IMAGE_BASE_URL}/t_cover_big/{image_id}.webp"
 
         response = self.session.get(url, timeout=5)
+        response.raise_for_status()
         return BytesIO(response.content)
 
 
@@ -4,6 +4,10 @@ from io import BytesIO
 import requests
 from django.conf import settings
 
+from dome.metrics import external_api_response_hook
+from integrations.external.cache import mount_response_cache
+from integrations.external.transport import mount_provider_transport
+
 
 class TMDBSupportedEntityType(StrEnum):
     MOVIE = "movie"
@@ -19,6 +23,10 @@ class TMDBClient:
 
     def __init__(self) -> None:
         self.session = requests.Session()
+        self.session.hooks["response"].append(external_api_response_hook("tmdb"))
+        mount_provider_transport(self.session, "tmdb", self.BASE_API_URL)
+        mount_provider_transport(self.session, "tmdb", self.IMAGE_SECURE_BASE_URL, rate_limited=False)
+        mount_response_cache(self.session, self.BASE_API_URL, self.IMAGE_SECURE_BASE_URL)
         self.session.headers.update(
             {
                 "accept": "application/json",
@@ -30,18 +38,21 @@ class TMDBClient:
         url = f"{self.BASE_API_URL}/search/{entity_type}?query={query}&include_adult=false&language=en-US&page=1"
 
         response = self.session.get(url, timeout=5)
+        response.raise_for_status()
         return response.json()
 
     def get_details(self, entity_type: TMDBSupportedEntityType, entity_id: int) -> dict:
         url = f"{self.BASE_API_URL}/{entity_type}/{entity_id}?append_to_response=credits"
 
         response = self.session.get(url, timeout=5)
+        response.raise_for_status()
         return response.json()
 
     def get_image(self, size: str, path: str) -> BytesIO:
         url = f"{self.IMAGE_SECURE_BASE_URL}/{size}{path}"
 
         response = self.session.get(url, timeout=5)
+        response.raise_for_status()
         return BytesIO(response.content)
 
 
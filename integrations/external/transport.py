@@ -0,0 +1,280 @@
+import email.utils
+import functools
+import logging
+import random
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Self
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from integrations.external.cache import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+# Requests per second allowed by the APIs of the providers, shared by all processes,
+# see https://developer.themoviedb.org/docs/rate-limiting and https://api-docs.igdb.com/#rate-limits
+PROVIDER_RATE_LIMITS = {"tmdb": 40, "igdb": 4}
+
+RETRY_STATUS_CODES = (
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+MAX_RETRIES = 3
+# Seconds, doubled with each retry
+RETRY_BACKOFF_FACTOR = 0.5
+# Longest wait before a retry, a longer `Retry-After` is not waited for
+MAX_RETRY_DELAY = 30
+
+# Consecutive failed requests after which no requests are sent to the provider for `CIRCUIT_RECOVERY_TIMEOUT` seconds
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 30
+
+
+class ProviderUnavailableError(requests.ConnectionError):
+    pass
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing `rate` requests per second on average and bursts of up to `capacity` requests.
+
+    Shared by the threads of a process.
+    """
+
+    def __init__(self: Self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self: Self) -> None:
+        """
+        Take a token, waiting until one is available.
+        """
+        while delay := self.try_acquire():
+            time.sleep(delay)
+
+    def try_acquire(self: Self) -> float:
+        """
+        Take a token if one is available, otherwise return the seconds until there is one.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens, delay = self.take_token(self.tokens, now - self.updated_at)
+            self.updated_at = now
+
+        return delay
+
+    def take_token(self: Self, tokens: float, elapsed: float) -> tuple[float, float]:
+        """
+        Refill the tokens for the elapsed seconds and take one,
+        return the remaining tokens and the seconds to wait (0 if the token was taken).
+        """
+        tokens = min(self.capacity, tokens + max(elapsed, 0) * self.rate)
+        if tokens >= 1:
+            return tokens - 1, 0
+
+        return tokens, (1 - tokens) / self.rate
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket kept in a SQLite database, shared by all processes.
+
+    The tokens are taken inside an immediate transaction, so the processes take them one at a time.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS rate_limits (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+    )
+
+    def __init__(self: Self, database: SQLiteDatabase, name: str, rate: float, capacity: float | None = None) -> None:
+        super().__init__(rate, capacity)
+        self.database = database
+        self.name = name
+
+    def try_acquire(self: Self) -> float:
+        with self.database.connect() as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            # Wall clock time, the monotonic clocks of the processes are not comparable
+            now = time.time()
+            cursor = connection.execute("SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,))
+            tokens, updated_at = cursor.fetchone() or (self.capacity, now)
+            tokens, delay = self.take_token(tokens, now - updated_at)
+            connection.execute("INSERT OR REPLACE INTO rate_limits VALUES (?, ?, ?)", (self.name, tokens, now))
+
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests to a provider that keeps failing.
+
+    After `failure_threshold` consecutive failures the circuit opens and requests fail immediately,
+    every `recovery_timeout` seconds a single request is let through and closes the circuit if it succeeds.
+    """
+
+    def __init__(
+        self: Self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_RECOVERY_TIMEOUT,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow_request(self: Self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+
+            now = time.monotonic()
+            if now - self.opened_at < self.recovery_timeout:
+                return False
+
+            # Let this request through, the others wait for its result (or another `recovery_timeout`)
+            self.opened_at = now
+            return True
+
+    def record_success(self: Self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self: Self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+@functools.cache
+def get_rate_limits_database() -> SQLiteDatabase:
+    return SQLiteDatabase(settings.EXTERNAL_API_CACHE_PATH, SharedTokenBucket.SCHEMA)
+
+
+@functools.cache
+def get_rate_limiter(provider: str) -> TokenBucket:
+    """
+    Rate limiter of the provider, shared by all processes through the response cache database if it is enabled,
+    otherwise by the threads of the process only.
+    """
+    if settings.EXTERNAL_API_CACHE_PATH:
+        return SharedTokenBucket(get_rate_limits_database(), provider, PROVIDER_RATE_LIMITS[provider])
+
+    return TokenBucket(PROVIDER_RATE_LIMITS[provider])
+
+
+@functools.cache
+def get_circuit_breaker(provider: str, prefix: str) -> CircuitBreaker:
+    """
+    Circuit breaker of the provider's URLs starting with the prefix, e.g. failures of the image CDN
+    do not stop the requests to the API.
+    """
+    return CircuitBreaker()
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """
+    Seconds to wait from the `Retry-After` header, in seconds or as an HTTP date.
+    """
+    if (retry_after := response.headers.get("Retry-After")) is None:
+        return None
+
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+
+    try:
+        return max(email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderAdapter(HTTPAdapter):
+    """
+    Transport adapter of the requests to the provider's URLs starting with the prefix.
+
+    Requests are rate limited per provider (if `rate_limited`) and retried with a jittered exponential backoff
+    on connection errors, timeouts, 429 and 5xx responses, honouring `Retry-After`.
+    The last response is returned when the retries run out, failed requests open the circuit of the prefix.
+    """
+
+    def __init__(self: Self, provider: str, prefix: str, rate_limited: bool = True, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.provider = provider
+        self.prefix = prefix
+        self.rate_limiter = get_rate_limiter(provider) if rate_limited else None
+        self.circuit_breaker = get_circuit_breaker(provider, prefix)
+
+    def get_retry_delay(self: Self, attempt: int, response: requests.Response | None) -> float:
+        if response is not None and (retry_after := get_retry_after(response)) is not None:
+            return retry_after
+
+        return random.uniform(0, min(RETRY_BACKOFF_FACTOR * 2**attempt, MAX_RETRY_DELAY))  # noqa: S311
+
+    def send(self: Self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if not self.circuit_breaker.allow_request():
+            raise ProviderUnavailableError(f"Too many failed requests to {self.prefix}.", request=request)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            response = None
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= MAX_RETRIES:
+                    self.circuit_breaker.record_failure()
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.circuit_breaker.record_success()
+                    return response
+
+                if attempt >= MAX_RETRIES:
+                    self.circuit_breaker.record_failure()
+                    return response
+
+            delay = self.get_retry_delay(attempt, response)
+            if delay > MAX_RETRY_DELAY:
+                self.circuit_breaker.record_failure()
+                return response
+
+            logger.warning(
+                "Retrying external API request",
+                extra={"provider": self.provider, "attempt": attempt + 1, "delay": round(delay, 2)},
+            )
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+
+def mount_provider_transport(
+    session: requests.Session, provider: str, *prefixes: str, rate_limited: bool = True
+) -> None:
+    """
+    Send the requests of the session to the URLs starting with the prefixes through the provider's transport.
+    """
+    for prefix in prefixes:
+        session.mount(prefix, ProviderAdapter(provider, prefix, rate_limited=rate_limited))
@@ -1,6 +1,12 @@
+from typing import Any, Self
+
 from django import forms
+from django.core import signing
+from django.utils import timezone
 
+from integrations.exporters import EXPORTER_MAPPING, CSVExporter, JSONExporter, NDJSONExporter, parse_sync_token
 from integrations.importers import GoodreadsImporter, SimklImporter
+from tracking.models import TOMBSTONE_RETENTION_PERIOD
 
 
 class ImportTrackingDataForm(forms.Form):
@@ -11,3 +17,42 @@ class ImportTrackingDataForm(forms.Form):
         )
     )
     import_file = forms.FileField()
+
+
+class ExportTrackingDataForm(forms.Form):
+    export_format = forms.ChoiceField(
+        choices=(
+            (CSVExporter.EXPORTER_NAME, "CSV (.csv)"),
+            (JSONExporter.EXPORTER_NAME, "JSON (.json)"),
+            (NDJSONExporter.EXPORTER_NAME, "NDJSON (.ndjson)"),
+        ),
+        initial=CSVExporter.EXPORTER_NAME,
+        required=False,
+    )
+    compress = forms.BooleanField(required=False, label="Compress (gzip)")
+
+    # Incremental export parameters, mutually exclusive
+    since = forms.DateTimeField(required=False)
+    sync_token = forms.CharField(required=False)
+
+    def clean(self: Self) -> dict[str, Any]:
+        cleaned_data = super().clean()
+        cleaned_data["export_format"] = cleaned_data.get("export_format") or CSVExporter.EXPORTER_NAME
+
+        if cleaned_data.get("sync_token"):
+            if cleaned_data.get("since"):
+                raise forms.ValidationError("Pass either a timestamp or a sync token, not both.")
+
+            try:
+                cleaned_data["since"] = parse_sync_token(cleaned_data["sync_token"])
+            except signing.BadSignature as e:
+                raise forms.ValidationError("Invalid sync token.") from e
+
+        if (since := cleaned_data.get("since")) and since < timezone.now() - TOMBSTONE_RETENTION_PERIOD:
+            raise forms.ValidationError("The deletions made this long ago are no longer kept, do a full export.")
+
+        exporter_class = EXPORTER_MAPPING.get(cleaned_data["export_format"])
+        if cleaned_data.get("since") and exporter_class and not exporter_class.SUPPORTS_INCREMENTAL:
+            raise forms.ValidationError("Incremental exports are only available in the JSON and NDJSON formats.")
+
+        return cleaned_data
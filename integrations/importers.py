@@ -1,33 +1,96 @@
 import csv
+import io
 import logging
 from abc import ABC, abstractmethod
-from itertools import tee
-from typing import ClassVar, Self
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from typing import Callable, ClassVar, Iterable, Iterator, Self
 
 import magic
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.files import File
+from django.utils import timezone
+from django.utils.text import slugify
 
-from entities.models import Book, Movie, Show
+from entities.models import Book, EntityBase, Movie, Show
+from tracking.cache import bump_library_version
+from tracking.helpers import get_tracking_statuses
 from tracking.models import TrackingObject
+from tracking.statistics import rebuild_library_statistics
 from users.models import User
 
 logger = logging.getLogger(__name__)
 
 
+def add_slug_suffix(slug: str, suffix: int, max_length: int) -> str:
+    """
+    Return the slug with a numeric suffix (none for 1), truncated to fit into `max_length`.
+    """
+    if suffix == 1:
+        return slug
+
+    ending = f"-{suffix}"
+    return slug[: max_length - len(ending)] + ending
+
+
+def parse_completed_at(value: str | None, date_format: str | None = None) -> datetime | None:
+    """
+    Parse a completion date from a source file, in the given format or ISO 8601.
+
+    Missing or invalid dates are left unset, the time of the import is not a completion date.
+    """
+    if not value:
+        return None
+
+    try:
+        completed_at = datetime.strptime(value, date_format) if date_format else datetime.fromisoformat(value)
+    except ValueError:
+        logger.warning("Invalid completion date, leaving it unset", extra={"value": value})
+        return None
+
+    return completed_at if timezone.is_aware(completed_at) else timezone.make_aware(completed_at)
+
+
 class BaseImporter(ABC):
     IMPORTER_NAME: str
 
     ALLOWED_MIME_TYPES: tuple[str, ...]
 
-    def __init__(self: Self, user: User, source_file: File) -> None:
+    # Maximum number of error messages kept for reporting
+    MAX_ERRORS = 100
+
+    def __init__(
+        self: Self,
+        user: User,
+        source_file: File,
+        on_progress: Callable[["BaseImporter"], None] | None = None,
+    ) -> None:
         self.user = user
         self.source_file = source_file
+        self.on_progress = on_progress
+
+        self.rows_processed = 0
+        self.rows_created = 0
+        self.errors: list[str] = []
+
+    def add_error(self: Self, message: str) -> None:
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append(message)
+
+    def report_progress(self: Self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self)
 
     def run(self: Self) -> None:
         self.validate()
-        self.import_data()
+        try:
+            self.import_data()
+        finally:
+            # The tracking objects are bulk-created without sending signals
+            rebuild_library_statistics(self.user)
+            bump_library_version(self.user.pk)
 
     @abstractmethod
     def validate(self: Self) -> None: ...
@@ -39,13 +102,133 @@ class BaseImporter(ABC):
 class CSVImporter(BaseImporter):
     ALLOWED_MIME_TYPES = ("text/csv", "text/plain")
 
+    # Number of bytes from the start of the file used to detect its type
+    MIME_TYPE_SNIFF_SIZE = 8192
+
+    # Number of rows read and imported (entities, then tracking objects) at once
+    ROWS_CHUNK_SIZE = 500
+
+    # Number of titles resolved to entities with a single query
+    RESOLVE_CHUNK_SIZE = 500
+
     def validate(self: Self) -> None:
-        detected_mime_type = magic.from_buffer(self.source_file.read(), mime=True)
+        detected_mime_type = magic.from_buffer(self.source_file.read(self.MIME_TYPE_SNIFF_SIZE), mime=True)
         if detected_mime_type not in self.ALLOWED_MIME_TYPES:
             raise ValidationError("Invalid file type.")
 
         self.source_file.seek(0)
 
+    def iter_row_chunks(self: Self) -> Iterator[list[dict[str, str]]]:
+        """
+        Read the file as CSV rows, decoding it incrementally, and yield them in chunks.
+        """
+        text_stream = io.TextIOWrapper(self.source_file, encoding="utf-8", newline="")
+        try:
+            csv_reader = csv.DictReader(text_stream)
+            while rows := list(islice(csv_reader, self.ROWS_CHUNK_SIZE)):
+                yield rows
+        finally:
+            # Do not close the source file together with the wrapper
+            text_stream.detach()
+
+    def import_data(self: Self) -> None:
+        for rows in self.iter_row_chunks():
+            tracking_objs = self.import_rows(rows)
+
+            self.rows_processed += len(rows)
+            self.rows_created += len(tracking_objs)
+            self.report_progress()
+
+        logger.debug(
+            "Imported objects", extra={"rows_processed": self.rows_processed, "created_objs": self.rows_created}
+        )
+
+    @abstractmethod
+    def import_rows(self: Self, rows: list[dict[str, str]]) -> list[TrackingObject]:
+        """
+        Import a chunk of rows and return the tracking objects created from them.
+        """
+
+    def resolve_entity_pks(self: Self, model: type[EntityBase], titles: Iterable[str]) -> dict[str, int]:
+        """
+        Map titles to primary keys of matching entities (by name or alias, case-insensitively)
+        using one query per chunk of titles.
+        """
+        titles = list(dict.fromkeys(titles))
+        entity_pks = {}
+        for i in range(0, len(titles), self.RESOLVE_CHUNK_SIZE):
+            entity_pks.update(model.objects.get_pks_by_names(titles[i : i + self.RESOLVE_CHUNK_SIZE]))
+
+        return entity_pks
+
+    def get_or_create_entity_pks(self: Self, model: type[EntityBase], entities: list[EntityBase]) -> dict[str, int]:
+        """
+        Map names of the given (unsaved) entities to primary keys of existing matching entities,
+        bulk-creating only the entities that do not exist yet.
+        """
+        entity_pks = self.resolve_entity_pks(model, (entity.name for entity in entities))
+
+        # A single entity is created for the rows with the same title
+        new_entities_by_name = {}
+        for entity in entities:
+            if entity.name not in entity_pks:
+                new_entities_by_name.setdefault(entity.name.lower(), entity)
+        new_entities = list(new_entities_by_name.values())
+
+        self.set_unique_slugs(model, new_entities)
+        model.objects.bulk_create(new_entities, ignore_conflicts=True)
+        entity_pks.update(self.resolve_entity_pks(model, (entity.name for entity in new_entities)))
+
+        return entity_pks
+
+    def set_unique_slugs(self: Self, model: type[EntityBase], entities: list[EntityBase]) -> None:
+        """
+        Set the slugs of the new entities from their names, made unique among them and the existing entities
+        with a numeric suffix. Names without any characters allowed in slugs fall back to the entity type.
+        """
+        max_length = model._meta.get_field("slug").max_length
+        base_slugs = [
+            slugify(entity.name, allow_unicode=True)[:max_length] or model._meta.model_name for entity in entities
+        ]
+
+        taken_slugs = set()
+        pending = list(range(len(entities)))
+        suffix = 1
+        while pending:
+            candidates = defaultdict(list)
+            for i in pending:
+                candidates[add_slug_suffix(base_slugs[i], suffix, max_length)].append(i)
+            taken_slugs.update(
+                model.objects.filter(slug__in=candidates.keys()).order_by().values_list("slug", flat=True)
+            )
+
+            pending = []
+            for slug, indices in candidates.items():
+                if slug not in taken_slugs:
+                    entities[indices.pop(0)].slug = slug
+                    taken_slugs.add(slug)
+                pending.extend(indices)
+
+            suffix += 1
+
+    def create_tracking_objects(self: Self, tracking_objs: list[TrackingObject]) -> list[TrackingObject]:
+        """
+        Bulk-create the tracking objects of the entities the user does not track yet and return the created ones.
+        """
+        object_ids_by_content_type_id = defaultdict(list)
+        for obj in tracking_objs:
+            object_ids_by_content_type_id[obj.content_type_id].append(obj.object_id)
+        existing_keys = get_tracking_statuses(self.user, object_ids_by_content_type_id).keys()
+
+        # The first row of an entity wins, as with conflicting inserts
+        new_tracking_objs = {}
+        for obj in tracking_objs:
+            if (key := (obj.content_type_id, obj.object_id)) not in existing_keys:
+                new_tracking_objs.setdefault(key, obj)
+
+        # Conflicts are still possible if the library is changed during the import
+        return TrackingObject.objects.bulk_create(new_tracking_objs.values(), ignore_conflicts=True)
+
 
 class GoodreadsImporter(CSVImporter):
     IMPORTER_NAME = "goodreads_csv"
@@ -56,12 +239,9 @@ class GoodreadsImporter(CSVImporter):
         "to-read": TrackingObject.Status.PLANNED,
     }
 
-    def import_data(self: Self) -> None:
-        csv_reader_entities, csv_reader_tracking = tee(
-            csv.DictReader(self.source_file.read().decode("utf-8").splitlines())
-        )
+    def import_rows(self: Self, rows: list[dict[str, str]]) -> list[TrackingObject]:
         entities = []
-        for row in csv_reader_entities:
+        for row in rows:
             authors = [row["Author"]]
             authors.extend(row["Additional Authors"].split(","))
             authors = [" ".join(author.split()).strip() for author in authors if author]
@@ -77,27 +257,40 @@ class GoodreadsImporter(CSVImporter):
             )
             entities.append(obj)
 
-        Book.objects.bulk_create(entities, ignore_conflicts=True)
+        content_type = ContentType.objects.get_for_model(Book)
+        book_pks = self.get_or_create_entity_pks(Book, entities)
 
         tracking_objs = []
-        for row in csv_reader_tracking:
+        for row in rows:
+            if (book_pk := book_pks.get(row["Title"])) is None:
+                logger.warning("Book not found, skipping row", extra={"title": row["Title"]})
+                self.add_error(f"Book '{row['Title']}' could not be imported.")
+                continue
+
             notes = row["My Review"]
             if notes:
                 notes += "\n\n"
             notes += f"Imported from Goodreads (id: {row['Book Id']})"
 
+            status = self.STATUS_MAPPING[row["Exclusive Shelf"]]
             obj = TrackingObject(
-                content_type=ContentType.objects.get_for_model(Book),
-                object_id=Book.objects.get(name=row["Title"]).pk,
+                content_type=content_type,
+                object_id=book_pk,
                 user=self.user,
-                status=self.STATUS_MAPPING[row["Exclusive Shelf"]],
+                status=status,
+                completed_at=(
+                    parse_completed_at(row["Date Read"], "%Y/%m/%d")
+                    if status == TrackingObject.Status.COMPLETED
+                    else None
+                ),
                 rating=rating if (rating := int(row["My Rating"])) else None,
                 notes=notes,
             )
             tracking_objs.append(obj)
 
-        created_objs = TrackingObject.objects.bulk_create(tracking_objs, ignore_conflicts=True)
-        logger.debug("Imported objects", extra={"created_objs": len(created_objs)})
+        tracking_objs = self.create_tracking_objects(tracking_objs)
+        TrackingObject.objects.filter(user=self.user).sync_entity_sort_keys(Book, book_pks.values())
+        return tracking_objs
 
 
 class SimklImporter(CSVImporter):
@@ -125,42 +318,52 @@ class SimklImporter(CSVImporter):
             release_date=release_date,
         )
 
-    def import_data(self: Self) -> None:
-        csv_reader_entities, csv_reader_tracking = tee(
-            csv.DictReader(self.source_file.read().decode("utf-8").splitlines())
-        )
+    def import_rows(self: Self, rows: list[dict[str, str]]) -> list[TrackingObject]:
         movies_entities = []
         shows_entities = []
-        for row in csv_reader_entities:
+        for row in rows:
             if row["Type"] == "movie":
                 movies_entities.append(self._import_movie(row))
             else:
                 shows_entities.append(self._import_show(row))
 
-        Movie.objects.bulk_create(movies_entities, ignore_conflicts=True)
-        Show.objects.bulk_create(shows_entities, ignore_conflicts=True)
+        content_types = ContentType.objects.get_for_models(Movie, Show)
+        entity_pks = {
+            Movie: self.get_or_create_entity_pks(Movie, movies_entities),
+            Show: self.get_or_create_entity_pks(Show, shows_entities),
+        }
 
         tracking_objs = []
-        for row in csv_reader_tracking:
+        for row in rows:
             row_model = Movie if row["Type"] == "movie" else Show
+            if (entity_pk := entity_pks[row_model].get(row["Title"])) is None:
+                logger.warning("Entity not found, skipping row", extra={"title": row["Title"], "type": row["Type"]})
+                self.add_error(f"{row_model._meta.verbose_name.title()} '{row['Title']}' could not be imported.")
+                continue
 
             notes = row["Memo"]
             if notes:
                 notes += "\n\n"
             notes += f"Imported from Simkl (id: {row['SIMKL_ID']})"
 
+            status = self.STATUS_MAPPING[row["Watchlist"]]
             obj = TrackingObject(
-                content_type=ContentType.objects.get_for_model(row_model),
-                object_id=row_model.objects.get(name=row["Title"]).pk,
+                content_type=content_types[row_model],
+                object_id=entity_pk,
                 user=self.user,
-                status=self.STATUS_MAPPING[row["Watchlist"]],
+                status=status,
+                completed_at=(
+                    parse_completed_at(row["WatchedDate"]) if status == TrackingObject.Status.COMPLETED else None
+                ),
                 rating=int(rating) // 2 if (rating := row["Rating"]) else None,
                 notes=notes,
             )
             tracking_objs.append(obj)
 
-        created_objs = TrackingObject.objects.bulk_create(tracking_objs, ignore_conflicts=True)
-        logger.debug("Imported objects", extra={"created_objs": len(created_objs)})
+        tracking_objs = self.create_tracking_objects(tracking_objs)
+        for model, pks in entity_pks.items():
+            TrackingObject.objects.filter(user=self.user).sync_entity_sort_keys(model, pks.values())
+        return tracking_objs
 
 
 FRONTEND_IMPORTERS = [
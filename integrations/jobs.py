@@ -0,0 +1,66 @@
+import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from integrations.importers import IMPORTER_MAPPING, BaseImporter
+from integrations.models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+
+def _save_progress(job: ImportJob, importer: BaseImporter) -> None:
+    job.rows_processed = importer.rows_processed
+    job.rows_created = importer.rows_created
+    job.errors = importer.errors
+    # Also updated as a heartbeat, see `ImportJobQuerySet.stale`
+    job.updated_at = timezone.now()
+    ImportJob.objects.filter(pk=job.pk).update(
+        rows_processed=job.rows_processed, rows_created=job.rows_created, errors=job.errors, updated_at=job.updated_at
+    )
+
+
+def run_import_job(job: ImportJob) -> None:
+    """
+    Run the importer of a claimed job, recording its progress and outcome on the job.
+    The uploaded file is deleted once the job is finished.
+    """
+    logger.info("Running import job", extra={"job_id": job.pk, "importer_name": job.importer_name})
+
+    try:
+        importer_class = IMPORTER_MAPPING[job.importer_name]
+        with job.source_file.open("rb") as source_file:
+            importer = importer_class(job.user, source_file, on_progress=lambda importer: _save_progress(job, importer))
+            importer.run()
+    except Exception as e:
+        logger.exception("Import job failed", extra={"job_id": job.pk})
+        job.status = ImportJob.Status.FAILED
+        job.errors = [*job.errors, f"Import failed: {e}"]
+    else:
+        job.status = ImportJob.Status.COMPLETED
+
+    job.finished_at = timezone.now()
+    job.source_file.delete(save=False)
+    job.save()
+
+    logger.info(
+        "Import job finished",
+        extra={"job_id": job.pk, "status": job.get_status_display(), "rows_processed": job.rows_processed},
+    )
+
+
+def fail_stale_import_jobs(timeout: timedelta) -> int:
+    """
+    Mark the stale running jobs as failed, so they do not stay running forever after a worker crashed.
+    Return the number of failed jobs.
+    """
+    stale_jobs = list(ImportJob.objects.stale(timeout))
+    for job in stale_jobs:
+        logger.warning("Failing stale import job", extra={"job_id": job.pk, "updated_at": job.updated_at})
+        job.status = ImportJob.Status.FAILED
+        job.errors = [*job.errors, "Import was interrupted, please upload the file again."]
+        job.finished_at = timezone.now()
+        job.source_file.delete(save=False)
+        job.save()
+
+    return len(stale_jobs)
@@ -0,0 +1,67 @@
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from integrations.jobs import fail_stale_import_jobs, run_import_job
+from integrations.models import ImportJob
+from tracking.models import TrackingObjectTombstone
+
+# Number of seconds between the deletions of the expired tombstones
+TOMBSTONES_PRUNE_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = "Process queued import jobs"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Number of seconds to wait before checking for new jobs when the queue is empty (default: 2)",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=float,
+            default=3600,
+            help=(
+                "Number of seconds without progress after which running jobs (e.g. of a crashed worker) "
+                "are failed when the worker starts (default: 3600)"
+            ),
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of waiting for new jobs",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        poll_interval = options["poll_interval"]
+
+        self.stdout.write(self.style.SUCCESS("Import worker started"))
+
+        if stale_jobs_count := fail_stale_import_jobs(timedelta(seconds=options["stale_timeout"])):
+            self.stdout.write(self.style.WARNING(f"Failed {stale_jobs_count} stale import jobs"))
+
+        tombstones_pruned_at = None
+        while True:
+            # The worker also deletes the tombstones no longer reported to the incremental exports
+            if tombstones_pruned_at is None or time.monotonic() - tombstones_pruned_at >= TOMBSTONES_PRUNE_INTERVAL:
+                tombstones_count, _ = TrackingObjectTombstone.objects.expired().delete()
+                tombstones_pruned_at = time.monotonic()
+                if tombstones_count:
+                    self.stdout.write(f"Deleted {tombstones_count} expired tombstones")
+
+            job = ImportJob.objects.claim_next()
+            if job is None:
+                if options["once"]:
+                    break
+
+                time.sleep(poll_interval)
+                continue
+
+            self.stdout.write(f"Processing import job (ID: {job.pk})...")
+            run_import_job(job)
+            self.stdout.write(f"Import job (ID: {job.pk}) finished with status: {job.get_status_display()}")
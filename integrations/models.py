@@ -0,0 +1,88 @@
+import random
+import string
+from datetime import timedelta
+from pathlib import Path
+from typing import ClassVar, Self
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from dome.common.models import TimestampedModel
+
+
+def import_file_upload_destination(instance: models.Model, filename: str) -> str:
+    ext = Path(filename).suffix
+    random_string = "".join(random.choices(string.ascii_letters + string.digits, k=14))  # noqa: S311
+    return f"integrations/imports/{random_string}{ext}"
+
+
+class ImportJobQuerySet(models.QuerySet):
+    def claim_next(self: Self) -> "ImportJob | None":
+        """
+        Mark the oldest queued job as running and return it.
+        The status check in the update makes sure that a job is only claimed by a single worker.
+        """
+        with transaction.atomic():
+            job = self.filter(status=ImportJob.Status.QUEUED).order_by("created_at").first()
+            if job is None:
+                return None
+
+            started_at = timezone.now()
+            claimed = self.filter(pk=job.pk, status=ImportJob.Status.QUEUED).update(
+                status=ImportJob.Status.RUNNING, started_at=started_at, updated_at=started_at
+            )
+            if not claimed:
+                return None
+
+        job.status = ImportJob.Status.RUNNING
+        job.started_at = started_at
+        job.updated_at = started_at
+        return job
+
+    def stale(self: Self, timeout: timedelta) -> Self:
+        """
+        Running jobs without any progress for `timeout`, e.g. left by a worker that crashed.
+        """
+        return self.filter(status=ImportJob.Status.RUNNING, updated_at__lt=timezone.now() - timeout)
+
+
+class ImportJob(TimestampedModel):
+    """
+    Import of tracking data, executed out of band by the `run_import_worker` command.
+    """
+
+    class Status(models.IntegerChoices):
+        QUEUED = 0, "Queued"
+        RUNNING = 1, "Running"
+        COMPLETED = 2, "Completed"
+        FAILED = 3, "Failed"
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+
+    importer_name = models.CharField(max_length=64)
+    source_file = models.FileField(upload_to=import_file_upload_destination, blank=True)
+
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.QUEUED)
+
+    rows_processed = models.PositiveIntegerField(default=0)
+    rows_created = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ImportJobQuerySet.as_manager()
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes: ClassVar = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self: Self) -> str:
+        return f"{self.importer_name} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self: Self) -> bool:
+        return self.status in (self.Status.COMPLETED, self.Status.FAILED)
@@ -0,0 +1,14 @@
+from typing import Any
+
+from django.db.models.signals import post_delete
+from django.db.transaction import on_commit
+from django.dispatch import receiver
+
+from integrations.models import ImportJob
+
+
+@receiver(post_delete, sender=ImportJob)
+def delete_source_file_on_job_deletion(instance: ImportJob, **kwargs: Any) -> None:
+    """Delete the uploaded file in storage when the job is deleted."""
+
+    on_commit(lambda: instance.source_file.delete(save=False))
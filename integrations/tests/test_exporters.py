@@ -0,0 +1,145 @@
+import csv
+import gzip
+import json
+from datetime import timedelta
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from entities.factories import BookFactory, GameFactory, MovieFactory
+from entities.models import Platform
+from integrations.exporters import BaseExporter, CSVExporter, JSONExporter, NDJSONExporter, make_sync_token
+from tracking.models import TOMBSTONE_RETENTION_PERIOD, TrackingObject
+
+User = get_user_model()
+
+
+class ExporterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        for i in range(5):
+            TrackingObject.objects.create(user=cls.user, content_object=MovieFactory(name=f"Movie {i}"), rating=4)
+            TrackingObject.objects.create(user=cls.user, content_object=BookFactory(name=f"Book {i}"))
+
+        cls.orphaned_game = GameFactory(name="Orphaned")
+        cls.orphaned_game.platforms.add(Platform.objects.create(name="PC"))
+        TrackingObject.objects.create(user=cls.user, content_object=cls.orphaned_game)
+
+    def _get_exported_content(self: Self, exporter: BaseExporter) -> str:
+        content = b"".join(exporter.get_streaming_response().streaming_content)
+        if exporter.compress:
+            content = gzip.decompress(content)
+        return content.decode()
+
+    def _get_exported_rows(self: Self, exporter: BaseExporter) -> list[list[str]]:
+        return list(csv.reader(self._get_exported_content(exporter).splitlines()))
+
+    def test_export(self: Self) -> None:
+        rows = self._get_exported_rows(CSVExporter(self.user, "export"))
+
+        self.assertEqual(rows[0], ["Title", "Type", "Status", "Rating", "Notes"])
+        self.assertEqual(len(rows), 12)
+        self.assertIn(["Movie 0", "Movie", "Completed", "4", ""], rows)
+
+    def test_export_query_count_is_bounded_by_entity_types(self: Self) -> None:
+        exporter = CSVExporter(self.user, "export")
+        exporter.CHUNK_SIZE = 4
+
+        # A query for the tracking objects and one per entity type in each of the 3 chunks
+        with self.assertNumQueries(8):
+            self._get_exported_rows(exporter)
+
+    def test_export_skips_missing_entities(self: Self) -> None:
+        TrackingObject.objects.filter(object_id=self.orphaned_game.pk, content_type__model="game").update(
+            object_id=self.orphaned_game.pk + 1000
+        )
+
+        rows = self._get_exported_rows(CSVExporter(self.user, "export"))
+
+        self.assertEqual(len(rows), 11)
+
+    def test_export_json(self: Self) -> None:
+        records = json.loads(self._get_exported_content(JSONExporter(self.user, "export")))
+
+        self.assertEqual(len(records), 11)
+        game_record = next(record for record in records if record["entity"]["type"] == "game")
+        self.assertEqual(game_record["entity"]["name"], "Orphaned")
+        self.assertEqual(game_record["entity"]["platforms"], ["PC"])
+        self.assertIn("steam_url", game_record["entity"])
+        self.assertIn("updated_at", game_record)
+
+    def test_export_ndjson(self: Self) -> None:
+        lines = self._get_exported_content(NDJSONExporter(self.user, "export")).splitlines()
+
+        self.assertEqual(len(lines), 11)
+        self.assertEqual(json.loads(lines[0])["entity"]["name"], "Movie 0")
+
+    def test_export_compressed(self: Self) -> None:
+        exporter = CSVExporter(self.user, "export", compress=True)
+        response = exporter.get_streaming_response()
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn('filename="export.csv.gz"', response["Content-Disposition"])
+        self.assertEqual(len(self._get_exported_rows(exporter)), 12)
+
+    def test_export_view(self: Self) -> None:
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse("integrations:export-tracking-data"), {"export_format": "ndjson", "compress": "on"}
+        )
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(len(content.splitlines()), 11)
+
+        response = self.client.get(reverse("integrations:export-tracking-data"), {"export_format": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_incremental_export(self: Self) -> None:
+        since = timezone.now()
+        TrackingObject.objects.filter(user=self.user).update(updated_at=since - timedelta(days=1))
+        changed_obj = TrackingObject.objects.filter(user=self.user).first()
+        changed_obj.save()
+        TrackingObject.objects.filter(user=self.user).last().delete()
+
+        records = json.loads(self._get_exported_content(JSONExporter(self.user, "export", since=since)))
+
+        self.assertEqual(len(records), 2)
+        self.assertTrue(records[0]["deleted"])
+        self.assertEqual(records[1]["entity"]["id"], changed_obj.object_id)
+
+    def test_incremental_export_view_with_sync_token(self: Self) -> None:
+        self.client.force_login(self.user)
+        url = reverse("integrations:export-tracking-data")
+
+        response = self.client.get(url, {"export_format": "ndjson"})
+        sync_token = response["X-Sync-Token"]
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 11)
+
+        TrackingObject.objects.filter(user=self.user).first().save()
+
+        response = self.client.get(url, {"export_format": "ndjson", "sync_token": sync_token})
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 1)
+
+        response = self.client.get(url, {"export_format": "ndjson", "sync_token": sync_token + "x"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(url, {"export_format": "csv", "sync_token": make_sync_token(timezone.now())})
+        self.assertEqual(response.status_code, 400)
+
+    def test_expired_sync_token_rejected(self: Self) -> None:
+        self.client.force_login(self.user)
+        sync_token = make_sync_token(timezone.now() - TOMBSTONE_RETENTION_PERIOD - timedelta(days=1))
+
+        response = self.client.get(
+            reverse("integrations:export-tracking-data"), {"export_format": "ndjson", "sync_token": sync_token}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("full export", response.content.decode())
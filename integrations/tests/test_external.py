@@ -0,0 +1,101 @@
+from typing import Any, Self
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from requests import Response
+
+from integrations.external.igdb import IGDBClient
+
+
+def make_response(status_code: int, data: Any) -> Response:
+    response = mock.Mock(spec=Response)
+    response.status_code = status_code
+    response.json.return_value = data
+    return response
+
+
+def token_response(access_token: str, expires_in: int = 5000000) -> Response:
+    return make_response(200, {"access_token": access_token, "expires_in": expires_in, "token_type": "bearer"})
+
+
+class IGDBClientAccessTokenTestCase(SimpleTestCase):
+    """Tests for the caching and refreshing of the IGDB access token."""
+
+    def setUp(self: Self) -> None:
+        cache.clear()
+        self.client = IGDBClient()
+
+    def _get_authorizations(self: Self, post: mock.Mock) -> list[str]:
+        return [call.kwargs["headers"]["Authorization"] for call in post.call_args_list if "headers" in call.kwargs]
+
+    def test_token_reused_between_searches(self: Self) -> None:
+        with mock.patch.object(self.client.session, "post") as post:
+            post.side_effect = [token_response("first"), make_response(200, []), make_response(200, [])]
+            self.client.search("Hades")
+            self.client.search("Celeste")
+
+        self.assertEqual(post.call_count, 3)
+        self.assertEqual(self._get_authorizations(post), ["Bearer first", "Bearer first"])
+
+    def test_token_shared_through_cache(self: Self) -> None:
+        with mock.patch.object(self.client.session, "post", return_value=token_response("first")):
+            self.client.get_access_token()
+
+        # E.g. in another process
+        other_client = IGDBClient()
+        with mock.patch.object(other_client.session, "post") as post:
+            self.assertEqual(other_client.get_access_token(), "first")
+        post.assert_not_called()
+
+    def test_token_refreshed_before_expiry(self: Self) -> None:
+        with mock.patch.object(self.client.session, "post") as post:
+            post.side_effect = [
+                token_response("first", expires_in=IGDBClient.ACCESS_TOKEN_REFRESH_MARGIN),
+                token_response("second"),
+            ]
+            self.assertEqual(self.client.get_access_token(), "first")
+            self.assertEqual(self.client.get_access_token(), "second")
+
+    def test_token_refreshed_on_unauthorized(self: Self) -> None:
+        with mock.patch.object(self.client.session, "post") as post:
+            post.side_effect = [
+                token_response("revoked"),
+                make_response(401, {"message": "Authorization Failure"}),
+                token_response("second"),
+                make_response(200, [{"name": "Hades"}]),
+            ]
+            self.assertEqual(self.client.search("Hades"), [{"name": "Hades"}])
+
+        self.assertEqual(self._get_authorizations(post), ["Bearer revoked", "Bearer second"])
+        self.assertEqual(cache.get(IGDBClient.ACCESS_TOKEN_CACHE_KEY), "second")
+
+
+class IGDBClientSearchManyTestCase(SimpleTestCase):
+    """Tests for the batched search of games with multiqueries."""
+
+    def setUp(self: Self) -> None:
+        self.client = IGDBClient()
+
+    def _multiquery_response(self: Self, endpoint: str, data: str) -> Response:
+        query_count = data.count("query games")
+        return make_response(200, [{"name": str(i), "result": [{"id": i}]} for i in range(query_count)])
+
+    def test_queries_batched(self: Self) -> None:
+        names = [f"Game {i}" for i in range(12)]
+
+        with mock.patch.object(self.client, "post", side_effect=self._multiquery_response) as post:
+            results = self.client.search_many([*names, "Game 0"])
+
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual({call.args[0] for call in post.call_args_list}, {"multiquery"})
+        self.assertEqual(post.call_args_list[0].args[1].count("query games"), IGDBClient.MULTIQUERY_MAX_QUERIES)
+        self.assertEqual(results["Game 0"], [{"id": 0}])
+        self.assertEqual(results["Game 11"], [{"id": 1}])
+        self.assertEqual(len(results), 12)
+
+    def test_query_quotes_escaped(self: Self) -> None:
+        with mock.patch.object(self.client, "post", side_effect=self._multiquery_response) as post:
+            self.client.search_many(['"Weird" Game'])
+
+        self.assertIn('search "\\"Weird\\" Game";', post.call_args.args[1])
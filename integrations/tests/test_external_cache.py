@@ -0,0 +1,160 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Self
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase
+from requests.adapters import HTTPAdapter
+
+from integrations.external.cache import ACCESSED_AT_UPDATE_INTERVAL, ResponseCache, mount_response_cache
+
+
+def make_response(status_code: int, content: bytes = b"", headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+class ResponseCacheTestCase(SimpleTestCase):
+    """Tests for the cache of the external API responses."""
+
+    def setUp(self: Self) -> None:
+        self.path = Path(tempfile.mkdtemp()) / "cache.sqlite3"
+        self.response_cache = ResponseCache(str(self.path), ttl=60, max_size=1024)
+        self.addCleanup(self.response_cache.database.close)
+
+        self.session = requests.Session()
+        with mock.patch("integrations.external.cache.get_response_cache", return_value=self.response_cache):
+            mount_response_cache(self.session, "https://api.example.com")
+            mount_response_cache(self.session, "https://query.example.com", methods=("POST",))
+
+        patcher = mock.patch.object(HTTPAdapter, "send")
+        self.send = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _execute(self: Self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with self.response_cache.database.connect() as connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def _expire(self: Self) -> None:
+        self._execute("UPDATE responses SET expires_at = ?", (time.time() - 1,))
+
+    def _get_accessed_at(self: Self) -> list[float]:
+        return [row[0] for row in self._execute("SELECT accessed_at FROM responses")]
+
+    def test_fresh_response_served_from_cache(self: Self) -> None:
+        self.send.return_value = make_response(200, b'{"results": []}', {"Content-Type": "application/json"})
+
+        self.session.get("https://api.example.com/search?query=Hades&page=1")
+        response = self.session.get("https://API.example.com/search?page=1&query=Hades")
+
+        self.assertEqual(self.send.call_count, 1)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.json(), {"results": []})
+
+        self.session.get("https://api.example.com/search?query=Celeste&page=1")
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_post_body_is_part_of_key(self: Self) -> None:
+        self.send.return_value = make_response(200, b"[]")
+
+        self.session.post("https://query.example.com/games", data='search "Hades"; limit 1;')
+        self.session.post("https://query.example.com/games", data='search "Hades";\nlimit 1;')
+        self.session.post("https://query.example.com/games", data='search "Celeste"; limit 1;')
+
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_unsuccessful_responses_not_cached(self: Self) -> None:
+        self.send.return_value = make_response(500)
+
+        self.session.get("https://api.example.com/search")
+        self.session.get("https://api.example.com/search")
+
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_stale_response_revalidated(self: Self) -> None:
+        self.send.return_value = make_response(200, b"poster", {"ETag": '"v1"'})
+        self.session.get("https://api.example.com/poster.jpg")
+        self._expire()
+
+        not_modified_response = make_response(304)
+        self.send.return_value = not_modified_response
+        with mock.patch.object(not_modified_response, "close") as close:
+            response = self.session.get("https://api.example.com/poster.jpg")
+
+        close.assert_called_once()
+        self.assertEqual(self.send.call_args.args[0].headers["If-None-Match"], '"v1"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"poster")
+
+        # Fresh again after the revalidation
+        self.session.get("https://api.example.com/poster.jpg")
+        self.assertEqual(self.send.call_count, 2)
+
+    def test_stale_response_replaced(self: Self) -> None:
+        self.send.return_value = make_response(200, b"old", {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        self.session.get("https://api.example.com/poster.jpg")
+        self._expire()
+
+        self.send.return_value = make_response(200, b"new")
+        self.session.get("https://api.example.com/poster.jpg")
+
+        self.assertEqual(self.send.call_args.args[0].headers["If-Modified-Since"], "Wed, 21 Oct 2015 07:28:00 GMT")
+        self.assertEqual(self.session.get("https://api.example.com/poster.jpg").content, b"new")
+
+    def test_least_recently_used_evicted(self: Self) -> None:
+        self.send.side_effect = lambda request, **kwargs: make_response(200, b"x" * 400)
+
+        self.session.get("https://api.example.com/1")
+        self.session.get("https://api.example.com/2")
+        self._execute("UPDATE responses SET accessed_at = accessed_at - ?", (ACCESSED_AT_UPDATE_INTERVAL,))
+        # Mark the first one as recently used
+        self.session.get("https://api.example.com/1")
+        self.session.get("https://api.example.com/3")
+        self.assertEqual(self.send.call_count, 3)
+
+        self.session.get("https://api.example.com/1")
+        self.session.get("https://api.example.com/3")
+        self.assertEqual(self.send.call_count, 3)
+
+        self.session.get("https://api.example.com/2")
+        self.assertEqual(self.send.call_count, 4)
+
+    def test_access_time_not_updated_on_every_hit(self: Self) -> None:
+        self.send.return_value = make_response(200, b"[]")
+        self.session.get("https://api.example.com/search")
+        accessed_at = self._get_accessed_at()
+
+        with mock.patch("integrations.external.cache.time.time", return_value=accessed_at[0] + 1):
+            self.session.get("https://api.example.com/search")
+
+        self.assertEqual(self._get_accessed_at(), accessed_at)
+
+    def test_connection_shared_by_threads(self: Self) -> None:
+        self.send.return_value = make_response(200, b"[]")
+        self.session.get("https://api.example.com/search")
+
+        with mock.patch("integrations.external.cache.sqlite3.connect") as connect:
+            threads = [
+                threading.Thread(target=self.session.get, args=("https://api.example.com/search",)) for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        connect.assert_not_called()
+        self.assertEqual(self.send.call_count, 1)
+
+    def test_not_mounted_urls_not_cached(self: Self) -> None:
+        self.send.return_value = make_response(200, b"token")
+
+        self.session.post("https://id.example.com/token")
+        self.session.post("https://id.example.com/token")
+
+        self.assertEqual(self.send.call_count, 2)
@@ -0,0 +1,187 @@
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import Self
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+from requests.adapters import HTTPAdapter
+
+from integrations.external.cache import SQLiteDatabase
+from integrations.external.transport import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    MAX_RETRIES,
+    PROVIDER_RATE_LIMITS,
+    CircuitBreaker,
+    ProviderUnavailableError,
+    SharedTokenBucket,
+    TokenBucket,
+    get_circuit_breaker,
+    get_rate_limiter,
+    get_rate_limits_database,
+    mount_provider_transport,
+)
+
+
+def make_response(status_code: int, headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = BytesIO(b"{}")
+    response.headers.update(headers or {})
+    return response
+
+
+class ProviderAdapterTestCase(SimpleTestCase):
+    """Tests for the retries and the circuit breaking of the external API requests."""
+
+    def setUp(self: Self) -> None:
+        get_circuit_breaker.cache_clear()
+        self.addCleanup(get_circuit_breaker.cache_clear)
+
+        self.session = requests.Session()
+        mount_provider_transport(self.session, "tmdb", "https://api.example.com", rate_limited=False)
+        mount_provider_transport(self.session, "tmdb", "https://images.example.com", rate_limited=False)
+
+        send_patcher = mock.patch.object(HTTPAdapter, "send")
+        self.send = send_patcher.start()
+        self.addCleanup(send_patcher.stop)
+
+        sleep_patcher = mock.patch("integrations.external.transport.time.sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_retried_until_success(self: Self) -> None:
+        self.send.side_effect = [make_response(503), requests.ConnectionError(), make_response(200)]
+
+        response = self.session.get("https://api.example.com/search")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.send.call_count, 3)
+        # Jittered exponential backoff
+        first_delay, second_delay = (call.args[0] for call in self.sleep.call_args_list)
+        self.assertLessEqual(first_delay, 0.5)
+        self.assertLessEqual(second_delay, 1)
+
+    def test_retry_after_honoured(self: Self) -> None:
+        self.send.side_effect = [make_response(429, {"Retry-After": "2"}), make_response(200)]
+
+        self.session.get("https://api.example.com/search")
+
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_long_retry_after_not_waited_for(self: Self) -> None:
+        self.send.return_value = make_response(429, {"Retry-After": "3600"})
+
+        response = self.session.get("https://api.example.com/search")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.send.call_count, 1)
+        self.sleep.assert_not_called()
+
+    def test_last_response_returned_after_retries(self: Self) -> None:
+        self.send.side_effect = lambda request, **kwargs: make_response(500)
+
+        response = self.session.get("https://api.example.com/search")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.send.call_count, MAX_RETRIES + 1)
+        with self.assertRaises(requests.HTTPError):
+            response.raise_for_status()
+
+    def test_client_errors_not_retried(self: Self) -> None:
+        self.send.return_value = make_response(404)
+
+        self.session.get("https://api.example.com/search")
+
+        self.assertEqual(self.send.call_count, 1)
+
+    def test_circuit_opened_after_failures(self: Self) -> None:
+        self.send.side_effect = requests.ConnectionError()
+
+        for _i in range(CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(requests.ConnectionError):
+                self.session.get("https://api.example.com/search")
+
+        self.send.reset_mock()
+        with self.assertRaises(ProviderUnavailableError):
+            self.session.get("https://api.example.com/search")
+        self.send.assert_not_called()
+
+    def test_circuits_of_prefixes_independent(self: Self) -> None:
+        self.send.side_effect = requests.ConnectionError()
+        for _i in range(CIRCUIT_FAILURE_THRESHOLD):
+            with self.assertRaises(requests.ConnectionError):
+                self.session.get("https://images.example.com/poster.jpg")
+
+        self.send.side_effect = None
+        self.send.return_value = make_response(200)
+        self.assertEqual(self.session.get("https://api.example.com/search").status_code, 200)
+
+
+class CircuitBreakerTestCase(SimpleTestCase):
+    @mock.patch("integrations.external.transport.time.monotonic")
+    def test_single_request_let_through_after_recovery_timeout(self: Self, monotonic: mock.Mock) -> None:
+        circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+        monotonic.return_value = 0
+        circuit_breaker.record_failure()
+        self.assertTrue(circuit_breaker.allow_request())
+        circuit_breaker.record_failure()
+        self.assertFalse(circuit_breaker.allow_request())
+
+        monotonic.return_value = 31
+        self.assertTrue(circuit_breaker.allow_request())
+        self.assertFalse(circuit_breaker.allow_request())
+
+        circuit_breaker.record_success()
+        self.assertTrue(circuit_breaker.allow_request())
+
+
+class RateLimiterTestCase(SimpleTestCase):
+    def setUp(self: Self) -> None:
+        get_rate_limiter.cache_clear()
+        self.addCleanup(get_rate_limiter.cache_clear)
+
+        get_rate_limits_database.cache_clear()
+        self.addCleanup(get_rate_limits_database.cache_clear)
+
+    @override_settings(EXTERNAL_API_CACHE_PATH="")
+    def test_rate_limit_of_process(self: Self) -> None:
+        rate_limiter = get_rate_limiter("igdb")
+        self.assertNotIsInstance(rate_limiter, SharedTokenBucket)
+        self.assertEqual(rate_limiter.rate, PROVIDER_RATE_LIMITS["igdb"])
+
+    def test_rate_limit_shared_by_processes(self: Self) -> None:
+        path = str(Path(tempfile.mkdtemp()) / "cache.sqlite3")
+        with override_settings(EXTERNAL_API_CACHE_PATH=path):
+            rate_limiter = get_rate_limiter("igdb")
+        self.addCleanup(rate_limiter.database.close)
+        self.assertIsInstance(rate_limiter, SharedTokenBucket)
+        self.assertEqual(rate_limiter.rate, PROVIDER_RATE_LIMITS["igdb"])
+
+        # The bucket of another process, with its own connection
+        other_database = SQLiteDatabase(path, SharedTokenBucket.SCHEMA)
+        self.addCleanup(other_database.close)
+        other_rate_limiter = SharedTokenBucket(other_database, "igdb", PROVIDER_RATE_LIMITS["igdb"])
+
+        with mock.patch("integrations.external.transport.time.time", return_value=1000):
+            for _i in range(2):
+                self.assertEqual(rate_limiter.try_acquire(), 0)
+                self.assertEqual(other_rate_limiter.try_acquire(), 0)
+            self.assertEqual(other_rate_limiter.try_acquire(), 0.25)
+            self.assertEqual(rate_limiter.try_acquire(), 0.25)
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    @mock.patch("integrations.external.transport.time.sleep")
+    @mock.patch("integrations.external.transport.time.monotonic", return_value=0)
+    def test_waits_when_rate_exceeded(self: Self, monotonic: mock.Mock, sleep: mock.Mock) -> None:
+        sleep.side_effect = lambda delay: setattr(monotonic, "return_value", monotonic.return_value + delay)
+        token_bucket = TokenBucket(rate=4)
+
+        for _i in range(4):
+            token_bucket.acquire()
+        sleep.assert_not_called()
+
+        token_bucket.acquire()
+        sleep.assert_called_once_with(0.25)
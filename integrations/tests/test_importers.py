@@ -0,0 +1,134 @@
+from datetime import UTC, date, datetime
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from entities.factories import BookFactory, MovieFactory
+from entities.models import Book, Movie, Show
+from integrations.importers import GoodreadsImporter, SimklImporter
+from tracking.models import TrackingObject
+
+User = get_user_model()
+
+GOODREADS_HEADER = (
+    "Book Id,Title,Author,Additional Authors,Original Publication Year,My Rating,Exclusive Shelf,My Review,Date Read"
+)
+
+SIMKL_HEADER = "SIMKL_ID,Title,Type,Year,Watchlist,Rating,Memo,WatchedDate"
+
+
+def make_csv_file(*lines: str) -> SimpleUploadedFile:
+    return SimpleUploadedFile("export.csv", "\n".join(lines).encode(), content_type="text/csv")
+
+
+class GoodreadsImporterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+    def test_import(self: Self) -> None:
+        existing_book = BookFactory(name="Solaris")
+        source_file = make_csv_file(
+            GOODREADS_HEADER,
+            "1,SOLARIS,Stanislaw Lem,,1961,5,read,,2020/01/31",
+            "2,The Cyberiad,Stanislaw Lem,,1965,0,to-read,Great",
+            "3,His Master's Voice,Stanislaw Lem,,1968,4,currently-reading,",
+        )
+
+        # The import itself and 5 queries rebuilding the library statistics
+        importer = GoodreadsImporter(self.user, source_file)
+        with self.assertNumQueries(13):
+            importer.run()
+
+        self.assertEqual(importer.rows_created, 3)
+        self.assertEqual(Book.objects.count(), 3)
+        tracking_objs = TrackingObject.objects.filter(user=self.user)
+        self.assertEqual(tracking_objs.count(), 3)
+        self.assertEqual(tracking_objs.get(object_id=existing_book.pk).rating, 5)
+        self.assertEqual(tracking_objs.get(object_id=existing_book.pk).entity_name, "Solaris")
+        self.assertEqual(tracking_objs.get(object_id=existing_book.pk).completed_at.date(), date(2020, 1, 31))
+
+    def test_import_duplicate_titles(self: Self) -> None:
+        source_file = make_csv_file(
+            GOODREADS_HEADER,
+            "1,Fiasco,Stanislaw Lem,,1986,3,read,",
+            "2,Fiasco,Stanislaw Lem,,1986,4,read,",
+        )
+
+        importer = GoodreadsImporter(self.user, source_file)
+        importer.run()
+
+        self.assertEqual(importer.rows_created, 1)
+        self.assertEqual(Book.objects.filter(name="Fiasco").count(), 1)
+        tracking_obj = TrackingObject.objects.get(user=self.user)
+        self.assertEqual(tracking_obj.rating, 3)
+        self.assertIsNone(tracking_obj.completed_at)
+
+    def test_import_titles_with_same_slug(self: Self) -> None:
+        BookFactory(name="Solaris!", slug="solaris")
+        source_file = make_csv_file(
+            GOODREADS_HEADER,
+            "1,Solaris?,Stanislaw Lem,,1961,5,read,",
+            "2,Solaris.,Stanislaw Lem,,1961,5,read,",
+            "3,Солярис,Stanislaw Lem,,1961,5,read,",
+            "4,???,Stanislaw Lem,,1961,5,read,",
+        )
+
+        importer = GoodreadsImporter(self.user, source_file)
+        importer.run()
+
+        self.assertEqual(importer.rows_created, 4)
+        self.assertEqual(
+            set(Book.objects.values_list("slug", flat=True)), {"solaris", "solaris-2", "solaris-3", "солярис", "book"}
+        )
+
+    def test_import_already_tracked(self: Self) -> None:
+        TrackingObject.objects.create(user=self.user, content_object=BookFactory(name="Fiasco"), rating=1)
+        source_file = make_csv_file(GOODREADS_HEADER, "1,Fiasco,Stanislaw Lem,,1986,3,read,")
+
+        importer = GoodreadsImporter(self.user, source_file)
+        importer.run()
+
+        self.assertEqual(importer.rows_processed, 1)
+        self.assertEqual(importer.rows_created, 0)
+        self.assertEqual(TrackingObject.objects.get(user=self.user).rating, 1)
+
+
+class SimklImporterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+    def test_import(self: Self) -> None:
+        existing_movie = MovieFactory(name="Justice", aliases=["Napad"])
+        source_file = make_csv_file(
+            SIMKL_HEADER,
+            "1,Napad,movie,2024,completed,8,,2024-05-01T20:00:00Z",
+            "2,Arcane,tv,2021,watching,,",
+            "3,Dune,movie,2021,plan to watch,,Soon",
+        )
+
+        SimklImporter(self.user, source_file).run()
+
+        self.assertEqual(Movie.objects.count(), 2)
+        self.assertEqual(Show.objects.count(), 1)
+        tracking_objs = TrackingObject.objects.filter(user=self.user)
+        self.assertEqual(tracking_objs.count(), 3)
+        tracking_obj = tracking_objs.get(object_id=existing_movie.pk, content_type__model="movie")
+        self.assertEqual(tracking_obj.rating, 4)
+        self.assertEqual(tracking_obj.completed_at, datetime(2024, 5, 1, 20, tzinfo=UTC))
+
+    def test_import_in_chunks(self: Self) -> None:
+        source_file = make_csv_file(
+            SIMKL_HEADER,
+            *(f"{i},Movie {i},movie,2000,completed,,Ponder Stibbons" for i in range(5)),
+        )
+
+        importer = SimklImporter(self.user, source_file)
+        importer.ROWS_CHUNK_SIZE = 2
+        importer.run()
+
+        self.assertEqual(Movie.objects.count(), 5)
+        self.assertEqual(TrackingObject.objects.filter(user=self.user).count(), 5)
@@ -0,0 +1,103 @@
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from typing import Self
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from dome.common.tests import AuthenticatedTestCase
+from entities.factories import MovieFactory
+from integrations.importers import SimklImporter
+from integrations.models import ImportJob
+from integrations.tests.test_importers import SIMKL_HEADER, make_csv_file
+from tracking.models import TOMBSTONE_RETENTION_PERIOD, TrackingObject, TrackingObjectTombstone
+
+TEST_STORAGES = {
+    **settings.STORAGES,
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": tempfile.mkdtemp()},
+    },
+}
+
+
+@override_settings(STORAGES=TEST_STORAGES)
+class ImportJobTestCase(AuthenticatedTestCase):
+    def _upload(self: Self, *lines: str) -> None:
+        return self.client.post(
+            reverse("integrations:import-tracking-data"),
+            {"import_format": SimklImporter.IMPORTER_NAME, "import_file": make_csv_file(*lines)},
+        )
+
+    def test_import_is_queued_and_run_by_worker(self: Self) -> None:
+        response = self._upload(SIMKL_HEADER, "1,Arcane,tv,2021,watching,,", "2,Missing,unknown,0,dropped,,")
+
+        self.assertRedirects(response, reverse("integrations:import-tracking-data"))
+        job = ImportJob.objects.get(user=self.user)
+        self.assertEqual(job.status, ImportJob.Status.QUEUED)
+        self.assertFalse(TrackingObject.objects.filter(user=self.user).exists())
+
+        call_command("run_import_worker", "--once", stdout=StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.Status.COMPLETED)
+        self.assertEqual(job.rows_processed, 2)
+        self.assertEqual(job.rows_created, 2)
+        self.assertFalse(job.source_file)
+        self.assertEqual(TrackingObject.objects.filter(user=self.user).count(), 2)
+
+    def test_failed_import_is_recorded(self: Self) -> None:
+        self._upload(SIMKL_HEADER, "1,Arcane,tv,2021,unknown-status,,")
+
+        call_command("run_import_worker", "--once", stdout=StringIO())
+
+        job = ImportJob.objects.get(user=self.user)
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertTrue(job.errors)
+
+    def test_stale_running_jobs_failed_on_worker_start(self: Self) -> None:
+        self._upload(SIMKL_HEADER, "1,Arcane,tv,2021,watching,,")
+        self._upload(SIMKL_HEADER, "1,Dune,movie,2021,plan to watch,,")
+        stale_job, running_job = ImportJob.objects.order_by("created_at")
+        ImportJob.objects.filter(pk=stale_job.pk).update(
+            status=ImportJob.Status.RUNNING, updated_at=timezone.now() - timedelta(hours=2)
+        )
+        ImportJob.objects.filter(pk=running_job.pk).update(status=ImportJob.Status.RUNNING)
+
+        call_command("run_import_worker", "--once", stdout=StringIO())
+
+        stale_job.refresh_from_db()
+        self.assertEqual(stale_job.status, ImportJob.Status.FAILED)
+        self.assertTrue(stale_job.errors)
+        self.assertFalse(stale_job.source_file)
+        running_job.refresh_from_db()
+        self.assertEqual(running_job.status, ImportJob.Status.RUNNING)
+
+    def test_expired_tombstones_deleted_by_worker(self: Self) -> None:
+        tracking_objs = [
+            TrackingObject.objects.create(user=self.user, content_object=MovieFactory()) for _i in range(2)
+        ]
+        for obj in tracking_objs:
+            obj.delete()
+        expired_tombstone = TrackingObjectTombstone.objects.get(object_id=tracking_objs[0].object_id)
+        TrackingObjectTombstone.objects.filter(pk=expired_tombstone.pk).update(
+            deleted_at=timezone.now() - TOMBSTONE_RETENTION_PERIOD - timedelta(days=1)
+        )
+
+        call_command("run_import_worker", "--once", stdout=StringIO())
+
+        self.assertFalse(TrackingObjectTombstone.objects.filter(pk=expired_tombstone.pk).exists())
+        self.assertEqual(TrackingObjectTombstone.objects.filter(user=self.user).count(), 1)
+
+    def test_import_jobs_are_polled_while_pending(self: Self) -> None:
+        self._upload(SIMKL_HEADER, "1,Arcane,tv,2021,watching,,")
+
+        response = self.client.get(reverse("integrations:import-jobs"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["has_pending_import_jobs"])
+        self.assertContains(response, "hx-trigger")
@@ -1,10 +1,11 @@
 from django.urls import path
 
-from integrations.views import ExportTrackingDataView, ImportTrackingDataView
+from integrations.views import ExportTrackingDataView, ImportJobsView, ImportTrackingDataView
 
 app_name = "integrations"
 
 urlpatterns = [
     path("import/", ImportTrackingDataView.as_view(), name="import-tracking-data"),
+    path("import/jobs/", ImportJobsView.as_view(), name="import-jobs"),
     path("export/", ExportTrackingDataView.as_view(), name="export-tracking-data"),
 ]
@@ -1,15 +1,29 @@
 from datetime import datetime
-from typing import Self
+from typing import Any, Self
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
 from django.urls import reverse_lazy
-from django.views.generic import FormView, View
+from django.views.generic import FormView, TemplateView, View
 
-from integrations.exporters import Exporter
-from integrations.forms import ImportTrackingDataForm
+from integrations.exporters import EXPORTER_MAPPING
+from integrations.forms import ExportTrackingDataForm, ImportTrackingDataForm
 from integrations.importers import IMPORTER_MAPPING
+from integrations.models import ImportJob
+from users.models import User
+
+# Number of the most recent import jobs shown on the import page
+RECENT_IMPORT_JOBS_COUNT = 5
+
+
+def get_import_jobs_context(user: User) -> dict[str, Any]:
+    import_jobs = list(ImportJob.objects.filter(user=user)[:RECENT_IMPORT_JOBS_COUNT])
+    return {
+        "import_jobs": import_jobs,
+        "has_pending_import_jobs": any(not job.is_finished for job in import_jobs),
+    }
 
 
 class ImportTrackingDataView(LoginRequiredMixin, FormView):
@@ -19,20 +33,61 @@ class ImportTrackingDataView(LoginRequiredMixin, FormView):
 
     success_url = reverse_lazy("integrations:import-tracking-data")
 
+    def get_context_data(self: Self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context.update(get_import_jobs_context(self.request.user))
+        context["export_form"] = ExportTrackingDataForm()
+        return context
+
     def form_valid(self: Self, form: ImportTrackingDataForm) -> HttpResponse:
-        importer_class = IMPORTER_MAPPING.get(form.cleaned_data["import_format"])
+        importer_name = form.cleaned_data["import_format"]
+        importer_class = IMPORTER_MAPPING.get(importer_name)
         if not importer_class:
             raise ValueError("Invalid import format")
 
+        # Only the file type is validated here, the import itself is run by the import worker
         importer = importer_class(self.request.user, form.cleaned_data["import_file"])
-        importer.run()
+        try:
+            importer.validate()
+        except ValidationError as e:
+            form.add_error("import_file", e)
+            return self.form_invalid(form)
+
+        ImportJob.objects.create(
+            user=self.request.user,
+            importer_name=importer_name,
+            source_file=form.cleaned_data["import_file"],
+        )
 
-        messages.add_message(self.request, messages.SUCCESS, "Your tracking data has been imported.")
+        messages.add_message(self.request, messages.SUCCESS, "Your tracking data will be imported in the background.")
 
         return super().form_valid(form)
 
 
+class ImportJobsView(LoginRequiredMixin, TemplateView):
+    """
+    Renders the status of the recent import jobs, polled by the import page.
+    """
+
+    template_name = "integrations/partials/import_jobs.html"
+
+    def get_context_data(self: Self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context.update(get_import_jobs_context(self.request.user))
+        return context
+
+
 class ExportTrackingDataView(LoginRequiredMixin, View):
     def get(self: Self, request: HttpRequest) -> HttpResponse:
-        exporter = Exporter(request.user, f"dome_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}")
+        form = ExportTrackingDataForm(request.GET)
+        if not form.is_valid():
+            return HttpResponseBadRequest(form.errors.as_text(), content_type="text/plain")
+
+        exporter_class = EXPORTER_MAPPING[form.cleaned_data["export_format"]]
+        exporter = exporter_class(
+            request.user,
+            f"dome_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}",
+            compress=form.cleaned_data["compress"],
+            since=form.cleaned_data["since"],
+        )
         return exporter.get_streaming_response()
@@ -0,0 +1,132 @@
+from collections import Counter, defaultdict
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+
+from entities.mappings import get_model_from_entity_type
+from entities.models import EntityBase
+from tracking.cache import bump_library_version
+from tracking.forms import TrackingObjectForm
+from tracking.models import TrackingObject
+from tracking.statistics import get_movie_minutes, get_statistic_key, update_library_statistics
+from users.models import User
+
+# Maximum number of operations accepted in a single bulk update
+MAX_BULK_OPERATIONS = 500
+
+# Fields of the existing TrackingObjects overwritten by the bulk update
+BULK_UPDATE_FIELDS = ("status", "rating", "notes", "completed_at", "updated_at")
+
+
+def _get_operation_entity_key(operation: dict[str, Any]) -> tuple[type[EntityBase], int]:
+    """
+    Raise `ValueError` or `TypeError` if the operation does not reference an entity.
+    """
+    if not isinstance(operation, dict):
+        raise TypeError("Operation must be an object.")
+
+    model = get_model_from_entity_type(str(operation.get("entity_type")))
+    pk = operation.get("pk")
+    if isinstance(pk, bool) or not isinstance(pk, int):
+        raise TypeError("Entity pk must be an integer.")
+
+    return model, pk
+
+
+def apply_tracking_operations(user: User, operations: list[Any]) -> list[dict[str, Any]]:
+    """
+    Create or update the user's TrackingObjects from a list of operations
+    (`entity_type`, `pk` and any of `status`, `rating` and `notes`) in a single transaction.
+
+    Each operation is validated like a `TrackingObjectForm` submission, the invalid ones are skipped.
+    Return the result of each operation, in the same order.
+
+    `bulk_create` does not send signals, so the statistics and the library version
+    maintained by the receivers are updated here, with the same per-object changes.
+    """
+    results: list[dict[str, Any]] = [{} for _operation in operations]
+    entity_keys: dict[int, tuple[type[EntityBase], int]] = {}
+    for index, operation in enumerate(operations):
+        try:
+            entity_keys[index] = _get_operation_entity_key(operation)
+        except (ValueError, TypeError) as e:
+            results[index] = {"ok": False, "errors": {"__all__": [str(e)]}}
+
+    pks_by_model: dict[type[EntityBase], set[int]] = defaultdict(set)
+    for model, pk in entity_keys.values():
+        pks_by_model[model].add(pk)
+
+    # One query per entity type for the entities and one for the existing TrackingObjects
+    entities: dict[tuple[type[EntityBase], int], EntityBase] = {}
+    for model, pks in pks_by_model.items():
+        entities.update(((model, entity.pk), entity) for entity in model.objects.filter(pk__in=pks).order_by())
+
+    existing_objs = {}
+    if pks_by_model:
+        content_type_ids = {model: ContentType.objects.get_for_model(model).id for model in pks_by_model}
+        existing_objs = {
+            (obj.content_type_id, obj.object_id): obj
+            for obj in TrackingObject.objects.filter(
+                user=user,
+                content_type_id__in=content_type_ids.values(),
+                object_id__in={pk for _model, pk in entity_keys.values()},
+            )
+        }
+
+    now = timezone.now()
+    tracking_objs = {}
+    statistic_counts = Counter()
+    statistic_minutes = Counter()
+    for index, (model, pk) in entity_keys.items():
+        result = {"entity_type": model._meta.verbose_name, "pk": pk}
+        results[index] = result
+
+        if (entity := entities.get((model, pk))) is None:
+            result.update(ok=False, errors={"__all__": ["Entity not found."]})
+            continue
+
+        if (content_type_ids[model], pk) in tracking_objs:
+            result.update(ok=False, errors={"__all__": ["Duplicate operation for the entity."]})
+            continue
+
+        existing_obj = existing_objs.get((content_type_ids[model], pk))
+        # Taken before the form updates the existing object
+        previous_key = get_statistic_key(existing_obj) if existing_obj is not None else None
+        data = {key: value for key, value in operations[index].items() if key not in ("entity_type", "pk")}
+        form = TrackingObjectForm(data=data, instance=existing_obj, entity=entity, user=user)
+        if not form.is_valid():
+            result.update(ok=False, errors=form.errors.get_json_data())
+            continue
+
+        obj = form.save(commit=False)
+        if obj.status != TrackingObject.Status.COMPLETED:
+            obj.completed_at = None
+        elif existing_obj is None or existing_obj.completed_at is None:
+            obj.completed_at = now
+        if existing_obj is None:
+            obj.set_entity_sort_keys(entity)
+
+        tracking_objs[(content_type_ids[model], pk)] = obj
+        result.update(ok=True, created=existing_obj is None)
+
+        minutes = get_movie_minutes(obj)
+        if previous_key is not None:
+            statistic_counts[previous_key] -= 1
+            statistic_minutes[previous_key] -= minutes
+        statistic_counts[get_statistic_key(obj)] += 1
+        statistic_minutes[get_statistic_key(obj)] += minutes
+
+    if tracking_objs:
+        with transaction.atomic():
+            TrackingObject.objects.bulk_create(
+                tracking_objs.values(),
+                update_conflicts=True,
+                unique_fields=["object_id", "content_type", "user"],
+                update_fields=BULK_UPDATE_FIELDS,
+            )
+            update_library_statistics(user.pk, statistic_counts, statistic_minutes)
+        bump_library_version(user.pk)
+
+    return results
@@ -0,0 +1,24 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+# Rendered dashboard fragments are also invalidated after this time,
+# so changes of the entities (e.g. new images) show up eventually
+DASHBOARD_CACHE_TIMEOUT = 15 * 60
+
+
+def _get_library_version_cache_key(user_id: int) -> str:
+    return f"library-version:{user_id}"
+
+
+def get_library_version(user_id: int) -> str:
+    """
+    Return a token that changes whenever any of the user's tracking objects change,
+    to be used in the keys of cached data derived from the user's library.
+    """
+    return cache.get_or_set(_get_library_version_cache_key(user_id), lambda: uuid4().hex, timeout=None)
+
+
+def bump_library_version(user_id: int) -> None:
+    # A random token cannot collide with a version used before the key was evicted
+    cache.set(_get_library_version_cache_key(user_id), uuid4().hex, timeout=None)
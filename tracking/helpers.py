@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import Callable, Iterable, Mapping
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model, Q, QuerySet
+
+from entities.models import EntityBase
+from tracking.models import TrackingObject
+from users.models import User
+
+
+def attach_content_objects(
+    objects: list[TrackingObject], get_entity_queryset: Callable[[type[Model]], QuerySet] | None = None
+) -> None:
+    """
+    Load the entities referenced by the tracking objects with a single query per entity type,
+    using the queryset returned by `get_entity_queryset` for the entity model if given.
+    Tracking objects whose entity no longer exists get `None` as their `content_object`.
+    """
+    object_ids_by_content_type_id = defaultdict(list)
+    for obj in objects:
+        object_ids_by_content_type_id[obj.content_type_id].append(obj.object_id)
+
+    entities_by_content_type_id = {}
+    for content_type_id, object_ids in object_ids_by_content_type_id.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        queryset = get_entity_queryset(model) if get_entity_queryset is not None else model.objects.order_by()
+        entities_by_content_type_id[content_type_id] = queryset.in_bulk(object_ids)
+
+    content_object_field = TrackingObject._meta.get_field("content_object")
+    for obj in objects:
+        entity = entities_by_content_type_id[obj.content_type_id].get(obj.object_id)
+        content_object_field.set_cached_value(obj, entity)
+
+
+def get_tracking_statuses(
+    user: User, object_ids_by_content_type_id: Mapping[int, Iterable[int]]
+) -> dict[tuple[int, int], int]:
+    """
+    Return the user's tracking status of the given entities as `{(content_type_id, object_id): status}`,
+    without the entities the user does not track.
+
+    The statuses are read with a single query, limited to the given entities.
+    """
+    entities_filter = Q()
+    for content_type_id, object_ids in object_ids_by_content_type_id.items():
+        entities_filter |= Q(content_type_id=content_type_id, object_id__in=list(object_ids))
+
+    if not entities_filter:
+        return {}
+
+    return {
+        (content_type_id, object_id): status
+        for content_type_id, object_id, status in TrackingObject.objects.filter(entities_filter, user=user)
+        .order_by()
+        .values_list("content_type_id", "object_id", "status")
+    }
+
+
+def annotate_tracking_statuses(user: User, entities: Iterable[EntityBase]) -> None:
+    """
+    Set `tracking_status` of the entities (of any types) to the user's tracking status, `None` if not tracked.
+    """
+    entities = list(entities)
+    if not user.is_authenticated:
+        for entity in entities:
+            entity.tracking_status = None
+        return
+
+    object_ids_by_content_type_id = defaultdict(list)
+    for entity in entities:
+        object_ids_by_content_type_id[ContentType.objects.get_for_model(entity).id].append(entity.pk)
+
+    statuses = get_tracking_statuses(user, object_ids_by_content_type_id)
+    for entity in entities:
+        entity.tracking_status = statuses.get((ContentType.objects.get_for_model(entity).id, entity.pk))
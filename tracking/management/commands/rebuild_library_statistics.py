@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from tracking.statistics import rebuild_library_statistics
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    Use this command in case the statistics got out of sync (e.g., when changing objects by SQL directly).
+    """
+
+    help = "Recompute the materialized library statistics from the TrackingObject instances"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--user",
+            action="append",
+            dest="usernames",
+            help="Username of the user whose statistics are rebuilt, can be repeated (default: all users)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        users = User.objects.all()
+        if usernames := options["usernames"]:
+            users = users.filter(username__in=usernames)
+            if missing_usernames := set(usernames) - set(users.values_list("username", flat=True)):
+                raise CommandError(f"Users not found: {', '.join(sorted(missing_usernames))}")
+
+        total_rebuilt = 0
+        for user in users.iterator():
+            rebuild_library_statistics(user)
+            total_rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt library statistics of {total_rebuilt} users"))
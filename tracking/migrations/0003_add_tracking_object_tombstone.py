@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tracking", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrackingObjectTombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("object_id", models.PositiveIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(fields=["user", "updated_at"], name="tracking_tr_user_id_e262f3_idx"),
+        ),
+        migrations.AddField(
+            model_name="trackingobjecttombstone",
+            name="content_type",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"),
+        ),
+        migrations.AddField(
+            model_name="trackingobjecttombstone",
+            name="user",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobjecttombstone",
+            index=models.Index(fields=["user", "deleted_at"], name="tracking_tr_user_id_e29ae4_idx"),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:28
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+# Entity models and their date fields copied to the tracking objects
+ENTITY_SORT_KEY_SOURCES = (
+    ("movie", "release_date"),
+    ("show", "release_date"),
+    ("game", "release_date"),
+    ("book", "publish_date"),
+)
+
+
+def populate_entity_sort_keys(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    TrackingObject = apps.get_model("tracking", "TrackingObject")
+
+    for model_name, release_date_field in ENTITY_SORT_KEY_SOURCES:
+        content_type = ContentType.objects.filter(app_label="entities", model=model_name).first()
+        if content_type is None:
+            continue
+
+        entity = apps.get_model("entities", model_name).objects.filter(pk=OuterRef("object_id")).order_by()
+        TrackingObject.objects.filter(content_type=content_type).update(
+            entity_name=Coalesce(Subquery(entity.values("name")[:1]), Value("")),
+            entity_release_date=Subquery(entity.values(release_date_field)[:1]),
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("entities", "0004_add_alias_lookup_table"),
+        ("tracking", "0003_add_tracking_object_tombstone"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trackingobject",
+            name="entity_name",
+            field=models.CharField(blank=True, editable=False, max_length=128),
+        ),
+        migrations.AddField(
+            model_name="trackingobject",
+            name="entity_release_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(
+                fields=["user", "content_type", "status", "entity_name"], name="tracking_tr_user_id_4e0fcf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(
+                fields=["user", "content_type", "status", "entity_release_date"], name="tracking_tr_user_id_046345_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(
+                fields=["user", "content_type", "status", "rating"], name="tracking_tr_user_id_72e36c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(
+                fields=["user", "content_type", "status", "updated_at"], name="tracking_tr_user_id_4476a8_idx"
+            ),
+        ),
+        migrations.RunPython(populate_entity_sort_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:32
+
+from collections import Counter
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+from django.db.models import F
+
+COMPLETED_STATUS = 2
+
+
+def populate_library_statistics(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    LibraryStatistic = apps.get_model("tracking", "LibraryStatistic")
+    Movie = apps.get_model("entities", "Movie")
+    TrackingObject = apps.get_model("tracking", "TrackingObject")
+
+    # The completion time is not known for the existing objects, the last update is the closest
+    TrackingObject.objects.filter(status=COMPLETED_STATUS).update(completed_at=F("updated_at"))
+
+    movie_content_type = ContentType.objects.filter(app_label="entities", model="movie").first()
+    movie_lengths = dict(Movie.objects.filter(length__isnull=False).values_list("pk", "length"))
+
+    counts = Counter()
+    minutes = Counter()
+    for user_id, content_type_id, object_id, status, rating, completed_at in TrackingObject.objects.values_list(
+        "user_id", "content_type_id", "object_id", "status", "rating", "completed_at"
+    ).iterator():
+        key = (user_id, content_type_id, status, rating or 0, completed_at.strftime("%Y-%m") if completed_at else "")
+        counts[key] += 1
+        if movie_content_type is not None and content_type_id == movie_content_type.id:
+            minutes[key] += movie_lengths.get(object_id, 0)
+
+    LibraryStatistic.objects.bulk_create(
+        LibraryStatistic(
+            user_id=user_id,
+            content_type_id=content_type_id,
+            status=status,
+            rating=rating,
+            completed_month=completed_month,
+            count=count,
+            minutes=minutes[user_id, content_type_id, status, rating, completed_month],
+        )
+        for (user_id, content_type_id, status, rating, completed_month), count in counts.items()
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tracking", "0004_add_entity_sort_keys"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trackingobject",
+            name="completed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name="LibraryStatistic",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "status",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "Planned"), (1, "In Progress"), (2, "Completed"), (3, "Dropped"), (4, "On Hold")]
+                    ),
+                ),
+                ("rating", models.PositiveSmallIntegerField()),
+                ("completed_month", models.CharField(blank=True, max_length=7)),
+                ("count", models.IntegerField(default=0)),
+                ("minutes", models.IntegerField(default=0)),
+                (
+                    "content_type",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"),
+                ),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "content_type", "status", "rating", "completed_month"),
+                        name="unique_library_statistic",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_library_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tracking", "0005_add_library_statistics"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="trackingobject",
+            name="tracking_tr_user_id_f4aaa7_idx",
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(fields=["user", "status", "entity_name"], name="tracking_tr_user_id_412fa9_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(fields=["user", "status", "entity_release_date"], name="tracking_tr_user_id_1bc80b_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(fields=["user", "status", "rating"], name="tracking_tr_user_id_464f02_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="trackingobject",
+            index=models.Index(fields=["user", "status", "updated_at"], name="tracking_tr_user_id_a10aff_idx"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:05
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+from django.db.models import OuterRef, Subquery
+
+
+def populate_entity_length(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Movie = apps.get_model("entities", "Movie")
+    TrackingObject = apps.get_model("tracking", "TrackingObject")
+
+    content_type = ContentType.objects.filter(app_label="entities", model="movie").first()
+    if content_type is None:
+        return
+
+    movie = Movie.objects.filter(pk=OuterRef("object_id")).order_by()
+    TrackingObject.objects.filter(content_type=content_type).update(entity_length=Subquery(movie.values("length")[:1]))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("entities", "0004_add_alias_lookup_table"),
+        ("tracking", "0006_add_cross_type_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trackingobject",
+            name="entity_length",
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_entity_length, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tracking", "0007_add_entity_length"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trackingobjecttombstone",
+            index=models.Index(fields=["deleted_at"], name="tracking_tr_deleted_834b1e_idx"),
+        ),
+    ]
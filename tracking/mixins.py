@@ -3,7 +3,7 @@ from typing import Any, Self
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import QuerySet
 from django.http import Http404, HttpRequest, HttpResponse
-from django.shortcuts import get_object_or_404
+from django.shortcuts import get_object_or_404, render
 
 from entities.mappings import get_model_from_entity_type
 from entities.models import EntityBase
@@ -12,6 +12,7 @@ from tracking.models import TrackingObject
 
 class TrackingObjectMixin:
     model = TrackingObject
+    tracking_widget_template_name = "entities/partials/tracking_widget.html"
 
     def _get_entity(self: Self) -> type[EntityBase]:
         entity_type = self.kwargs["entity_type"]
@@ -35,3 +36,15 @@ class TrackingObjectMixin:
             )
         except TrackingObject.DoesNotExist:
             raise Http404
+
+    def render_tracking_widget(self: Self, tracking_obj: TrackingObject | None, status: int = 200) -> HttpResponse:
+        """
+        Render only the tracking widget of the entity detail page, which is swapped in place by HTMX,
+        and the notes, swapped out of band.
+        """
+        return render(
+            self.request,
+            self.tracking_widget_template_name,
+            {"object": self.entity, "tracking_obj": tracking_obj, "swap_notes": True},
+            status=status,
+        )
@@ -1,14 +1,39 @@
-from typing import ClassVar
+from datetime import timedelta
+from typing import ClassVar, Iterable, Self
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import MaxLengthValidator, MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from dome.common.models import TimestampedModel
 
 
+class TrackingObjectQuerySet(models.QuerySet):
+    def sync_entity_sort_keys(self: Self, model: type[models.Model], object_ids: Iterable[int] | None = None) -> int:
+        """
+        Copy the sort keys from the entities of the given type to their tracking objects
+        with a single UPDATE. Limited to the entities with `object_ids` if given.
+        """
+        queryset = self.filter(content_type=ContentType.objects.get_for_model(model))
+        if object_ids is not None:
+            queryset = queryset.filter(object_id__in=list(object_ids))
+
+        entity = model.objects.filter(pk=OuterRef("object_id")).order_by()
+        fields = {
+            "entity_name": Coalesce(Subquery(entity.values("name")[:1]), Value("")),
+            "entity_release_date": Subquery(entity.values(model.RELEASE_DATE_FIELD)[:1]),
+        }
+        if hasattr(model, "length"):
+            fields["entity_length"] = Subquery(entity.values("length")[:1])
+
+        return queryset.update(**fields)
+
+
 class TrackingObject(TimestampedModel):
     class Status(models.IntegerChoices):
         PLANNED = 0, "Planned"
@@ -30,11 +55,99 @@ class TrackingObject(TimestampedModel):
     )
     notes = models.TextField(blank=True, validators=[MaxLengthValidator(150)])
 
+    # Set by the receivers when the status changes to completed
+    completed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Denormalized from the entity so tracking lists can be sorted using an index,
+    # kept in sync by the receivers and `TrackingObjectQuerySet.sync_entity_sort_keys`
+    entity_name = models.CharField(max_length=128, blank=True, editable=False)
+    entity_release_date = models.DateField(null=True, blank=True, editable=False)
+    # Length of the movie, counted in the statistics so they can be updated without reading the entity
+    entity_length = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+
+    objects = TrackingObjectQuerySet.as_manager()
+
     class Meta:
         indexes: ClassVar = [
             models.Index(fields=["object_id", "content_type"]),
-            models.Index(fields=["user", "status"]),
+            models.Index(fields=["user", "updated_at"]),
+            models.Index(fields=["user", "status", "entity_name"]),
+            models.Index(fields=["user", "status", "entity_release_date"]),
+            models.Index(fields=["user", "status", "rating"]),
+            models.Index(fields=["user", "status", "updated_at"]),
+            models.Index(fields=["user", "content_type", "status", "entity_name"]),
+            models.Index(fields=["user", "content_type", "status", "entity_release_date"]),
+            models.Index(fields=["user", "content_type", "status", "rating"]),
+            models.Index(fields=["user", "content_type", "status", "updated_at"]),
         ]
         constraints: ClassVar = [
             models.UniqueConstraint(fields=["object_id", "content_type", "user"], name="unique_tracking_object"),
         ]
+
+    def set_entity_sort_keys(self: Self, entity: models.Model) -> None:
+        self.entity_name = entity.name
+        self.entity_release_date = getattr(entity, entity.RELEASE_DATE_FIELD)
+        self.entity_length = getattr(entity, "length", None)
+
+
+# Deletions are only reported to the incremental exports this long after, older sync tokens are rejected
+TOMBSTONE_RETENTION_PERIOD = timedelta(days=90)
+
+
+class TrackingObjectTombstoneQuerySet(models.QuerySet):
+    def expired(self: Self) -> Self:
+        return self.filter(deleted_at__lt=timezone.now() - TOMBSTONE_RETENTION_PERIOD)
+
+
+class TrackingObjectTombstone(models.Model):
+    """
+    Record of a deleted TrackingObject, so incremental exports can report the deletion.
+    """
+
+    object_id = models.PositiveIntegerField()
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TrackingObjectTombstoneQuerySet.as_manager()
+
+    class Meta:
+        indexes: ClassVar = [
+            models.Index(fields=["user", "deleted_at"]),
+            models.Index(fields=["deleted_at"]),
+        ]
+
+    def __str__(self: Self) -> str:
+        return f"{self.content_type} {self.object_id} deleted at {self.deleted_at}"
+
+
+class LibraryStatistic(models.Model):
+    """
+    Number of a user's tracking objects with the same entity type, status, rating and completion month,
+    and the total length of the movies among them.
+
+    Maintained incrementally by the receivers, see `tracking.statistics`.
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    status = models.PositiveSmallIntegerField(choices=TrackingObject.Status.choices)
+    rating = models.PositiveSmallIntegerField()  # 0 if not rated
+    completed_month = models.CharField(max_length=7, blank=True)  # YYYY-MM if completed
+
+    count = models.IntegerField(default=0)
+    minutes = models.IntegerField(default=0)
+
+    class Meta:
+        constraints: ClassVar = [
+            models.UniqueConstraint(
+                fields=["user", "content_type", "status", "rating", "completed_month"],
+                name="unique_library_statistic",
+            ),
+        ]
+
+    def __str__(self: Self) -> str:
+        return f"{self.user_id} {self.content_type} {self.get_status_display()}: {self.count}"
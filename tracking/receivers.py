@@ -1,12 +1,22 @@
 from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_delete
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.db.transaction import on_commit
 from django.dispatch import receiver
+from django.utils import timezone
 
 from entities.models import Book, EntityBase, Game, Movie, Show
-from tracking.models import TrackingObject
+from tracking.cache import bump_library_version
+from tracking.models import TrackingObject, TrackingObjectTombstone
+from tracking.statistics import (
+    get_movie_minutes,
+    get_statistic_key,
+    update_library_statistic,
+    update_movie_length_statistics,
+)
+from users.models import User
 
 
 @receiver(post_delete, sender=Movie)
@@ -19,3 +29,101 @@ def delete_tracking_objects_on_parent_deletion(sender: type[EntityBase], instanc
     instance_id = instance.id  # Capture instance ID before the instance is deleted
     content_type = ContentType.objects.get_for_model(sender)
     on_commit(lambda: TrackingObject.objects.filter(object_id=instance_id, content_type=content_type).delete())
+
+
+def _is_user_deletion(origin: Any) -> bool:
+    """Whether the objects are deleted only because their user is deleted."""
+
+    return isinstance(origin, User) or (isinstance(origin, QuerySet) and origin.model is User)
+
+
+@receiver(post_delete, sender=TrackingObject)
+def create_tombstone_on_tracking_object_deletion(instance: TrackingObject, origin: Any, **kwargs: Any) -> None:
+    """Record the deletion for incremental exports, unless the whole user is being deleted."""
+
+    if _is_user_deletion(origin):
+        return
+
+    TrackingObjectTombstone.objects.create(
+        user_id=instance.user_id,
+        content_type_id=instance.content_type_id,
+        object_id=instance.object_id,
+    )
+
+
+@receiver(pre_save, sender=TrackingObject)
+def set_entity_sort_keys_on_tracking_object_creation(instance: TrackingObject, **kwargs: Any) -> None:
+    """Copy the entity's sort keys to a new TrackingObject."""
+
+    if instance._state.adding and (entity := instance.content_object) is not None:
+        instance.set_entity_sort_keys(entity)
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_save, sender=Show)
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Book)
+def sync_entity_sort_keys_on_parent_save(
+    sender: type[EntityBase], instance: EntityBase, created: bool, **kwargs: Any
+) -> None:
+    """Keep the sort keys of the TrackingObjects in sync when the entity is renamed or its date or length changes."""
+
+    if created:
+        return
+
+    if isinstance(instance, Movie):
+        update_movie_length_statistics(instance)
+    TrackingObject.objects.sync_entity_sort_keys(sender, [instance.pk])
+
+
+@receiver(pre_save, sender=TrackingObject)
+def set_completed_at_on_tracking_object_save(instance: TrackingObject, **kwargs: Any) -> None:
+    """Record when the TrackingObject was completed and remember its previous state for the statistics."""
+
+    previous = None
+    if not instance._state.adding:
+        previous = (
+            TrackingObject.objects.filter(pk=instance.pk)
+            .only("content_type", "status", "rating", "completed_at")
+            .first()
+        )
+
+    if instance.status != TrackingObject.Status.COMPLETED:
+        instance.completed_at = None
+    elif previous is None or previous.status != TrackingObject.Status.COMPLETED:
+        instance.completed_at = instance.completed_at or timezone.now()
+
+    instance._previous_statistic_key = get_statistic_key(previous) if previous is not None else None
+
+
+@receiver(post_save, sender=TrackingObject)
+def update_library_statistics_on_tracking_object_save(instance: TrackingObject, **kwargs: Any) -> None:
+    """Move the TrackingObject from its previous statistic to the current one."""
+
+    previous_key = getattr(instance, "_previous_statistic_key", None)
+    key = get_statistic_key(instance)
+    if previous_key == key:
+        return
+
+    minutes = get_movie_minutes(instance)
+    if previous_key is not None:
+        update_library_statistic(instance.user_id, previous_key, -1, -minutes)
+    update_library_statistic(instance.user_id, key, 1, minutes)
+
+
+@receiver(post_delete, sender=TrackingObject)
+def update_library_statistics_on_tracking_object_deletion(instance: TrackingObject, origin: Any, **kwargs: Any) -> None:
+    """Remove the deleted TrackingObject from the statistics, unless the whole user is being deleted."""
+
+    if _is_user_deletion(origin):
+        return
+
+    update_library_statistic(instance.user_id, get_statistic_key(instance), -1, -get_movie_minutes(instance))
+
+
+@receiver(post_save, sender=TrackingObject)
+@receiver(post_delete, sender=TrackingObject)
+def bump_library_version_on_tracking_object_change(instance: TrackingObject, **kwargs: Any) -> None:
+    """Invalidate the cached data derived from the user's library."""
+
+    bump_library_version(instance.user_id)
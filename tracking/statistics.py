@@ -0,0 +1,164 @@
+from collections import Counter, defaultdict
+from typing import Any, NamedTuple, Self
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+
+from entities.helpers import format_time_spent
+from entities.models import Movie
+from tracking.models import LibraryStatistic, TrackingObject
+from users.models import User
+
+# Number of the most recent months shown in the completions chart
+COMPLETIONS_MONTHS_COUNT = 12
+
+
+class StatisticKey(NamedTuple):
+    content_type_id: int
+    status: int
+    rating: int
+    completed_month: str
+
+
+def get_statistic_key(obj: TrackingObject) -> StatisticKey:
+    return StatisticKey(
+        content_type_id=obj.content_type_id,
+        status=obj.status,
+        rating=obj.rating or 0,
+        completed_month=obj.completed_at.strftime("%Y-%m") if obj.completed_at else "",
+    )
+
+
+def get_movie_minutes(obj: TrackingObject) -> int:
+    # Only set for movies
+    return obj.entity_length or 0
+
+
+def update_library_statistic(user_id: int, key: StatisticKey, count: int, minutes: int) -> None:
+    """
+    Add `count` and `minutes` (negative to subtract) to the user's statistic with the given key.
+
+    Done with a single upsert, so concurrent changes creating the same statistic cannot conflict.
+    """
+    table = connection.ops.quote_name(LibraryStatistic._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (user_id, content_type_id, status, rating, completed_month, count, minutes)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (user_id, content_type_id, status, rating, completed_month) DO UPDATE SET
+                count = {table}.count + excluded.count,
+                minutes = {table}.minutes + excluded.minutes
+            """,  # noqa: S608
+            [user_id, *key, count, minutes],
+        )
+
+
+def update_library_statistics(user_id: int, counts: Counter, minutes: Counter) -> None:
+    """
+    Add the changes of several of the user's statistics, e.g. accumulated over a bulk operation.
+    """
+    for key in counts.keys() | minutes.keys():
+        if counts[key] or minutes[key]:
+            update_library_statistic(user_id, key, counts[key], minutes[key])
+
+
+def update_movie_length_statistics(movie: Movie) -> None:
+    """
+    Move the minutes of the movie's tracking objects from the length they were counted with to its current length.
+
+    Must be called before the length is copied to the tracking objects.
+    """
+    tracking_objs = (
+        TrackingObject.objects.filter(content_type=ContentType.objects.get_for_model(Movie), object_id=movie.pk)
+        .exclude(entity_length=movie.length)
+        .only("user", "content_type", "status", "rating", "completed_at", "entity_length")
+    )
+    for obj in tracking_objs:
+        update_library_statistic(obj.user_id, get_statistic_key(obj), 0, (movie.length or 0) - get_movie_minutes(obj))
+
+
+def rebuild_library_statistics(user: User) -> None:
+    """
+    Recompute all statistics of the user from their tracking objects,
+    e.g. after they were changed without sending signals (bulk operations).
+    """
+    tracking_objs = TrackingObject.objects.filter(user=user).only(
+        "content_type", "status", "rating", "completed_at", "entity_length"
+    )
+
+    counts = Counter()
+    minutes = Counter()
+    for obj in tracking_objs.order_by().iterator():
+        key = get_statistic_key(obj)
+        counts[key] += 1
+        minutes[key] += get_movie_minutes(obj)
+
+    with transaction.atomic():
+        LibraryStatistic.objects.filter(user=user).delete()
+        LibraryStatistic.objects.bulk_create(
+            LibraryStatistic(user=user, count=count, minutes=minutes[key], **key._asdict())
+            for key, count in counts.items()
+        )
+
+
+class LibraryStatistics:
+    """
+    Statistics of a user's library, read from the materialized `LibraryStatistic` rows with a single query.
+    """
+
+    def __init__(self: Self, statistics: list[LibraryStatistic]) -> None:
+        self.status_counts: dict[str, Counter] = defaultdict(Counter)
+        self.rating_counts: dict[str, Counter] = defaultdict(Counter)
+        self.completions: Counter = Counter()
+        self.completed_movie_minutes = 0
+
+        for statistic in statistics:
+            entity_type = ContentType.objects.get_for_id(statistic.content_type_id).model_class()._meta.verbose_name
+            self.status_counts[entity_type][statistic.status] += statistic.count
+            if statistic.rating:
+                self.rating_counts[entity_type][statistic.rating] += statistic.count
+            if statistic.status == TrackingObject.Status.COMPLETED:
+                self.completions[statistic.completed_month] += statistic.count
+                self.completed_movie_minutes += statistic.minutes
+
+    @classmethod
+    def for_user(cls: type[Self], user: User) -> Self:
+        return cls(list(LibraryStatistic.objects.filter(user=user, count__gt=0)))
+
+    def get_status_counts(self: Self) -> list[tuple[str, list[tuple[str, int]], int]]:
+        """
+        Number of tracked entities of each type, by status, with the total.
+        """
+        return [
+            (
+                entity_type,
+                [(label, counts[status]) for status, label in TrackingObject.Status.choices],
+                counts.total(),
+            )
+            for entity_type, counts in sorted(self.status_counts.items())
+        ]
+
+    def get_rating_histograms(self: Self) -> list[tuple[str, list[tuple[int, int, int]]]]:
+        """
+        Number of ratings of each value for each entity type, with the bar width in percent.
+        """
+        return [
+            (entity_type, _with_bar_widths([(rating, counts[rating]) for rating in range(1, 6)]))
+            for entity_type, counts in sorted(self.rating_counts.items())
+        ]
+
+    def get_completions_per_month(self: Self) -> list[tuple[str, int, int]]:
+        """
+        Number of completed entities in each of the most recent months, with the bar width in percent.
+        """
+        months = sorted(month for month in self.completions if month)[-COMPLETIONS_MONTHS_COUNT:]
+        return _with_bar_widths([(month, self.completions[month]) for month in months])
+
+    def get_completed_movie_time_display(self: Self) -> str:
+        return format_time_spent(self.completed_movie_minutes)
+
+
+def _with_bar_widths(values: list[tuple[Any, int]]) -> list[tuple[Any, int, int]]:
+    max_count = max((count for _label, count in values), default=0)
+    return [(label, count, round(count * 100 / max_count) if max_count else 0) for label, count in values]
@@ -0,0 +1,130 @@
+import json
+from typing import Any, Self
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http.response import HttpResponse
+from django.test import TestCase
+from django.urls import reverse
+
+from entities.factories import BookFactory, MovieFactory
+from tracking.cache import get_library_version
+from tracking.models import LibraryStatistic, TrackingObject
+from tracking.statistics import rebuild_library_statistics
+
+User = get_user_model()
+
+
+class BulkTrackingViewTestCase(TestCase):
+    """Tests for the bulk creation and update of TrackingObjects."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        cls.tracked_movie = MovieFactory(name="The Matrix")
+        cls.untracked_movie = MovieFactory(name="Arrival")
+        cls.book = BookFactory(name="The Invincible")
+        cls.tracking_obj = TrackingObject.objects.create(
+            user=cls.user, content_object=cls.tracked_movie, status=TrackingObject.Status.PLANNED, notes="Rewatch"
+        )
+
+    def setUp(self: Self) -> None:
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = reverse("tracking:track-bulk")
+
+    def _post(self: Self, operations: Any) -> HttpResponse:
+        return self.client.post(self.url, json.dumps({"operations": operations}), content_type="application/json")
+
+    def test_creates_and_updates_objects(self: Self) -> None:
+        response = self._post(
+            [
+                {"entity_type": "movie", "pk": self.tracked_movie.pk, "status": TrackingObject.Status.COMPLETED},
+                {"entity_type": "books", "pk": self.book.pk, "status": TrackingObject.Status.IN_PROGRESS, "rating": 4},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {"entity_type": "movie", "pk": self.tracked_movie.pk, "ok": True, "created": False},
+                {"entity_type": "book", "pk": self.book.pk, "ok": True, "created": True},
+            ],
+        )
+
+        self.tracking_obj.refresh_from_db()
+        self.assertEqual(self.tracking_obj.status, TrackingObject.Status.COMPLETED)
+        self.assertIsNotNone(self.tracking_obj.completed_at)
+        # Fields missing from the operation are kept
+        self.assertEqual(self.tracking_obj.notes, "Rewatch")
+
+        book_obj = TrackingObject.objects.get(user=self.user, object_id=self.book.pk, entity_name="The Invincible")
+        self.assertEqual(book_obj.rating, 4)
+        self.assertIsNone(book_obj.completed_at)
+
+    def test_invalid_operations_are_reported(self: Self) -> None:
+        response = self._post(
+            [
+                {"entity_type": "movie", "pk": self.untracked_movie.pk, "rating": 9},
+                {"entity_type": "movie", "pk": 0},
+                {"entity_type": "podcast", "pk": 1},
+                {"entity_type": "book", "pk": self.book.pk},
+                {"entity_type": "book", "pk": self.book.pk},
+            ]
+        )
+
+        results = response.json()["results"]
+        self.assertEqual(list(results[0]["errors"]), ["rating"])
+        self.assertEqual(results[1]["errors"], {"__all__": ["Entity not found."]})
+        self.assertFalse(results[2]["ok"])
+        self.assertTrue(results[3]["ok"])
+        self.assertEqual(results[4]["errors"], {"__all__": ["Duplicate operation for the entity."]})
+
+        self.assertFalse(TrackingObject.objects.filter(object_id=self.untracked_movie.pk).exists())
+        self.assertTrue(TrackingObject.objects.filter(object_id=self.book.pk).exists())
+
+    def test_statistics_and_library_version_updated(self: Self) -> None:
+        library_version = get_library_version(self.user.pk)
+        self._post([{"entity_type": "movie", "pk": self.tracked_movie.pk, "status": TrackingObject.Status.DROPPED}])
+
+        self.assertNotEqual(get_library_version(self.user.pk), library_version)
+        self.assertEqual(
+            list(LibraryStatistic.objects.filter(user=self.user, count__gt=0).values_list("status", "count")),
+            [(TrackingObject.Status.DROPPED, 1)],
+        )
+
+    def test_statistics_match_rebuilt_statistics(self: Self) -> None:
+        self._post(
+            [
+                {"entity_type": "movie", "pk": self.tracked_movie.pk, "status": TrackingObject.Status.COMPLETED},
+                {"entity_type": "movie", "pk": MovieFactory(length=100).pk, "status": TrackingObject.Status.COMPLETED},
+                {"entity_type": "books", "pk": self.book.pk, "status": TrackingObject.Status.IN_PROGRESS, "rating": 4},
+            ]
+        )
+
+        fields = ("content_type", "status", "rating", "completed_month", "count", "minutes")
+        statistics = set(LibraryStatistic.objects.filter(user=self.user, count__gt=0).values_list(*fields))
+        rebuild_library_statistics(self.user)
+        self.assertEqual(statistics, set(LibraryStatistic.objects.filter(user=self.user).values_list(*fields)))
+
+    def test_many_operations_use_constant_queries(self: Self) -> None:
+        operations = [
+            {"entity_type": "movie", "pk": MovieFactory(name=f"Movie {i}").pk, "status": TrackingObject.Status.PLANNED}
+            for i in range(50)
+        ]
+
+        # Session, user, entities, existing objects, a single insert and the update of the changed statistic
+        with self.assertNumQueries(8):
+            response = self._post(operations)
+
+        self.assertTrue(all(result["ok"] for result in response.json()["results"]))
+        self.assertEqual(TrackingObject.objects.filter(user=self.user).count(), 51)
+
+    def test_malformed_body(self: Self) -> None:
+        response = self.client.post(self.url, "not json", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+        response = self._post({"entity_type": "movie"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,71 @@
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from entities.factories import BookFactory, MovieFactory
+from tracking.models import TrackingObject
+
+User = get_user_model()
+
+
+class DashboardViewTestCase(TestCase):
+    """Tests for the DashboardView queries and fragment caching."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        for i in range(8):
+            TrackingObject.objects.create(
+                user=cls.user, content_object=MovieFactory(name=f"Movie {i}"), status=TrackingObject.Status.IN_PROGRESS
+            )
+            TrackingObject.objects.create(user=cls.user, content_object=BookFactory(name=f"Book {i}"))
+
+    def setUp(self: Self) -> None:
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = reverse("tracking:dashboard", kwargs={"username": self.user.username})
+
+    def _get_dashboard_query_count(self: Self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_lists_are_fetched_once(self: Self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context["dashboard_lists"]["in_progress_list"]), 8)
+        self.assertEqual(len(response.context["dashboard_lists"]["completed_list"]), 6)
+        self.assertContains(response, "Show all")
+
+    @override_settings(LIBRARY_CACHE_ENABLED=True)
+    def test_repeat_visit_uses_cached_fragments(self: Self) -> None:
+        first_visit_query_count = self._get_dashboard_query_count()
+
+        # The 2 lists, their entities (one query per type) and the statistics are only read on the first visit
+        self.assertEqual(self._get_dashboard_query_count(), first_visit_query_count - 5)
+
+    def test_fragments_not_cached_without_shared_cache(self: Self) -> None:
+        first_visit_query_count = self._get_dashboard_query_count()
+
+        self.assertEqual(self._get_dashboard_query_count(), first_visit_query_count)
+
+    @override_settings(LIBRARY_CACHE_ENABLED=True)
+    def test_tracking_change_invalidates_cached_fragments(self: Self) -> None:
+        self.assertNotContains(self.client.get(self.url), "Renamed")
+
+        obj = TrackingObject.objects.filter(user=self.user, status=TrackingObject.Status.COMPLETED).first()
+        obj.content_object.name = "Renamed"
+        obj.content_object.save()
+        self.assertNotContains(self.client.get(self.url), "Renamed")
+
+        obj.rating = 5
+        obj.save()
+        self.assertContains(self.client.get(self.url), "Renamed")
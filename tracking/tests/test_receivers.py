@@ -2,7 +2,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from entities.factories import MovieFactory
-from tracking.models import TrackingObject
+from tracking.models import TrackingObject, TrackingObjectTombstone
 
 User = get_user_model()
 
@@ -31,3 +31,24 @@ class TestReceivers(TestCase):
 
         # Ensure the TrackingObject has been deleted
         self.assertFalse(TrackingObject.objects.filter(id=tracking_object.id).exists())
+
+    def test_tombstone_created_when_tracking_object_deleted(self) -> None:
+        """Test that deleting a TrackingObject leaves a tombstone for incremental exports."""
+
+        movie = MovieFactory()
+        TrackingObject.objects.create(user=self.user, content_object=movie)
+
+        TrackingObject.objects.filter(user=self.user).delete()
+
+        tombstone = TrackingObjectTombstone.objects.get(user=self.user)
+        self.assertEqual(tombstone.object_id, movie.id)
+        self.assertEqual(tombstone.content_type.model_class(), type(movie))
+
+    def test_no_tombstones_when_user_deleted(self) -> None:
+        """Test that deleting a user does not leave tombstones of their TrackingObjects behind."""
+
+        TrackingObject.objects.create(user=self.user, content_object=MovieFactory())
+
+        self.user.delete()
+
+        self.assertFalse(TrackingObjectTombstone.objects.exists())
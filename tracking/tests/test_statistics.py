@@ -0,0 +1,119 @@
+from io import StringIO
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from entities.factories import BookFactory, MovieFactory
+from tracking.models import LibraryStatistic, TrackingObject
+from tracking.statistics import (
+    LibraryStatistics,
+    get_statistic_key,
+    rebuild_library_statistics,
+    update_library_statistic,
+)
+
+User = get_user_model()
+
+
+class LibraryStatisticsTestCase(TestCase):
+    """Tests for the materialized library statistics."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+    def _get_statistics_rows(self: Self) -> set[tuple]:
+        return set(
+            LibraryStatistic.objects.filter(user=self.user, count__gt=0).values_list(
+                "content_type", "status", "rating", "completed_month", "count", "minutes"
+            )
+        )
+
+    def test_incremental_updates_match_rebuild(self: Self) -> None:
+        movie_obj = TrackingObject.objects.create(
+            user=self.user, content_object=MovieFactory(length=120), status=TrackingObject.Status.IN_PROGRESS
+        )
+        TrackingObject.objects.create(user=self.user, content_object=MovieFactory(length=90), rating=3)
+        book_obj = TrackingObject.objects.create(user=self.user, content_object=BookFactory(), rating=5)
+
+        movie_obj.status = TrackingObject.Status.COMPLETED
+        movie_obj.rating = 4
+        movie_obj.save()
+        book_obj.delete()
+
+        incremental_rows = self._get_statistics_rows()
+        rebuild_library_statistics(self.user)
+        self.assertEqual(incremental_rows, self._get_statistics_rows())
+
+        statistics = LibraryStatistics.for_user(self.user)
+        self.assertEqual(statistics.completed_movie_minutes, 210)
+        self.assertEqual(statistics.status_counts["movie"][TrackingObject.Status.COMPLETED], 2)
+        self.assertEqual(dict(statistics.rating_counts["movie"]), {3: 1, 4: 1})
+        self.assertEqual([count for _month, count, _width in statistics.get_completions_per_month()], [2])
+
+    def test_completed_at_is_kept_until_status_changes(self: Self) -> None:
+        obj = TrackingObject.objects.create(user=self.user, content_object=MovieFactory())
+        completed_at = obj.completed_at
+        self.assertIsNotNone(completed_at)
+
+        obj.rating = 5
+        obj.save()
+        self.assertEqual(obj.completed_at, completed_at)
+
+        obj.status = TrackingObject.Status.DROPPED
+        obj.save()
+        self.assertIsNone(obj.completed_at)
+
+    def test_statistic_created_concurrently(self: Self) -> None:
+        key = get_statistic_key(TrackingObject(user=self.user, content_object=MovieFactory()))
+        # Another process created the statistic after this one found none to update
+        LibraryStatistic.objects.create(user=self.user, count=1, minutes=90, **key._asdict())
+
+        with self.assertNumQueries(1):
+            update_library_statistic(self.user.pk, key, 1, 120)
+
+        self.assertEqual(self._get_statistics_rows(), {(*key, 2, 210)})
+
+    def test_rebuild_command(self: Self) -> None:
+        TrackingObject.objects.create(user=self.user, content_object=MovieFactory())
+        LibraryStatistic.objects.all().delete()
+
+        call_command("rebuild_library_statistics", user=[self.user.username], stdout=StringIO())
+
+        self.assertEqual(LibraryStatistics.for_user(self.user).status_counts["movie"].total(), 1)
+
+    def test_dashboard_reads_statistics_with_single_query(self: Self) -> None:
+        for _ in range(3):
+            TrackingObject.objects.create(user=self.user, content_object=BookFactory(), rating=4)
+        self.client.force_login(self.user)
+
+        with self.assertNumQueries(1):
+            LibraryStatistics.for_user(self.user)
+
+        response = self.client.get(reverse("tracking:dashboard", kwargs={"username": self.user.username}))
+        self.assertContains(response, "books: 3")
+
+    def test_deleted_movie_removed_from_completed_minutes(self: Self) -> None:
+        movie = MovieFactory(length=120)
+        TrackingObject.objects.create(user=self.user, content_object=MovieFactory(length=90))
+        TrackingObject.objects.create(user=self.user, content_object=movie)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            movie.delete()
+
+        self.assertEqual(LibraryStatistics.for_user(self.user).completed_movie_minutes, 90)
+
+    def test_movie_length_change_updates_completed_minutes(self: Self) -> None:
+        movie = MovieFactory(length=120)
+        TrackingObject.objects.create(user=self.user, content_object=movie)
+
+        movie.length = 100
+        movie.save()
+
+        self.assertEqual(LibraryStatistics.for_user(self.user).completed_movie_minutes, 100)
+        incremental_rows = self._get_statistics_rows()
+        rebuild_library_statistics(self.user)
+        self.assertEqual(incremental_rows, self._get_statistics_rows())
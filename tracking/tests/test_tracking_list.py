@@ -1,11 +1,15 @@
+from datetime import date
 from typing import Self
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
 from django.http.response import HttpResponse
 from django.test import TestCase
 from django.urls import reverse
 
-from entities.factories import MovieFactory
+from entities.factories import BookFactory, GameFactory, MovieFactory, ShowFactory
+from entities.models import Book, Game, Movie, Show
 from tracking.models import TrackingObject
 
 User = get_user_model()
@@ -19,9 +23,9 @@ class TrackingListViewOrderingTestCase(TestCase):
         cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
 
         # Create movies with specific names for alphabetical ordering tests
-        cls.movie_alpha = MovieFactory(name="Alpha Movie")
-        cls.movie_beta = MovieFactory(name="Beta Movie")
-        cls.movie_zulu = MovieFactory(name="Zulu Movie")
+        cls.movie_alpha = MovieFactory(name="Alpha Movie", release_date=date(2001, 1, 1))
+        cls.movie_beta = MovieFactory(name="Beta Movie", release_date=date(1999, 1, 1))
+        cls.movie_zulu = MovieFactory(name="Zulu Movie", release_date=None)
 
         # Create tracking objects for the user
         cls.tracking_alpha = TrackingObject.objects.create(
@@ -87,3 +91,144 @@ class TrackingListViewOrderingTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         ratings = [obj.rating for obj in response.context["object_list"]]
         self.assertEqual(ratings, [5, 3, 1])
+
+    def test_ordering_by_release_date_descending(self: Self) -> None:
+        """Test that ordering by release date (descending) puts entities without a date last."""
+        response = self.client.get(self._get_tracking_list_url(ordering="-entity_release_date"))
+
+        self.assertEqual(response.status_code, 200)
+        names = self._get_tracking_names_from_response(response)
+        self.assertEqual(names, ["Alpha Movie", "Beta Movie", "Zulu Movie"])
+
+    def test_ordering_by_entity_name_follows_renamed_entity(self: Self) -> None:
+        """Test that renaming an entity updates the sort key of its tracking objects."""
+        self.movie_alpha.name = "Omega Movie"
+        self.movie_alpha.save()
+
+        response = self.client.get(self._get_tracking_list_url(ordering="entity_name"))
+
+        names = self._get_tracking_names_from_response(response)
+        self.assertEqual(names, ["Beta Movie", "Omega Movie", "Zulu Movie"])
+
+
+class TrackingListViewPaginationTestCase(TestCase):
+    """Tests for the cursor pagination of TrackingListView."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        # Repeated ratings and missing ratings need the tie-break on the primary key
+        for i in range(45):
+            TrackingObject.objects.create(
+                user=cls.user,
+                content_object=MovieFactory(name=f"Movie {i:02}"),
+                status=TrackingObject.Status.IN_PROGRESS,
+                rating=None if i % 4 == 0 else i % 5 + 1,
+            )
+
+    def setUp(self: Self) -> None:
+        self.client.force_login(self.user)
+        self.url = reverse("tracking:tracking-list", kwargs={"username": self.user.username, "entity_type": "movie"})
+
+    def _get_page(self: Self, ordering: str, cursor: str | None = None) -> HttpResponse:
+        params = {"ordering": ordering}
+        if cursor:
+            params["cursor"] = cursor
+        return self.client.get(self.url, params)
+
+    def _get_expected_ids(self: Self, ordering: str) -> list[int]:
+        field = ordering.lstrip("-")
+        if ordering.startswith("-"):
+            order_by = (F(field).desc(nulls_last=True), "-pk")
+        else:
+            order_by = (F(field).asc(nulls_first=True), "pk")
+        return list(TrackingObject.objects.order_by(*order_by).values_list("pk", flat=True))
+
+    def test_pages_follow_ordering(self: Self) -> None:
+        for ordering in ("-rating", "rating", "entity_name", "-updated_at"):
+            with self.subTest(ordering=ordering):
+                expected_ids = self._get_expected_ids(ordering)
+
+                ids, page_numbers, cursor = [], [], None
+                while True:
+                    page = self._get_page(ordering, cursor).context["page_obj"]
+                    ids.extend(obj.pk for obj in page)
+                    page_numbers.append(page.number)
+                    if not page.has_next():
+                        break
+                    cursor = page.next_cursor
+
+                self.assertEqual(ids, expected_ids)
+                self.assertEqual(page_numbers, [1, 2, 3])
+
+                # Going back from the last page returns the previous pages
+                page = self._get_page(ordering, page.previous_cursor).context["page_obj"]
+                self.assertEqual([obj.pk for obj in page], expected_ids[20:40])
+                self.assertEqual(page.number, 2)
+                page = self._get_page(ordering, page.previous_cursor).context["page_obj"]
+                self.assertEqual([obj.pk for obj in page], expected_ids[:20])
+                self.assertFalse(page.has_previous())
+
+    def test_nulls_placement(self: Self) -> None:
+        page = self._get_page("-rating").context["page_obj"]
+        self.assertEqual(page[0].rating, 5)
+
+        page = self._get_page("rating").context["page_obj"]
+        self.assertIsNone(page[0].rating)
+
+    def test_malformed_cursor_returns_first_page(self: Self) -> None:
+        response = self._get_page("rating", cursor="not-a-cursor")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].number, 1)
+
+    def test_approximate_count(self: Self) -> None:
+        paginator = self._get_page("rating").context["paginator"]
+
+        self.assertEqual(paginator.count, 45)
+        self.assertEqual(paginator.num_pages, 3)
+
+
+class AllTrackingListViewTestCase(TestCase):
+    """Tests for the tracking list of all entity types."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+
+        factories = (MovieFactory, ShowFactory, GameFactory, BookFactory)
+        for i in range(24):
+            TrackingObject.objects.create(
+                user=cls.user,
+                content_object=factories[i % 4](name=f"Entity {i:02}"),
+                status=TrackingObject.Status.IN_PROGRESS if i % 3 else TrackingObject.Status.COMPLETED,
+                rating=i % 5 + 1,
+            )
+
+    def setUp(self: Self) -> None:
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = reverse("tracking:tracking-list-all", kwargs={"username": self.user.username})
+
+    def test_lists_all_entity_types(self: Self) -> None:
+        response = self.client.get(self.url, {"ordering": "entity_name"})
+
+        page = response.context["page_obj"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([obj.entity_name for obj in page], [f"Entity {i:02}" for i in range(24) if i % 3][:20])
+        self.assertEqual({type(obj.content_object) for obj in page}, {Movie, Show, Game, Book})
+        self.assertContains(response, reverse("entities:entities-detail", args=["book", page[2].object_id]))
+
+    def test_entities_fetched_per_type_for_page(self: Self) -> None:
+        # Dashboard user, session, user, tracking objects and one query per entity type
+        with self.assertNumQueries(8):
+            self.client.get(self.url, {"ordering": "-updated_at"})
+
+    def test_ordering_by_status(self: Self) -> None:
+        response = self.client.get(self.url, {"status": "", "ordering": "status"})
+
+        page = response.context["page_obj"]
+        self.assertEqual(response.context["paginator"].count, 24)
+        self.assertEqual([obj.status for obj in page], sorted(obj.status for obj in page))
+        self.assertEqual(page[0].status, TrackingObject.Status.IN_PROGRESS)
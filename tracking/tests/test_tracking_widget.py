@@ -0,0 +1,76 @@
+from typing import Self
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from entities.factories import MovieFactory
+from tracking.models import TrackingObject
+
+User = get_user_model()
+
+
+class TrackingWidgetTestCase(TestCase):
+    """Tests for the tracking views returning only the tracking widget fragment."""
+
+    @classmethod
+    def setUpTestData(cls: type[Self]) -> None:
+        cls.user = User.objects.create_user(username="testuser", password="12345")  # noqa: S106
+        cls.movie = MovieFactory(name="The Matrix", description="A hacker learns about the true nature of reality.")
+
+    def setUp(self: Self) -> None:
+        self.client.force_login(self.user)
+        self.track_url = reverse("tracking:track", kwargs={"entity_type": "movie", "pk": self.movie.pk})
+        self.delete_url = reverse("tracking:tracking-delete", kwargs={"entity_type": "movie", "pk": self.movie.pk})
+
+    def test_track_returns_widget_only(self: Self) -> None:
+        response = self.client.post(self.track_url, {"status": TrackingObject.Status.IN_PROGRESS})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "entities/partials/tracking_widget.html")
+        self.assertTemplateNotUsed(response, "entities/entities_detail.html")
+        self.assertContains(response, 'id="tracking-widget"')
+        self.assertContains(response, "In Progress")
+        self.assertNotContains(response, self.movie.description)
+        self.assertEqual(TrackingObject.objects.get(user=self.user).status, TrackingObject.Status.IN_PROGRESS)
+
+    def test_invalid_rating_returns_saved_state(self: Self) -> None:
+        TrackingObject.objects.create(user=self.user, content_object=self.movie, rating=3)
+
+        response = self.client.post(self.track_url, {"rating": 9})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertContains(response, "3/5", status_code=400)
+        self.assertEqual(TrackingObject.objects.get(user=self.user).rating, 3)
+
+    def test_notes_swapped_with_widget(self: Self) -> None:
+        response = self.client.post(self.track_url, {"notes": "Red pill"})
+
+        self.assertContains(response, 'id="tracking-notes"')
+        self.assertContains(response, 'hx-swap-oob="true"')
+        self.assertContains(response, "Red pill</textarea>")
+
+        response = self.client.delete(self.delete_url)
+
+        self.assertContains(response, 'hx-swap-oob="true"')
+        self.assertNotContains(response, "Red pill")
+
+    def test_delete_returns_widget_only(self: Self) -> None:
+        TrackingObject.objects.create(user=self.user, content_object=self.movie)
+
+        response = self.client.delete(self.delete_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateNotUsed(response, "entities/entities_detail.html")
+        self.assertContains(response, "Not Tracked")
+        self.assertFalse(TrackingObject.objects.filter(user=self.user).exists())
+
+    def test_detail_page_includes_widget(self: Self) -> None:
+        response = self.client.get(
+            reverse("entities:entities-detail", kwargs={"entity_type": "movie", "pk": self.movie.pk})
+        )
+
+        self.assertTemplateUsed(response, "entities/partials/tracking_widget.html")
+        self.assertContains(response, 'id="tracking-widget"')
+        self.assertContains(response, 'id="tracking-notes"')
+        self.assertNotContains(response, "hx-swap-oob")
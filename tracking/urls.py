@@ -1,6 +1,8 @@
 from django.urls import path
 
 from tracking.views import (
+    AllTrackingListView,
+    BulkTrackingView,
     DashboardView,
     TrackingDeleteView,
     TrackingFormView,
@@ -11,7 +13,9 @@ app_name = "tracking"
 
 urlpatterns = [
     path("@<str:username>/dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("@<str:username>/all/", AllTrackingListView.as_view(), name="tracking-list-all"),
     path("@<str:username>/<str:entity_type>/", TrackingListView.as_view(), name="tracking-list"),
+    path("track/bulk/", BulkTrackingView.as_view(), name="track-bulk"),
     path("track/<str:entity_type>/<int:pk>/", TrackingFormView.as_view(), name="track"),
     path("stop-tracking/<str:entity_type>/<int:pk>/", TrackingDeleteView.as_view(), name="tracking-delete"),
 ]
@@ -1,21 +1,28 @@
+import json
 from typing import Any, ClassVar, Dict, Self
 
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import OuterRef, QuerySet, Subquery
+from django.db.models import QuerySet
 from django.forms import ModelForm
-from django.http import Http404, HttpRequest, HttpResponse
-from django.shortcuts import get_object_or_404, render
-from django.views.generic import TemplateView
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.functional import SimpleLazyObject
+from django.views.generic import TemplateView, View
 from django.views.generic.edit import DeleteView, ModelFormMixin, ProcessFormView
 from django_filters.filterset import FilterSet
 from django_filters.views import FilterView
 
-from dome.common.mixins import DefaultFilterMixin, DynamicOrderingMixin, ElidedPaginationMixin
+from dome.common.mixins import CursorPaginationMixin, DefaultFilterMixin, DynamicOrderingMixin
 from entities.mixins import DynamicEntityMixin
+from tracking.bulk import MAX_BULK_OPERATIONS, apply_tracking_operations
+from tracking.cache import DASHBOARD_CACHE_TIMEOUT, get_library_version
 from tracking.forms import TrackingObjectForm
+from tracking.helpers import attach_content_objects
 from tracking.mixins import TrackingObjectMixin
 from tracking.models import TrackingObject
+from tracking.statistics import LibraryStatistics
 from users.models import User
 
 
@@ -33,15 +40,30 @@ class UserDashboardMixin:
 class DashboardView(UserDashboardMixin, LoginRequiredMixin, TemplateView):
     template_name = "tracking/dashboard.html"
 
+    # Number of the recently completed entities shown
+    COMPLETED_LIST_SIZE = 6
+
+    def get_dashboard_lists(self: Self) -> dict[str, list[TrackingObject]]:
+        tracking_objects = TrackingObject.objects.filter(user=self.dashboard_user).order_by("-updated_at")
+        completed_list = list(
+            tracking_objects.filter(status=TrackingObject.Status.COMPLETED)[: self.COMPLETED_LIST_SIZE]
+        )
+        in_progress_list = list(tracking_objects.filter(status=TrackingObject.Status.IN_PROGRESS))
+        attach_content_objects([*completed_list, *in_progress_list])
+        return {
+            "completed_list": [obj for obj in completed_list if obj.content_object is not None],
+            "in_progress_list": [obj for obj in in_progress_list if obj.content_object is not None],
+        }
+
     def get_context_data(self: Self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        tracking_objects = TrackingObject.objects.filter(user=self.dashboard_user).prefetch_related("content_object")
-        context["completed_list"] = tracking_objects.filter(status=TrackingObject.Status.COMPLETED).order_by(
-            "-updated_at"
-        )[:6]
-        context["in_progress_list"] = tracking_objects.filter(status=TrackingObject.Status.IN_PROGRESS).order_by(
-            "-updated_at"
-        )
+        # Only evaluated if the dashboard fragments are not cached for the current library version
+        context["dashboard_lists"] = SimpleLazyObject(self.get_dashboard_lists)
+        context["library_statistics"] = SimpleLazyObject(lambda: LibraryStatistics.for_user(self.dashboard_user))
+        context["dashboard_user"] = self.dashboard_user
+        if settings.LIBRARY_CACHE_ENABLED:
+            context["library_version"] = get_library_version(self.dashboard_user.pk)
+            context["dashboard_cache_timeout"] = DASHBOARD_CACHE_TIMEOUT
         return context
 
 
@@ -51,24 +73,31 @@ class TrackingFilter(FilterSet):
         fields: ClassVar = ["status"]
 
 
-class TrackingListView(
+class AllTrackingListView(
+    CursorPaginationMixin,
     DynamicOrderingMixin,
-    DynamicEntityMixin,
     UserDashboardMixin,
-    ElidedPaginationMixin,
     DefaultFilterMixin,
     LoginRequiredMixin,
     FilterView,
 ):
+    """
+    Tracked entities of all types in a single list.
+    """
+
     template_name = "tracking/tracking_list.html"
     paginate_by = 20
     filterset_class = TrackingFilter
-    # AIDEV-NOTE: Use 'entity_name' (annotated field) instead of 'content_object__name' for sorting
+    # Denormalized sort keys of the tracked entities, see `TrackingObject.entity_name`
     ordering_fields = (
         "rating",
         "-rating",
+        "status",
+        "-status",
         "entity_name",
         "-entity_name",
+        "entity_release_date",
+        "-entity_release_date",
         "updated_at",
         "-updated_at",
     )
@@ -76,17 +105,21 @@ class TrackingListView(
     default_filter_values: ClassVar = {"status": TrackingObject.Status.IN_PROGRESS}
 
     def get_queryset(self: Self) -> QuerySet[TrackingObject]:
-        content_type = ContentType.objects.get_for_model(self.model)
-        # AIDEV-NOTE: Annotate entity_name via Subquery since GenericForeignKey doesn't support reverse querying
-        entity_name_subquery = Subquery(self.model.objects.filter(pk=OuterRef("object_id")).values("name")[:1])
-        queryset = (
-            TrackingObject.objects.filter(user=self.dashboard_user, content_type=content_type)
-            .prefetch_related("content_object")
-            .annotate(entity_name=entity_name_subquery)
-        )
+        # The entities are only fetched for the current page, with one query per entity type
+        queryset = TrackingObject.objects.filter(user=self.dashboard_user).prefetch_related("content_object")
         return self.order_queryset(queryset)
 
 
+class TrackingListView(DynamicEntityMixin, AllTrackingListView):
+    """
+    Tracked entities of the type given in the URL.
+    """
+
+    def get_queryset(self: Self) -> QuerySet[TrackingObject]:
+        content_type = ContentType.objects.get_for_model(self.model)
+        return super().get_queryset().filter(content_type=content_type)
+
+
 class TrackingFormView(LoginRequiredMixin, TrackingObjectMixin, ModelFormMixin, ProcessFormView):
     form_class = TrackingObjectForm
 
@@ -100,9 +133,16 @@ class TrackingFormView(LoginRequiredMixin, TrackingObjectMixin, ModelFormMixin,
 
     def form_valid(self: Self, form: ModelForm) -> HttpResponse:
         self.object = form.save()
-        return render(
-            self.request, "entities/entities_detail.html", {"object": self.entity, "tracking_obj": self.object}
-        )
+        return self.render_tracking_widget(self.object)
+
+    def form_invalid(self: Self, form: ModelForm) -> HttpResponse:
+        # The form has already applied the valid fields to `self.object`, show the saved state instead
+        try:
+            tracking_obj = self.get_object()
+        except Http404:
+            tracking_obj = None
+
+        return self.render_tracking_widget(tracking_obj, status=400)
 
     def get_context_data(self: Self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -123,4 +163,27 @@ class TrackingDeleteView(LoginRequiredMixin, TrackingObjectMixin, DeleteView):
     def delete(self: Self, request: HttpRequest, *args: str, **kwargs: Any) -> HttpResponse:
         self.object = self.get_object()
         self.object.delete()
-        return render(self.request, "entities/entities_detail.html", {"object": self.entity})
+        return self.render_tracking_widget(None)
+
+
+class BulkTrackingView(LoginRequiredMixin, View):
+    """
+    Create or update many TrackingObjects of the user at once.
+
+    Expects a JSON body `{"operations": [{"entity_type": ..., "pk": ..., "status": ..., ...}, ...]}`
+    and returns the result of each operation, see `apply_tracking_operations`.
+    """
+
+    def post(self: Self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        try:
+            operations = json.loads(request.body)["operations"]
+        except (ValueError, TypeError, KeyError):
+            return JsonResponse({"error": "Expected a JSON object with a list of operations."}, status=400)
+
+        if not isinstance(operations, list):
+            return JsonResponse({"error": "Expected a JSON object with a list of operations."}, status=400)
+
+        if len(operations) > MAX_BULK_OPERATIONS:
+            return JsonResponse({"error": f"At most {MAX_BULK_OPERATIONS} operations are allowed."}, status=400)
+
+        return JsonResponse({"results": apply_tracking_operations(request.user, operations)})